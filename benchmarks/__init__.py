@@ -0,0 +1 @@
+"""Benchmarks for the DOBOTO client, run against local stub servers."""
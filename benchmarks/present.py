@@ -0,0 +1,91 @@
+"""
+Seconds Droplet.present spends matching names against a synthetic account, the old nested scan
+versus the name index, with the listing itself stubbed out.
+
+    python -m benchmarks.present [droplets] [names]
+"""
+
+import sys
+import copy
+import json
+import time
+
+from mock import MagicMock
+
+from doboto.DO import DO
+
+
+def account(droplets):
+    """A synthetic account of droplets"""
+
+    return [{"id": id, "name": "droplet-%s" % id, "status": "active"} for id in range(droplets)]
+
+
+def wanted(droplets, names):
+    """Names to make present, half already in the account, half not"""
+
+    return ["droplet-%s" % (droplets - 1 - index * 2) if index % 2 else "new-%s" % index
+            for index in range(names)]
+
+
+def scanned(droplets, attribs):
+    """What present used to do, every requested name scanned against every droplet"""
+
+    existing = []
+    create = copy.deepcopy(attribs)
+    create["names"] = []
+
+    for name in attribs["names"]:
+        exists = False
+        for droplet in droplets:
+            if name == droplet["name"]:
+                exists = True
+                existing.append(droplet)
+                break
+        if not exists:
+            create["names"].append(name)
+
+    return existing, create
+
+
+def indexed(droplets, attribs):
+    """Droplet.present as it is, against a stubbed listing and create"""
+
+    do = DO(token="bench")
+    do.droplet.list = MagicMock(return_value=droplets)
+    do.droplet.create = MagicMock(
+        side_effect=lambda create, *args: [{"name": name} for name in create["names"]]
+    )
+
+    return do.droplet.present(attribs)
+
+
+def seconds(method, droplets, attribs):
+    """Seconds a method takes"""
+
+    start = time.time()
+    method(droplets, attribs)
+    return time.time() - start
+
+
+def main(droplets=20000, names=1000):
+    """Run both and print the comparison"""
+
+    listed = account(droplets)
+    attribs = {"names": wanted(droplets, names), "region": "nyc3", "size": "512mb",
+               "image": "ubuntu-16-04-x64"}
+
+    before = seconds(scanned, listed, attribs)
+    after = seconds(indexed, listed, attribs)
+
+    print(json.dumps({
+        "droplets": droplets,
+        "names": names,
+        "before_sec": round(before, 4),
+        "after_sec": round(after, 4),
+        "speedup": round(before / after, 1)
+    }, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
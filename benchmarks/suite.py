@@ -0,0 +1,294 @@
+"""
+The client's hot paths timed against a local FakeServer, with how many calls each made, written
+out as JSON and compared against a stored baseline.
+
+    python -m benchmarks.suite [--sizes 10000 50000] [--output FILE] [--baseline FILE]
+                               [--save FILE] [--tolerance 1.25]
+
+Exits 1 if any benchmark took longer than tolerance times its baseline seconds, or made more calls
+than the baseline.  Benchmarks that wait make however many checks the timing calls for, so their
+calls get the same tolerance as seconds.
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+
+from doboto.DO import DO
+from doboto.Transport import Transport
+from doboto.Urllib3Transport import Urllib3Transport
+from doboto.FakeTransport import FakeTransport
+from doboto.FakeAPI import FakeAPI
+from doboto.FakeServer import FakeServer
+
+DROPLET = {"region": "nyc3", "size": "512mb", "image": "ubuntu-16-04-x64"}
+
+WAITED = ("bulk_create", "bulk_wait", "action_result", "actions_result")
+
+
+def populate(api, droplets, tag=None):
+    """Makes droplets straight through the fake, not counted as calls"""
+
+    for start in range(0, droplets, 10):
+
+        names = ["droplet-%s" % index for index in range(start, min(start + 10, droplets))]
+        attribs = dict(DROPLET, names=names, tags=[tag] if tag else [])
+
+        api.handle("POST", "http://fake/v2/droplets", data=json.dumps(attribs))
+
+    api.counts.clear()
+
+
+def calls(api):
+    """Calls made to the fake"""
+
+    return sum(api.counts.values())
+
+
+def timed(api, server, method, transport=None):
+    """Runs method with a DO pointed at the server, or over transport, for seconds and calls"""
+
+    if transport is None:
+        transport = Transport(rate_limiter=False, workers=8)
+
+    do = DO(token="bench", url=server.url if server else "http://fake/v2", transport=transport)
+
+    try:
+        start = time.time()
+        method(do)
+        seconds = time.time() - start
+    finally:
+        do.close()
+
+    return {"seconds": round(seconds, 4), "calls": calls(api)}
+
+
+def request(backend=Transport, count=1000):
+    """Endpoint.request: per call overhead of retrieving one thing over a backend"""
+
+    api = FakeAPI(limit=None)
+
+    def method(do):
+        for _ in range(count):
+            do.account.info()
+
+    if backend is FakeTransport:
+        result = timed(api, None, method, FakeTransport(api, rate_limiter=False))
+    else:
+        with FakeServer(api) as server:
+            result = timed(api, server, method, backend(rate_limiter=False))
+
+    result["per_call_ms"] = round(result["seconds"] * 1000 / count, 3)
+
+    return result
+
+
+def pages(droplets):
+    """Endpoint.pages: listing every droplet of a large account"""
+
+    api = FakeAPI(limit=None)
+    populate(api, droplets)
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            assert len(do.droplet.list()) == droplets
+
+        return timed(api, server, method)
+
+
+def bulk_create(droplets=100):
+    """Droplet.bulk_create with wait: making droplets in batches, waiting until all are active"""
+
+    api = FakeAPI(limit=None, action_seconds=0.5)
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            created = do.droplet.bulk_create(
+                dict(DROPLET, names=["droplet-%s" % index for index in range(droplets)]),
+                wait=True, poll=1
+            )
+            assert all(droplet["status"] == "active" for droplet in created)
+
+        return timed(api, server, method)
+
+
+def bulk_wait(droplets=200):
+    """Droplet.bulk with wait: an Action per droplet across a fleet, all handed to the waiter"""
+
+    api = FakeAPI(limit=None, action_seconds=0.5)
+    populate(api, droplets)
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            results = do.droplet.bulk(
+                "reboot", [droplet["id"] for droplet in api.droplets.values()], wait=True, poll=1
+            )
+            assert all(action["status"] == "completed" for action in results.values())
+
+        return timed(api, server, method)
+
+
+def action_result(droplets=20):
+    """action_result: an Action per droplet, each waited on by the call that sent it"""
+
+    api = FakeAPI(limit=None, action_seconds=0.5)
+    populate(api, droplets)
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            results = do.map(
+                lambda id: do.droplet.reboot(id, wait=True, poll=1), list(api.droplets)
+            )
+            assert all(action["status"] == "completed" for action in results)
+
+        return timed(api, server, method)
+
+
+def actions_result(droplets=200):
+    """actions_result: one call acting on a tagged fleet, the Actions waited on together"""
+
+    api = FakeAPI(limit=None, action_seconds=0.5)
+    populate(api, droplets, tag="fleet")
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            actions = do.droplet.power_cycle(tag_name="fleet", wait=True, poll=1)
+            assert all(action["status"] == "completed" for action in actions)
+
+        return timed(api, server, method)
+
+
+def present_names(droplets, names=20):
+    """Droplet.present with names: half already there, half made"""
+
+    api = FakeAPI(limit=None)
+    populate(api, droplets)
+
+    wanted = [
+        "droplet-%s" % (droplets - 1 - index) if index % 2 else "new-%s" % index
+        for index in range(names)
+    ]
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            droplets, created = do.droplet.present(dict(DROPLET, names=wanted))
+            assert len(droplets) == names and len(created) == names // 2
+
+        return timed(api, server, method)
+
+
+def present_name(droplets):
+    """Droplet.present with a name: finding the last droplet listed"""
+
+    api = FakeAPI(limit=None)
+    populate(api, droplets)
+
+    with FakeServer(api) as server:
+
+        def method(do):
+            droplet, created = do.droplet.present(
+                dict(DROPLET, name="droplet-%s" % (droplets - 1))
+            )
+            assert droplet is not None and created is None
+
+        return timed(api, server, method)
+
+
+def run(sizes):
+    """Every benchmark, by name"""
+
+    results = {
+        "request": request(),
+        "request_urllib3": request(Urllib3Transport),
+        "request_in_process": request(FakeTransport),
+        "bulk_create": bulk_create(),
+        "bulk_wait": bulk_wait(),
+        "action_result": action_result(),
+        "actions_result": actions_result()
+    }
+
+    for size in sizes:
+        results["pages_%s" % size] = pages(size)
+        results["present_names_%s" % size] = present_names(size)
+        results["present_name_%s" % size] = present_name(size)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Each benchmark against its baseline, and whether it regressed"""
+
+    comparison = {}
+
+    for name, result in sorted(results.items()):
+
+        if name not in baseline:
+            continue
+
+        before = baseline[name]
+
+        comparison[name] = {
+            "seconds_ratio": round(result["seconds"] / max(before["seconds"], 0.0001), 2),
+            "calls_delta": result["calls"] - before["calls"]
+        }
+
+        allowed = before["calls"] * tolerance if name in WAITED else before["calls"]
+
+        comparison[name]["regressed"] = result["calls"] > allowed or \
+            comparison[name]["seconds_ratio"] > tolerance
+
+    return comparison
+
+
+def main(argv=None):
+    """Run everything, print and write the results, compare them to a baseline"""
+
+    parser = argparse.ArgumentParser(description="Benchmark the client's hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000],
+                        help="Account sizes to list and match names against")
+    parser.add_argument("--output", help="File to write the results to")
+    parser.add_argument("--baseline", help="Results to compare against")
+    parser.add_argument("--save", help="File to write the results to as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Most times slower than the baseline before it counts as regressed")
+
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results
+    }
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            report["comparison"] = compare(results, json.load(baseline)["results"], args.tolerance)
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+
+    print(text)
+
+    for path in [args.output, args.save]:
+        if path:
+            with open(path, "w") as output:
+                output.write(text + "\n")
+
+    if any(compared["regressed"] for compared in report.get("comparison", {}).values()):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Calls per second through the old one-connection-per-call path versus the pooled Transport.
+
+    python -m benchmarks.transport [calls]
+"""
+
+import sys
+import json
+import time
+import threading
+
+import requests
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from doboto.DO import DO
+from doboto.Transport import Transport
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every GET with the same account, keeping connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = json.dumps({"account": {"droplet_limit": 25}}).encode("utf-8")
+
+    def do_GET(self):
+        """Send the canned account"""
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        """Keep quiet"""
+        pass
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """Threaded stub server"""
+
+    daemon_threads = True
+
+
+def unpooled(url, calls):
+    """What Endpoint.request used to do, a fresh connection per call"""
+
+    headers = {"Authorization": "Bearer bench", "User-Agent": "bench"}
+    for _ in range(calls):
+        requests.get("%s/account" % url, headers=headers, timeout=60).json()
+
+
+def pooled(url, calls):
+    """Calls through a DO and its shared Transport, unpaced to measure the transport alone"""
+
+    do = DO(token="bench", url=url, transport=Transport(rate_limiter=False))
+    for _ in range(calls):
+        do.account.info()
+
+
+def rate(method, url, calls):
+    """Calls per second for a method"""
+
+    start = time.time()
+    method(url, calls)
+    return calls / (time.time() - start)
+
+
+def main(calls=500):
+    """Run both and print the comparison"""
+
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    url = "http://127.0.0.1:%s" % server.server_address[1]
+
+    try:
+        before = rate(unpooled, url, calls)
+        after = rate(pooled, url, calls)
+    finally:
+        server.shutdown()
+
+    print(json.dumps({
+        "calls": calls,
+        "before_calls_per_sec": round(before, 1),
+        "after_calls_per_sec": round(after, 1),
+        "speedup": round(after / before, 2)
+    }, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -22,11 +22,11 @@ class Account(Endpoint):
               status of the account.
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for account interaction.
         """
-        super(Account, self).__init__(token, agent)
+        super(Account, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/account" % url
 
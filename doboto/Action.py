@@ -39,24 +39,38 @@ class Action(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#actions
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for action interaction.
         """
-        super(Action, self).__init__(token, agent)
+        super(Action, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/actions" % url
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Actions
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out: A list of Action data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-actions
         """  # nopep8
 
-        return self.pages(self.uri, "actions")
+        return self.pages(self.uri, "actions", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Actions, from a single small page rather than listing them
+
+        out: The number of Actions
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-actions
+        """  # nopep8
+
+        return self.total(self.uri, "actions")
 
     def info(self, id):
         """
@@ -72,3 +86,43 @@ class Action(Endpoint):
 
         uri = "%s/%s" % (self.uri, id)
         return self.request(uri, "action")
+
+    def info_list(self, ids, sweep=20):
+        """
+        description:
+            Retrieve many existing Actions at once.  With fewer ids than sweep, each is retrieved
+            by id, as many at once as the transport has workers.  Otherwise the list of Actions,
+            newest first, is read until it's past the oldest id, which is one request per 200
+            newer Actions instead of one per id.  Any not found that way are retrieved by id.
+
+        in:
+            - ids - list - The ids of the Actions requested
+            - sweep - number - How many ids it takes to read the list instead
+
+        out:
+            A list of Action data structures in the order of the ids, with the exception raised in
+            place of any Action that couldn't be retrieved
+        """
+
+        found = {}
+
+        if len(ids) >= sweep:
+
+            wanted = set(ids)
+            oldest = min(ids)
+
+            try:
+                for action in self.list(stream=True):
+                    if action["id"] in wanted:
+                        found[action["id"]] = action
+                        if len(found) == len(wanted):
+                            break
+                    elif action["id"] < oldest:
+                        break
+            except self.failures():
+                pass
+
+        missing = [id for id in ids if id not in found]
+        found.update(zip(missing, self.concurrently(self.info, missing)))
+
+        return [found[id] for id in ids]
@@ -0,0 +1,10 @@
+"""This holds the AsyncAccount class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Account import Account
+
+
+class AsyncAccount(AsyncEndpoint, Account):
+    """
+    Account endpoint for AsyncDO, every method returns an awaitable.
+    """
@@ -0,0 +1,48 @@
+"""This holds the AsyncAction class."""
+
+import asyncio
+from .AsyncEndpoint import AsyncEndpoint
+from .Action import Action
+
+
+class AsyncAction(AsyncEndpoint, Action):
+    """
+    Action endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def info_list(self, ids, sweep=20):
+        """
+        Async version of Action.info_list, retrieving any by id as many at once as the transport
+        has workers
+        """
+
+        found = {}
+
+        if len(ids) >= sweep:
+
+            wanted = set(ids)
+            oldest = min(ids)
+
+            try:
+                async for action in await self.list(stream=True):
+                    if action["id"] in wanted:
+                        found[action["id"]] = action
+                        if len(found) == len(wanted):
+                            break
+                    elif action["id"] < oldest:
+                        break
+            except self.failures():
+                pass
+
+        missing = [id for id in ids if id not in found]
+        semaphore = asyncio.Semaphore(max(self.transport.workers, 1))
+
+        async def info(id):
+            async with semaphore:
+                return await self.info(id)
+
+        found.update(zip(missing, await asyncio.gather(
+            *[info(id) for id in missing], return_exceptions=True
+        )))
+
+        return [found[id] for id in ids]
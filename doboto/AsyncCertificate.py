@@ -0,0 +1,23 @@
+"""This holds the AsyncCertificate class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Certificate import Certificate
+
+
+class AsyncCertificate(AsyncEndpoint, Certificate):
+    """
+    Certificate endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def present(self, name, private_key, leaf_certificate, certificate_chain):
+        """
+        Async version of Certificate.present
+        """
+
+        existing = await self.find_first(lambda item: item["name"] == name)
+
+        if existing is not None:
+            return (existing, None)
+
+        created = await self.create(name, private_key, leaf_certificate, certificate_chain)
+        return (created, created)
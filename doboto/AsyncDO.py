@@ -0,0 +1,58 @@
+"""This holds the AsyncDO class."""
+
+from .AsyncAccount import AsyncAccount
+from .AsyncAction import AsyncAction
+from .AsyncVolume import AsyncVolume
+from .AsyncCertificate import AsyncCertificate
+from .AsyncDomain import AsyncDomain
+from .AsyncDroplet import AsyncDroplet
+from .AsyncImage import AsyncImage
+from .AsyncLoadBalancer import AsyncLoadBalancer
+from .AsyncSnapshot import AsyncSnapshot
+from .AsyncRegion import AsyncRegion
+from .AsyncSize import AsyncSize
+from .AsyncFloatingIP import AsyncFloatingIP
+from .AsyncSSHKey import AsyncSSHKey
+from .AsyncTag import AsyncTag
+from .AsyncTransport import AsyncTransport
+
+
+class AsyncDO(object):
+    """
+    description:
+        Main class to instantiate from asyncio.  Same endpoints and methods as DO, but every
+        method returns an awaitable, including waits, so many calls can run on one event loop.
+
+    in:
+        token - string - Your DO API token. Create through your account UI on the main site
+        url - string - URL to use instead of the main.  Used for experimentation
+        agent - string - Agent to use instead of DOBOTO.  Used by the DOBOTO Ansible modules
+        transport - AsyncTransport - Shared HTTP transport to use.  Defaults to AsyncTransport()
+
+    related: https://developers.digitalocean.com/documentation/v2/#introduction
+    """
+
+    def __init__(
+        self, token, url="https://api.digitalocean.com/v2/", agent="DOBOTO", transport=None
+    ):
+        """Take URL and token, and create a sub instance for each endpoint."""
+        self.transport = transport if transport is not None else AsyncTransport()
+
+        self.account = AsyncAccount(self, token, url, agent, self.transport)
+        self.action = AsyncAction(self, token, url, agent, self.transport)
+        self.volume = AsyncVolume(self, token, url, agent, self.transport)
+        self.certificate = AsyncCertificate(self, token, url, agent, self.transport)
+        self.domain = AsyncDomain(self, token, url, agent, self.transport)
+        self.droplet = AsyncDroplet(self, token, url, agent, self.transport)
+        self.image = AsyncImage(self, token, url, agent, self.transport)
+        self.load_balancer = AsyncLoadBalancer(self, token, url, agent, self.transport)
+        self.snapshot = AsyncSnapshot(self, token, url, agent, self.transport)
+        self.region = AsyncRegion(self, token, url, agent, self.transport)
+        self.size = AsyncSize(self, token, url, agent, self.transport)
+        self.floating_ip = AsyncFloatingIP(self, token, url, agent, self.transport)
+        self.ssh_key = AsyncSSHKey(self, token, url, agent, self.transport)
+        self.tag = AsyncTag(self, token, url, agent, self.transport)
+
+    async def close(self):
+        """Close the transport's pooled connections."""
+        await self.transport.close()
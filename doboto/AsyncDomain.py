@@ -0,0 +1,23 @@
+"""This holds the AsyncDomain class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Domain import Domain
+
+
+class AsyncDomain(AsyncEndpoint, Domain):
+    """
+    Domain endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def present(self, name, ip_address):
+        """
+        Async version of Domain.present
+        """
+
+        existing = await self.find_first(lambda item: item["name"] == name)
+
+        if existing is not None:
+            return (existing, None)
+
+        created = await self.create(name, ip_address)
+        return (created, created)
@@ -0,0 +1,307 @@
+"""This holds the AsyncDroplet class."""
+
+import time
+import copy
+import asyncio
+from .AsyncEndpoint import AsyncEndpoint
+from .Droplet import Droplet
+from .Cache import Cache
+from .exception import DOBOTOException, DOBOTOPollingException
+
+
+class AsyncDroplet(AsyncEndpoint, Droplet):
+    """
+    Droplet endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def create(self, attribs, wait=False, poll=5, timeout=300):
+        """
+        Async version of Droplet.create
+        """
+
+        poll = self.waiting(poll)
+
+        if "name" in attribs:
+
+            droplet = await self.request(self.uri, "droplet", 'POST', attribs=attribs)
+
+            if not wait:
+                return droplet
+
+            start_time = time.time()
+            attempt = 0
+
+            while not self.ready(droplet, attribs):
+
+                await asyncio.sleep(poll.delay(attempt, "create_droplet"))
+                attempt += 1
+
+                try:
+                    with Cache.fresh():
+                        droplet = await self.info(droplet["id"])
+                except Exception as exception:
+                    if time.time() - start_time > timeout:
+                        raise DOBOTOPollingException(polling=droplet, error=exception)
+
+                if time.time() - start_time > timeout:
+                    raise DOBOTOPollingException(polling=droplet)
+
+            if attempt > 0:
+                poll.record("create_droplet", time.time() - start_time)
+
+            return droplet
+
+        elif "names" in attribs:
+
+            droplets = await self.request(self.uri, "droplets", 'POST', attribs=attribs)
+
+            if not wait:
+                return droplets
+
+            start_time = time.time()
+            attempt = 0
+
+            tag_name = attribs["tags"][0] if attribs.get("tags") else None
+
+            info = [index for index, droplet in enumerate(droplets)
+                    if not self.ready(droplet, attribs)]
+
+            sweep = await self.sweep(tag_name) if info else 1
+
+            while len(info) > 0:
+
+                await asyncio.sleep(poll.delay(attempt, "create_droplet"))
+                attempt += 1
+
+                with Cache.fresh():
+                    results = await self.info_list(
+                        [droplets[index]["id"] for index in info],
+                        tag_name=tag_name if len(info) >= sweep else None, sweep=sweep
+                    )
+
+                for index, result in zip(info, results):
+                    if isinstance(result, Exception):
+                        if time.time() - start_time > timeout:
+                            raise DOBOTOPollingException(polling=droplets, error=result)
+                    else:
+                        droplets[index] = result
+
+                if time.time() - start_time > timeout:
+                    raise DOBOTOPollingException(polling=droplets)
+
+                remaining = [index for index, droplet in enumerate(droplets)
+                             if not self.ready(droplet, attribs)]
+
+                for index in info:
+                    if index not in remaining:
+                        poll.record("create_droplet", time.time() - start_time)
+
+                info = remaining
+
+            return droplets
+
+        else:
+
+            raise ValueError("name or names must be specified")
+
+    async def sweep(self, tag_name=None):
+        """
+        Async version of Droplet.sweep
+        """
+
+        try:
+            return max(-(-await self.count(tag_name=tag_name) // 200), 1)
+        except self.failures():
+            return 20
+
+    async def bulk_create(
+        self, attribs, wait=False, poll=5, timeout=300, batch=10, workers=None
+    ):
+        """
+        Async version of Droplet.bulk_create, each batch waited on by its own create since
+        AsyncDO has no waiter
+        """
+
+        if "names" not in attribs:
+            raise ValueError("names must be specified")
+
+        batches = self.batches(attribs["names"], batch)
+        semaphore = asyncio.Semaphore(max(workers or self.transport.pool_size, 1))
+
+        async def create(names):
+            async with semaphore:
+                return await self.create(dict(attribs, names=names), wait, poll, timeout)
+
+        return self.batched(batches, await asyncio.gather(
+            *[create(names) for names in batches], return_exceptions=True
+        ))
+
+    async def bulk(self, method, ids, wait=False, poll=5, timeout=300, workers=None, **kwargs):
+        """
+        Async version of Droplet.bulk, each action waited on by its own call since AsyncDO has no
+        waiter
+        """
+
+        action = getattr(self, method)
+
+        if not isinstance(ids, dict):
+            ids = {id: {} for id in ids}
+
+        semaphore = asyncio.Semaphore(max(workers or self.transport.pool_size, 1))
+
+        async def send(id):
+            attribs = dict(kwargs)
+            attribs.update(ids[id])
+            async with semaphore:
+                return await action(id, wait=wait, poll=poll, timeout=timeout, **attribs)
+
+        ordered = list(ids)
+
+        return dict(zip(ordered, await asyncio.gather(
+            *[send(id) for id in ordered], return_exceptions=True
+        )))
+
+    async def healthy(self, ids, check, poll, timeout):
+        """
+        Async version of Droplet.healthy
+        """
+
+        start_time = time.time()
+        attempt = 0
+
+        while True:
+
+            with Cache.fresh():
+                droplets = await self.info_list(ids)
+
+            if all(not isinstance(droplet, Exception) and check(droplet) for droplet in droplets):
+                return True
+
+            if time.time() - start_time > timeout:
+                return False
+
+            await asyncio.sleep(poll.delay(attempt))
+            attempt += 1
+
+    async def rolling(
+        self, method, tag_name, window=1, load_balancer=None, healthy=None, halt=True,
+        poll=5, timeout=300, **kwargs
+    ):
+        """
+        Async version of Droplet.rolling
+        """
+
+        poll = self.waiting(poll)
+        check = healthy if healthy is not None else self.active
+
+        ids = [droplet["id"] for droplet in await self.list(tag_name=tag_name)]
+        windows = []
+
+        for index in range(0, len(ids), window):
+
+            start_time = time.time()
+            batch = ids[index:index + window]
+
+            if load_balancer is not None:
+                await self.do.load_balancer.droplet_remove(load_balancer, batch)
+
+            results = await self.bulk(
+                method, batch, wait=True, poll=poll, timeout=timeout, workers=window, **kwargs
+            )
+
+            done = [id for id in batch if self.completed(results[id])]
+            up = bool(done) and await self.healthy(done, check, poll, timeout)
+
+            if load_balancer is not None:
+
+                back = [id for id in batch if (up and id in done) or self.unsent(results[id])]
+
+                if back:
+                    await self.do.load_balancer.droplet_add(load_balancer, back)
+
+            windows.append({
+                "ids": batch,
+                "results": results,
+                "healthy": up,
+                "seconds": time.time() - start_time
+            })
+
+            if halt and (len(done) < len(batch) or not up):
+                break
+
+        return windows
+
+    async def info_list(self, ids, tag_name=None, sweep=20):
+        """
+        Async version of Droplet.info_list, retrieving any by id all at once
+        """
+
+        found = {}
+
+        if tag_name is not None or len(ids) >= sweep:
+
+            wanted = set(ids)
+
+            try:
+                async for droplet in await self.list(tag_name=tag_name, stream=True):
+                    if droplet["id"] in wanted:
+                        found[droplet["id"]] = droplet
+                        if len(found) == len(wanted):
+                            break
+            except self.failures():
+                pass
+
+        missing = [id for id in ids if id not in found]
+        found.update(zip(missing, await asyncio.gather(
+            *[self.info(id) for id in missing], return_exceptions=True
+        )))
+
+        return [found[id] for id in ids]
+
+    async def present(self, attribs, wait=False, poll=5, timeout=300):
+        """
+        Async version of Droplet.present
+        """
+
+        if "name" not in attribs and "names" not in attribs:
+            raise ValueError("name or names must be specified")
+
+        if "name" in attribs:
+
+            existing = await self.find_first(lambda item: item["name"] == attribs["name"])
+
+            if existing is not None:
+                return (existing, None)
+
+            created = await self.create(attribs, wait, poll, timeout)
+            return (created, created)
+
+        droplets = self.index(await self.list())
+
+        existing_lookup = {}
+        create = copy.deepcopy(attribs)
+        create["names"] = []
+
+        for name in attribs["names"]:
+            if name in droplets:
+                existing_lookup[name] = droplets[name]
+            else:
+                create["names"].append(name)
+
+        if not create["names"]:
+            return ([existing_lookup[name] for name in attribs["names"]], [])
+
+        created = await self.create(create, wait, poll, timeout)
+        created_lookup = {droplet["name"]: droplet for droplet in created}
+
+        merged = []
+
+        for name in attribs["names"]:
+            if name in existing_lookup:
+                merged.append(existing_lookup[name])
+            elif name in created_lookup:
+                merged.append(created_lookup[name])
+            else:
+                raise DOBOTOException("Requested droplet '%s' not found" % name, created)
+
+        return (merged, created)
@@ -0,0 +1,240 @@
+"""This holds the AsyncEndpoint class."""
+
+import time
+import json
+import asyncio
+import inspect
+from .Endpoint import Endpoint
+from .AsyncTransport import AsyncTransport
+from .Cache import Cache
+from .exception import DOBOTOException, DOBOTONotFoundException, DOBOTOPollingException
+
+
+class AsyncEndpoint(Endpoint):
+
+    """
+    Base class for interacting with an endpoint of the DO API from asyncio.  Mixed in ahead of an
+    endpoint class, its request, pages and action waits become coroutines, so every method that
+    just returns one of them can be awaited as is.
+    """
+
+    transport_class = AsyncTransport
+
+    async def request(self, request_url, expect=None, request_method='GET', attribs=None,
+                      params=None):
+        """ Single API Call """
+
+        headers = self.headers()
+
+        response = await self.transport.request(
+            request_method, request_url, params=params, data=json.dumps(attribs), headers=headers
+        )
+
+        if expect is None:
+
+            if response.status_code != 204:
+                raise DOBOTOException(result=response.json())
+
+        else:
+
+            result = response.json()
+
+            if "id" in result and result["id"] == "not_found":
+                raise DOBOTONotFoundException()
+
+            if expect not in result:
+                raise DOBOTOException(result=response.json())
+
+            return result[expect]
+
+    async def page(self, request_url, expect, params, headers):
+        """ Single page of a Paged API Call """
+
+        result = (await self.transport.request(
+            'GET', request_url, params=params, headers=headers
+        )).json()
+
+        if expect not in result:
+            raise DOBOTOException(result=result)
+
+        return result
+
+    async def iter_pages(self, request_url, expect, params=None):
+        """ Paged API Calls, yielding items one page at a time """
+
+        if params is None:
+            params = {}
+
+        headers = self.headers()
+        params["per_page"] = 200
+
+        next_url = request_url
+
+        while next_url:
+
+            result = await self.page(next_url, expect, params, headers)
+
+            for item in result[expect]:
+                yield item
+
+            next_url = self.next_page(result)
+            params = None
+
+    async def pages(self, request_url, expect, params=None, stream=False):
+        """
+        Paged API Calls, if the transport allows more than one worker, every page after the first
+        is fetched concurrently and reassembled in order.  If stream, returns iter_pages instead,
+        to be used with async for.
+        """
+
+        if stream:
+            return self.iter_pages(request_url, expect, params)
+
+        if params is None:
+            params = {}
+
+        headers = self.headers()
+        params["per_page"] = 200
+
+        result = await self.page(request_url, expect, params, headers)
+        items = list(result[expect])
+
+        remaining = self.remaining_pages(result) if self.transport.workers > 1 else []
+
+        if remaining:
+
+            semaphore = asyncio.Semaphore(self.transport.workers)
+
+            async def bounded(url):
+                async with semaphore:
+                    return await self.page(url, expect, None, headers)
+
+            for result in await asyncio.gather(*[bounded(url) for url in remaining]):
+                items.extend(result[expect])
+
+            return items
+
+        next_url = self.next_page(result)
+
+        while next_url:
+
+            result = await self.page(next_url, expect, None, headers)
+            items.extend(result[expect])
+            next_url = self.next_page(result)
+
+        return items
+
+    async def total(self, request_url, expect, params=None):
+        """ Async version of Endpoint.total """
+
+        params = dict(params) if params is not None else {}
+        params["per_page"] = 1
+
+        result = await self.page(request_url, expect, params, self.headers())
+
+        if "meta" in result and "total" in result["meta"]:
+            return result["meta"]["total"]
+
+        if self.next_page(result) is None:
+            return len(result[expect])
+
+        del params["per_page"]
+
+        return len(await self.pages(request_url, expect, params=params))
+
+    async def find_first(self, predicate, **kwargs):
+        """ Async version of Endpoint.find_first """
+
+        async for item in await self.list(stream=True, **kwargs):
+            if predicate(item):
+                return item
+
+        return None
+
+    async def exists(self, predicate, **kwargs):
+        """ Async version of Endpoint.exists """
+
+        return await self.find_first(predicate, **kwargs) is not None
+
+    async def action_result(self, action, wait, poll, timeout):
+        """
+        General action result processor for waiting, the action can still be awaiting
+        """
+
+        if inspect.isawaitable(action):
+            action = await action
+
+        if not wait:
+            return action
+
+        poll = self.waiting(poll)
+
+        start_time = time.time()
+        attempt = 0
+
+        while action["status"] == "in-progress":
+
+            await asyncio.sleep(poll.delay(attempt, action.get("type")))
+            attempt += 1
+
+            try:
+                with Cache.fresh():
+                    action = await self.do.action.info(action["id"])
+            except Exception as exception:
+                if time.time() - start_time > timeout:
+                    raise DOBOTOPollingException(polling=action, error=exception)
+
+            if time.time() - start_time > timeout:
+                raise DOBOTOPollingException(polling=action)
+
+        if action["status"] == "completed":
+            poll.record(action.get("type"), self.action_seconds(action))
+
+        return action
+
+    async def actions_result(self, actions, wait, poll, timeout):
+        """
+        General actions result processor for waiting, checking on every action still in progress
+        together each poll
+        """
+
+        if inspect.isawaitable(actions):
+            actions = await actions
+
+        if not wait:
+            return actions
+
+        poll = self.waiting(poll)
+
+        start_time = time.time()
+        attempt = 0
+
+        info = [index for index, action in enumerate(actions)
+                if action["status"] == "in-progress"]
+
+        while len(info) > 0:
+
+            await asyncio.sleep(
+                min(poll.delay(attempt, actions[index].get("type")) for index in info)
+            )
+            attempt += 1
+
+            with Cache.fresh():
+                results = await self.do.action.info_list([actions[index]["id"] for index in info])
+
+            for index, result in zip(info, results):
+                if isinstance(result, Exception):
+                    if time.time() - start_time > timeout:
+                        raise DOBOTOPollingException(polling=actions, error=result)
+                else:
+                    actions[index] = result
+                    if result["status"] == "completed":
+                        poll.record(result.get("type"), self.action_seconds(result))
+
+            if time.time() - start_time > timeout:
+                raise DOBOTOPollingException(polling=actions)
+
+            info = [index for index, action in enumerate(actions)
+                    if action["status"] == "in-progress"]
+
+        return actions
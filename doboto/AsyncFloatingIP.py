@@ -0,0 +1,10 @@
+"""This holds the AsyncFloatingIP class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .FloatingIP import FloatingIP
+
+
+class AsyncFloatingIP(AsyncEndpoint, FloatingIP):
+    """
+    Floating IP endpoint for AsyncDO, every method returns an awaitable.
+    """
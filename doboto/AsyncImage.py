@@ -0,0 +1,10 @@
+"""This holds the AsyncImage class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Image import Image
+
+
+class AsyncImage(AsyncEndpoint, Image):
+    """
+    Image endpoint for AsyncDO, every method returns an awaitable.
+    """
@@ -0,0 +1,64 @@
+"""This holds the AsyncLoadBalancer class."""
+
+import time
+import asyncio
+from .AsyncEndpoint import AsyncEndpoint
+from .LoadBalancer import LoadBalancer
+from .Cache import Cache
+from .exception import DOBOTOPollingException
+
+
+class AsyncLoadBalancer(AsyncEndpoint, LoadBalancer):
+    """
+    Load Balancer endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def create(self, attribs, wait=False, poll=5, timeout=300):
+        """
+        Async version of LoadBalancer.create
+        """
+
+        load_balancer = await self.request(self.uri, "load_balancer", 'POST', attribs=attribs)
+
+        if not wait:
+            return load_balancer
+
+        poll = self.waiting(poll)
+
+        start_time = time.time()
+        attempt = 0
+
+        while not load_balancer["ip"]:
+
+            await asyncio.sleep(poll.delay(attempt, "create_load_balancer"))
+            attempt += 1
+
+            try:
+                with Cache.fresh():
+                    load_balancer = await self.info(load_balancer["id"])
+            except Exception as exception:
+                if time.time() - start_time > timeout:
+                    raise DOBOTOPollingException(polling=load_balancer, error=exception)
+
+            if time.time() - start_time > timeout:
+                raise DOBOTOPollingException(polling=load_balancer)
+
+        poll.record("create_load_balancer", time.time() - start_time)
+
+        return load_balancer
+
+    async def present(self, attribs, wait=False, poll=5, timeout=300):
+        """
+        Async version of LoadBalancer.present
+        """
+
+        if "name" not in attribs:
+            raise ValueError("name must be specified")
+
+        existing = await self.find_first(lambda item: item["name"] == attribs["name"])
+
+        if existing is not None:
+            return (existing, None)
+
+        created = await self.create(attribs, wait, poll, timeout)
+        return (created, created)
@@ -0,0 +1,10 @@
+"""This holds the AsyncRegion class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Region import Region
+
+
+class AsyncRegion(AsyncEndpoint, Region):
+    """
+    Region endpoint for AsyncDO, every method returns an awaitable.
+    """
@@ -0,0 +1,23 @@
+"""This holds the AsyncSSHKey class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .SSHKey import SSHKey
+
+
+class AsyncSSHKey(AsyncEndpoint, SSHKey):
+    """
+    SSH Key endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def present(self, name, public_key):
+        """
+        Async version of SSHKey.present
+        """
+
+        existing = await self.find_first(lambda item: item["name"] == name)
+
+        if existing is not None:
+            return (existing, None)
+
+        created = await self.create(name, public_key)
+        return (created, created)
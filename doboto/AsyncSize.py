@@ -0,0 +1,10 @@
+"""This holds the AsyncSize class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Size import Size
+
+
+class AsyncSize(AsyncEndpoint, Size):
+    """
+    Size endpoint for AsyncDO, every method returns an awaitable.
+    """
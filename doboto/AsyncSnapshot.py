@@ -0,0 +1,10 @@
+"""This holds the AsyncSnapshot class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Snapshot import Snapshot
+
+
+class AsyncSnapshot(AsyncEndpoint, Snapshot):
+    """
+    Snapshot endpoint for AsyncDO, every method returns an awaitable.
+    """
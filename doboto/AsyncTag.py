@@ -0,0 +1,32 @@
+"""This holds the AsyncTag class."""
+
+from .AsyncEndpoint import AsyncEndpoint
+from .Tag import Tag
+
+
+class AsyncTag(AsyncEndpoint, Tag):
+    """
+    Tag endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def name_list(self):
+        """
+        Async version of Tag.name_list
+        """
+
+        tags = await self.pages(self.uri, "tags")
+
+        return [_['name'] for _ in tags]
+
+    async def present(self, name):
+        """
+        Async version of Tag.present
+        """
+
+        existing = await self.find_first(lambda item: item["name"] == name)
+
+        if existing is not None:
+            return (existing, None)
+
+        created = await self.create(name)
+        return (created, created)
@@ -0,0 +1,210 @@
+"""This holds the AsyncTransport class."""
+
+import asyncio
+import functools
+import contextvars
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .Transport import Transport, Response
+from .Retry import Retry
+from .RateLimiter import RateLimiter
+
+
+class AsyncTransport(object):
+    """
+    description:
+        Shared non-blocking HTTP transport used by every endpoint of an AsyncDO.  Uses a pooled
+        aiohttp session when aiohttp is installed.  Otherwise falls back to running a pooled
+        Transport in the event loop's executor, which keeps the loop free but costs a thread per
+        call in flight.  Either way, calls are paced by the rate limiter, 429s waited out and failed
+        calls retried as the retry policy allows.
+
+    in:
+        - pool_size - number - Max connections kept open
+        - connect_timeout - number - Seconds to wait to establish a connection
+        - read_timeout - number - Seconds to wait for a response once connected
+        - retries - number or Retry - Retry policy for failed calls, or just how many times to
+          retry with the default policy.  Defaults to Retry()
+        - workers - number - Max concurrent requests a single call can make, like fetching the
+          pages of a list.  1 does everything in sequence
+        - rate_limiter - RateLimiter - Paces calls to the API's budget.  Defaults to RateLimiter(),
+          False to not limit at all
+        - cache - Cache - Answers GETs of things that hardly ever change from memory.  None, the
+          default, to not cache
+        - coalesce - boolean - Whether identical GETs made at the same time share one call rather
+          than each making their own
+    """
+
+    errors = Transport.errors + (
+        (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp is not None else ()
+    )
+
+    def __init__(
+        self, pool_size=100, connect_timeout=10, read_timeout=60, retries=None, workers=1,
+        rate_limiter=None, cache=None, coalesce=True
+    ):
+        """Remember settings, the session is made on first use inside the running loop."""
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        if retries is None:
+            self.retries = Retry()
+        elif isinstance(retries, Retry):
+            self.retries = retries
+        else:
+            self.retries = Retry(attempts=retries + 1)
+
+        self.workers = workers
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.cache = cache
+        self.coalesce = coalesce
+
+        self.flights = {}
+        self.sent = 0
+        self.coalesced = 0
+
+        self.session = None
+        self.transport = None
+
+        if aiohttp is None:
+            self.transport = Transport(
+                pool_size, connect_timeout, read_timeout, self.retries,
+                rate_limiter=self.rate_limiter, cache=cache, coalesce=coalesce
+            )
+
+    def connect(self):
+        """ Pooled aiohttp session, made on first use """
+
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                )
+            )
+
+        return self.session
+
+    async def request(self, method, url, params=None, data=None, headers=None):
+        """
+        Single HTTP call without blocking the loop, answered from the cache if it can be, or
+        shared with an identical GET already in flight
+        """
+
+        if self.transport is not None:
+            return await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                contextvars.copy_context().run, self.transport.request, method, url,
+                params=params, data=data, headers=headers
+            ))
+
+        if self.cache is not None:
+
+            cached = self.cache.get(method, url, params=params, headers=headers)
+
+            if cached is not None:
+                return cached
+
+        key = Transport.flight(method, url, params, headers) if self.coalesce else None
+
+        if key is None:
+            return await self.call(method, url, params=params, data=data, headers=headers)
+
+        flight = self.flights.get(key)
+
+        if flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(flight)
+
+        flight = self.flights[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            flight.set_result(
+                await self.call(method, url, params=params, data=data, headers=headers)
+            )
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as exception:
+            flight.set_exception(exception)
+            flight.exception()
+            raise
+        finally:
+            del self.flights[key]
+
+        return flight.result()
+
+    async def call(self, method, url, params=None, data=None, headers=None):
+        """ HTTP call made over the wire with aiohttp, with pacing and retries """
+
+        if params is not None:
+            params = {
+                key: str(value) if isinstance(value, bool) else value
+                for key, value in params.items()
+            }
+
+        attempt = 0
+        waits = 0
+
+        while True:
+
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+
+            self.sent += 1
+
+            try:
+                async with self.connect().request(
+                    method, url, params=params, data=data, headers=headers
+                ) as response:
+                    response = Response(
+                        response.status, dict(response.headers), await response.text()
+                    )
+            except self.errors:
+                if not self.retries.retryable(method, attempt):
+                    raise
+                await asyncio.sleep(self.retries.delay(attempt))
+                attempt += 1
+                continue
+
+            if self.rate_limiter:
+
+                self.rate_limiter.update(response.headers)
+
+                if response.status_code == 429 and waits < self.rate_limiter.waits:
+                    self.rate_limiter.exhausted(response.headers)
+                    waits += 1
+                    continue
+
+            if not self.retries.retryable(method, attempt, response):
+
+                if self.cache is not None:
+                    self.cache.put(
+                        method, url, params=params, headers=headers, response=response, data=data
+                    )
+
+                return response
+
+            await asyncio.sleep(self.retries.delay(attempt, response))
+            attempt += 1
+
+    def stats(self):
+        """ How many calls went over the wire, and how many were saved by sharing one in flight """
+
+        if self.transport is not None:
+            return self.transport.stats()
+
+        return {"sent": self.sent, "coalesced": self.coalesced}
+
+    async def close(self):
+        """ Closes all pooled connections """
+
+        if self.session is not None:
+            await self.session.close()
+
+        if self.transport is not None:
+            self.transport.close()
@@ -0,0 +1,87 @@
+"""This holds the AsyncVolume class."""
+
+import time
+import asyncio
+from .AsyncEndpoint import AsyncEndpoint
+from .Volume import Volume
+from .Cache import Cache
+from .exception import DOBOTONotFoundException, DOBOTOPollingException
+
+
+class AsyncVolume(AsyncEndpoint, Volume):
+    """
+    Volume endpoint for AsyncDO, every method returns an awaitable.
+    """
+
+    async def create(self, attribs, wait=False, poll=5, timeout=300):
+        """
+        Async version of Volume.create
+        """
+
+        volume = await self.request(self.uri, "volume", 'POST', attribs=attribs)
+
+        if not wait:
+            return volume
+
+        poll = self.waiting(poll)
+
+        start_time = time.time()
+        attempt = 0
+
+        while True:
+
+            await asyncio.sleep(poll.delay(attempt, "create_volume"))
+            attempt += 1
+
+            try:
+                with Cache.fresh():
+                    volume = await self.info(volume["id"])
+                break
+            except DOBOTONotFoundException as exception:
+                pass
+            except Exception as exception:
+                if time.time() - start_time > timeout:
+                    raise DOBOTOPollingException(polling=volume, error=exception)
+
+            if time.time() - start_time > timeout:
+                raise DOBOTOPollingException(polling=volume)
+
+        poll.record("create_volume", time.time() - start_time)
+
+        return volume
+
+    async def present(self, attribs, wait=False, poll=5, timeout=300):
+        """
+        Async version of Volume.present
+        """
+
+        def named(item):
+            return item["name"] == attribs["name"]
+
+        if "region" in attribs:
+            existing = await self.find_first(
+                named, region=attribs["region"], name=attribs["name"]
+            )
+        else:
+            existing = await self.find_first(named)
+
+        if existing is not None:
+            return (existing, None)
+
+        created = await self.create(attribs, wait, poll, timeout)
+        return (created, created)
+
+    async def info(self, id=None, name=None, region=None):
+        """
+        Async version of Volume.info
+        """
+
+        if id is not None:
+            return await self.request("{}/{}".format(self.uri, id), "volume")
+        elif name is not None and region is not None:
+            volumes = await self.request(
+                self.uri, "volumes", params={"name": name, "region": region}
+            )
+            return volumes[0]
+        else:
+            raise ValueError("Must supply an id or name and region")
@@ -0,0 +1,29 @@
+"""This holds the BackoffWait class."""
+
+from .Wait import Wait
+
+
+class BackoffWait(Wait):
+    """
+    description:
+        Wait strategy that checks soon at first, then waits exponentially longer between checks,
+        so short actions return quickly and long ones don't use up requests.
+
+    in:
+        - initial - number - Seconds to sleep before the first check (min 1 sec)
+        - factor - number - How much the sleep grows with each check
+        - cap - number - Most seconds to sleep between checks
+    """
+
+    def __init__(self, initial=1, factor=2, cap=30):
+        """Keep the schedule."""
+        self.initial = max(1, initial)
+        self.factor = factor
+        self.cap = cap
+
+    def delay(self, attempt, kind=None):
+        """
+        Seconds to sleep before check number attempt (0 being the first)
+        """
+
+        return min(self.cap, self.initial * self.factor ** attempt)
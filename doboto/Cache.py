@@ -0,0 +1,765 @@
+"""This holds the Cache class."""
+
+import time
+import json
+import hashlib
+import threading
+import contextvars
+from contextlib import contextmanager
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qsl
+from .Transport import Response
+
+
+class Cache(object):
+    """
+    description:
+        Response cache for a Transport, so GETs of things that hardly ever change, like regions,
+        sizes, public images and the account, are answered from memory rather than the API.
+        Only GETs matching a rule are cached, each for the rule's TTL, and the least recently used
+        are evicted once there are too many.  Responses are kept per token, so DOs on different
+        accounts can share one.
+
+        Changes made through the Transport keep what's kept correct.  Creates are added to the
+        listings they belong in, destroys taken out, updates patched over, and tagging, untagging
+        and attaching or detaching volumes patched onto the items involved, all without fetching
+        anything again.  A change it doesn't know how to patch drops whatever it could've changed.
+
+        Waiting on something to change, like an Action finishing or a Droplet going active, reads
+        from the API within fresh(), so those reads are never answered from the cache.
+
+    in:
+        - ttls - dict - Seconds to keep responses, keyed by collection, like "regions" or
+          "droplets/*" for each Droplet, optionally narrowed by params, like
+          "images?type=distribution".  Defaults to Cache.CATALOG
+        - size - number - Most responses kept before the least recently used are evicted
+    """
+
+    CATALOG = {
+        "account": 300,
+        "regions": 3600,
+        "sizes": 3600,
+        "images?type=distribution": 3600,
+        "images?type=application": 3600
+    }
+
+    PAGING = ("page", "per_page")
+
+    TAGGABLE = {
+        "volume_snapshot": "snapshots"
+    }
+
+    FRESH = contextvars.ContextVar("doboto_cache_fresh", default=False)
+
+    def __init__(self, ttls=None, size=1000):
+        """Start empty and parse the rules."""
+        self.ttls = ttls if ttls is not None else self.CATALOG
+        self.size = size
+
+        self.rules = []
+
+        for rule, ttl in self.ttls.items():
+            path, _, query = rule.partition("?")
+            self.rules.append((path.strip("/"), dict(parse_qsl(query)), ttl))
+
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def request(url, params=None):
+        """ Path and params of a request, params from both the url and those passed """
+
+        parsed = urlparse(url)
+
+        merged = dict(parse_qsl(parsed.query))
+        merged.update({key: str(value) for key, value in (params or {}).items()})
+
+        return parsed.path.strip("/"), merged
+
+    @staticmethod
+    def matches(path, params, rule_path, rule_params):
+        """
+        Whether a request's path and params fall under a collection and its params, * in the
+        collection matching any one part of the path
+        """
+
+        rule = rule_path.split("/")
+        parts = path.split("/")
+
+        if len(parts) < len(rule):
+            return False
+
+        return all(part in ("*", actual) for part, actual in zip(rule, parts[-len(rule):])) and \
+            all(params.get(key) == value for key, value in rule_params.items())
+
+    def ttl(self, url, params=None):
+        """
+        Seconds a response to a GET of url with params is kept, None if it isn't cached.  The
+        most specific matching rule wins.
+        """
+
+        path, params = self.request(url, params)
+
+        matched = None
+
+        for rule_path, rule_params, ttl in self.rules:
+            if self.matches(path, params, rule_path, rule_params):
+                if matched is None or len(rule_params) > matched[0]:
+                    matched = (len(rule_params), ttl)
+
+        return matched[1] if matched is not None else None
+
+    @staticmethod
+    def key(url, params=None, headers=None):
+        """ What a response is kept under """
+
+        parsed = urlparse(url)
+
+        return (
+            parsed.scheme, parsed.netloc, parsed.path, parsed.query,
+            tuple(sorted((key, str(value)) for key, value in (params or {}).items())),
+            Cache.token(headers)
+        )
+
+    @staticmethod
+    def token(headers=None):
+        """ Hash of the Authorization header responses are kept under, never the token itself """
+
+        authorization = (headers or {}).get("Authorization")
+
+        if authorization is None:
+            return None
+
+        return hashlib.sha256(authorization.encode()).hexdigest()
+
+    def load(self, key):
+        """ Kept expiry and response for a key, now the most recently used, None if not kept """
+
+        entry = self.entries.get(key)
+
+        if entry is None:
+            return None
+
+        self.entries.move_to_end(key)
+
+        return entry[0], entry[1]
+
+    def store(self, key, expires, response, path, params):
+        """ Keeps a response, evicting the least recently used past size """
+
+        self.entries[key] = (expires, response, path, params)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def forget(self, key):
+        """ Drops the response kept for a key """
+
+        self.entries.pop(key, None)
+
+    def discard(self, match=None):
+        """ Drops every kept response whose path and params match, or all of them """
+
+        for key, entry in list(self.entries.items()):
+            if match is None or match(entry[2], entry[3]):
+                del self.entries[key]
+
+    def count(self):
+        """ How many responses are kept """
+
+        return len(self.entries)
+
+    def select(self, match):
+        """ Key, expiry, response, path and params of every kept response whose path matches """
+
+        return [
+            (key,) + entry for key, entry in self.entries.items() if match(entry[2], entry[3])
+        ]
+
+    @staticmethod
+    @contextmanager
+    def fresh():
+        """
+        description:
+            Within it, GETs made by this thread or task, and any threads or tasks it starts, go
+            to the API rather than being answered from a cache, what the reads of anything
+            waiting use.  What comes back is still kept.
+        """
+
+        token = Cache.FRESH.set(True)
+
+        try:
+            yield
+        finally:
+            Cache.FRESH.reset(token)
+
+    def get(self, method, url, params=None, headers=None):
+        """
+        The kept response for a call, None if there isn't one or within fresh().  Only calls
+        that could be answered count as hits or misses.
+        """
+
+        if method.upper() != "GET" or self.FRESH.get() or self.ttl(url, params) is None:
+            return None
+
+        key = self.key(url, params, headers)
+
+        with self.lock:
+
+            entry = self.load(key)
+
+            if entry is not None and entry[0] > time.time():
+                self.hits += 1
+                return entry[1]
+
+            if entry is not None:
+                self.forget(key)
+
+            self.misses += 1
+
+        return None
+
+    def put(self, method, url, params=None, headers=None, response=None, data=None):
+        """
+        Keeps a successful response to a GET that's cached.  A successful call that changes
+        anything patches what's kept to match, or if it can't, drops what it could've changed.
+        """
+
+        if response is None:
+            return
+
+        if method.upper() != "GET":
+            if response.status_code < 400 and \
+               not self.write(method, url, params, headers, data, response):
+                self.mutated(url)
+            return
+
+        if response.status_code != 200:
+            return
+
+        ttl = self.ttl(url, params)
+
+        if ttl is None:
+            return
+
+        key = self.key(url, params, headers)
+        path, merged = self.request(url, params)
+
+        with self.lock:
+            self.store(key, time.time() + ttl, response, path, merged)
+
+    @staticmethod
+    def body(response):
+        """ Parsed JSON body of a response, None if it hasn't one """
+
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def listed(body):
+        """ Key of the items in a page of a listing, None if it isn't one """
+
+        if not isinstance(body, dict):
+            return None
+
+        for key, value in body.items():
+            if key not in ("links", "meta") and isinstance(value, list):
+                return key
+
+        return None
+
+    @staticmethod
+    def single(body):
+        """ Key of the item in a response about one item, None if it isn't one """
+
+        if not isinstance(body, dict):
+            return None
+
+        for key, value in body.items():
+            if key not in ("links", "meta") and isinstance(value, dict):
+                return key
+
+        return None
+
+    @classmethod
+    def created(cls, body):
+        """ Items a create or update responded with, None if it didn't respond with any """
+
+        key = cls.single(body)
+
+        if key is not None:
+            return [body[key]]
+
+        key = cls.listed(body)
+
+        if key is not None and all(isinstance(item, dict) for item in body[key]):
+            return body[key]
+
+        return None
+
+    @staticmethod
+    def identifies(item, ident):
+        """ Whether an item is the one named in a path, by id, fingerprint, or name or ip """
+
+        if not isinstance(item, dict):
+            return False
+
+        if "id" in item:
+            return str(item["id"]) == ident or item.get("fingerprint") == ident
+
+        return ident in (item.get("name"), item.get("ip"))
+
+    def filters(self, params):
+        """ Params of a listing other than paging """
+
+        return {key: value for key, value in params.items() if key not in self.PAGING}
+
+    def listings(self, entries):
+        """ Kept pages grouped by the listing they're of """
+
+        listings = {}
+
+        for entry in entries:
+            listing = (entry[3], tuple(sorted(self.filters(entry[4]).items())),
+                       entry[4].get("per_page"))
+            listings.setdefault(listing, []).append(entry)
+
+        return listings
+
+    def own(self, entries, token):
+        """ Entries kept for a token, dropping those for others, which can't be patched as sure """
+
+        own = []
+
+        for entry in entries:
+            if entry[0][5] == token:
+                own.append(entry)
+            else:
+                self.forget(entry[0])
+
+        return own
+
+    @contextmanager
+    def exclusive(self):
+        """ Holds off every other change to what's kept while write reads and patches it """
+
+        with self.lock:
+            yield
+
+    def save(self, entry, body):
+        """ Keeps a patched body in place of what an entry had """
+
+        key, expires, response, path, params = entry
+
+        self.store(
+            key, expires,
+            Response(response.status_code, dict(response.headers), json.dumps(body)),
+            path, params
+        )
+
+    def totals(self, pages, bodies, change):
+        """ Changes the total every page of a listing has by change """
+
+        for entry, body in zip(pages, bodies):
+            if isinstance(body.get("meta"), dict) and "total" in body["meta"]:
+                body["meta"]["total"] += change
+            self.save(entry, body)
+
+    def append(self, pages, items):
+        """
+        Adds items to the end of a listing, dropping the listing if its last page isn't kept
+        """
+
+        bodies = [self.body(entry[2]) for entry in pages]
+
+        last = [
+            index for index, body in enumerate(bodies)
+            if self.listed(body) is not None and
+            not (body.get("links") or {}).get("pages", {}).get("next")
+        ]
+
+        if not last:
+            for entry in pages:
+                self.forget(entry[0])
+            return
+
+        if not items:
+            return
+
+        listed = bodies[last[0]][self.listed(bodies[last[0]])]
+        listed.extend(items)
+
+        self.totals(pages, bodies, len(items))
+
+    def take(self, pages, match):
+        """ Takes items out of a listing, dropping it if it's not one that can be patched """
+
+        bodies = [self.body(entry[2]) for entry in pages]
+
+        if any(self.listed(body) is None for body in bodies):
+            for entry in pages:
+                self.forget(entry[0])
+            return
+
+        removed = 0
+
+        for body in bodies:
+            key = self.listed(body)
+            kept = [item for item in body[key] if not match(item)]
+            removed += len(body[key]) - len(kept)
+            body[key] = kept
+
+        if removed:
+            self.totals(pages, bodies, -removed)
+
+    def insert(self, collection, items, token):
+        """ Adds what was created to the listings it belongs in """
+
+        if items is None:
+            return False
+
+        entries = self.own(self.select(lambda path, params: path == collection), token)
+
+        for (path, filters, per_page), pages in self.listings(entries).items():
+
+            filters = dict(filters)
+
+            if set(filters) - set(["tag_name"]):
+                for entry in pages:
+                    self.forget(entry[0])
+                continue
+
+            self.append(pages, [
+                item for item in items
+                if "tag_name" not in filters or filters["tag_name"] in (item.get("tags") or [])
+            ])
+
+        return True
+
+    def replace(self, collection, ident, items, token):
+        """ Patches what was updated over what's kept of it """
+
+        if items is None or len(items) != 1:
+            return False
+
+        item = items[0]
+        detail = "%s/%s" % (collection, ident)
+
+        entries = self.own(
+            self.select(lambda path, params: path in (collection, detail)), token
+        )
+
+        for entry in entries:
+
+            body = self.body(entry[2])
+
+            if entry[3] == detail:
+                key = self.single(body)
+                if key is not None:
+                    body[key] = item
+                    self.save(entry, body)
+                else:
+                    self.forget(entry[0])
+                continue
+
+            key = self.listed(body)
+
+            if key is not None:
+                body[key] = [item if self.identifies(kept, ident) else kept for kept in body[key]]
+                self.save(entry, body)
+            else:
+                self.forget(entry[0])
+
+        return True
+
+    def remove(self, collection, ident, token):
+        """ Takes what was destroyed out of the listings it was in, and drops what's under it """
+
+        detail = "%s/%s" % (collection, ident)
+
+        entries = self.own(self.select(
+            lambda path, params: path in (collection, detail) or path.startswith(detail + "/")
+        ), token)
+
+        for entry in entries:
+            if entry[3] != collection:
+                self.forget(entry[0])
+
+        listings = self.listings([entry for entry in entries if entry[3] == collection])
+
+        for pages in listings.values():
+            self.take(pages, lambda item: self.identifies(item, ident))
+
+        return True
+
+    def tagged(self, root, tag, sent, attach, token):
+        """ Patches a tag onto or off of the resources it was attached to or detached from """
+
+        resources = (sent or {}).get("resources")
+
+        if not resources:
+            return False
+
+        ids = {}
+
+        for resource in resources:
+            collection = "%s/%s" % (root, self.TAGGABLE.get(
+                resource.get("resource_type"), "%ss" % resource.get("resource_type")
+            ))
+            ids.setdefault(collection, set()).add(str(resource.get("resource_id")))
+
+        tags = "%s/tags" % root
+
+        for entry in self.select(
+            lambda path, params: path == tags or path.startswith(tags + "/")
+        ):
+            self.forget(entry[0])
+
+        def patch(item):
+            if isinstance(item, dict) and str(item.get("id")) in wanted:
+                item["tags"] = [name for name in (item.get("tags") or []) if name != tag]
+                if attach:
+                    item["tags"].append(tag)
+                known[str(item["id"])] = item
+
+        for collection, wanted in ids.items():
+
+            known = {}
+
+            entries = self.own(self.select(
+                lambda path, params: path == collection or
+                (path.startswith(collection + "/") and path.split("/")[-1] in wanted)
+            ), token)
+
+            for entry in entries:
+
+                body = self.body(entry[2])
+                key = self.listed(body) if entry[3] == collection else self.single(body)
+
+                if key is None:
+                    self.forget(entry[0])
+                    continue
+
+                for item in (body[key] if entry[3] == collection else [body[key]]):
+                    patch(item)
+
+                self.save(entry, body)
+
+            listings = self.listings([entry for entry in entries if entry[3] == collection])
+
+            for (path, filters, per_page), pages in listings.items():
+
+                if dict(filters).get("tag_name") != tag:
+                    continue
+
+                # Patched above, so what's kept now
+
+                kept = [entry[4] for entry in pages]
+                pages = self.select(lambda path, params: path == collection and params in kept)
+
+                if not attach:
+                    self.take(pages, lambda item: str(item.get("id")) in wanted)
+                    continue
+
+                listed = set()
+
+                for entry in pages:
+                    body = self.body(entry[2])
+                    listed.update(str(item.get("id")) for item in body[self.listed(body)])
+
+                if any(id not in known for id in wanted - listed):
+                    for entry in pages:
+                        self.forget(entry[0])
+                    continue
+
+                self.append(pages, [known[id] for id in sorted(wanted - listed)])
+
+        return True
+
+    def attached(self, root, ident, sent, token):
+        """ Patches a volume attached to or detached from a droplet onto both """
+
+        if not sent or sent.get("type") not in ("attach", "detach") or \
+           sent.get("droplet_id") is None:
+            return False
+
+        attach = sent["type"] == "attach"
+        droplet_id = sent["droplet_id"]
+
+        volumes = "%s/volumes" % root
+        droplets = "%s/droplets" % root
+
+        def volume(item):
+            if ident is not None:
+                return str(item.get("id")) == ident
+            return item.get("name") == sent.get("volume_name") and (
+                sent.get("region") is None or
+                (item.get("region") or {}).get("slug") == sent.get("region")
+            )
+
+        entries = self.own(self.select(
+            lambda path, params: path in (volumes, droplets) or
+            path.startswith(volumes + "/") or path == "%s/%s" % (droplets, droplet_id)
+        ), token)
+
+        volume_id = ident
+
+        for entry in entries:
+
+            if entry[3] != volumes and not entry[3].startswith(volumes + "/"):
+                continue
+
+            body = self.body(entry[2])
+            key = self.listed(body) if entry[3] == volumes else self.single(body)
+
+            if key is None:
+                if entry[3] == "%s/%s" % (volumes, ident) or ident is None:
+                    self.forget(entry[0])
+                continue
+
+            for item in (body[key] if entry[3] == volumes else [body[key]]):
+                if isinstance(item, dict) and volume(item):
+                    volume_id = str(item["id"])
+                    item["droplet_ids"] = [
+                        id for id in (item.get("droplet_ids") or []) if id != droplet_id
+                    ]
+                    if attach:
+                        item["droplet_ids"].append(droplet_id)
+
+            self.save(entry, body)
+
+        for entry in entries:
+
+            if entry[3] != droplets and entry[3] != "%s/%s" % (droplets, droplet_id):
+                continue
+
+            if volume_id is None:
+                self.forget(entry[0])
+                continue
+
+            body = self.body(entry[2])
+            key = self.listed(body) if entry[3] == droplets else self.single(body)
+
+            if key is None:
+                self.forget(entry[0])
+                continue
+
+            for item in (body[key] if entry[3] == droplets else [body[key]]):
+                if isinstance(item, dict) and str(item.get("id")) == str(droplet_id):
+                    item["volume_ids"] = [
+                        id for id in (item.get("volume_ids") or []) if id != volume_id
+                    ]
+                    if attach:
+                        item["volume_ids"].append(volume_id)
+
+            self.save(entry, body)
+
+        return True
+
+    def write(self, method, url, params, headers, data, response):
+        """
+        Patches what's kept for a successful change, returns whether it knew how
+        """
+
+        path, merged = self.request(url, params)
+        segments = path.split("/")
+        token = self.token(headers)
+        method = method.upper()
+
+        try:
+            sent = json.loads(data) if data else None
+        except (TypeError, ValueError):
+            sent = None
+
+        with self.exclusive():
+
+            if len(segments) > 3 and segments[-3] == "tags" and segments[-1] == "resources" and \
+               method in ("POST", "DELETE"):
+                return self.tagged(
+                    "/".join(segments[:-3]), segments[-2], sent, method == "POST", token
+                )
+
+            if segments[-1] == "actions":
+
+                if method == "POST" and len(segments) > 3 and segments[-3] == "volumes":
+                    return self.attached("/".join(segments[:-3]), segments[-2], sent, token)
+
+                if method == "POST" and len(segments) > 2 and segments[-2] == "volumes":
+                    return self.attached("/".join(segments[:-2]), None, sent, token)
+
+                return False
+
+            if merged or len(segments) < 2:
+                return False
+
+            if method == "POST":
+                return self.insert(path, self.created(self.body(response)), token)
+
+            if method in ("PUT", "PATCH"):
+                return self.replace(
+                    "/".join(segments[:-1]), segments[-1], self.created(self.body(response)),
+                    token
+                )
+
+            if method == "DELETE":
+                return self.remove("/".join(segments[:-1]), segments[-1], token)
+
+        return False
+
+    def mutated(self, url):
+        """
+        Drops what's kept for anything a call to url could have changed, the collection it's in
+        and everything in it, like droplets and droplets/1234 for droplets/1234/actions.  Actions
+        on a whole collection, like droplets/actions?tag_name=web, could've changed any of it.
+        """
+
+        segments = self.request(url)[0].split("/")
+
+        if len(segments) > 1 and segments[-1] == "actions":
+            segments = segments[:-1]
+
+        def related(path, params):
+            kept = path.split("/")
+            shared = min(len(kept), len(segments))
+            return kept[:shared] == segments[:shared]
+
+        with self.lock:
+            self.discard(related)
+
+    def invalidate(self, collection=None):
+        """
+        Drops every kept response, or just those for a collection, like "regions" or
+        "images?type=distribution"
+        """
+
+        if collection is None:
+            with self.lock:
+                self.discard()
+            return
+
+        path, _, query = collection.partition("?")
+        path = path.strip("/")
+        rule_params = dict(parse_qsl(query))
+
+        with self.lock:
+            self.discard(lambda kept, params: self.matches(kept, params, path, rule_params))
+
+    def stats(self):
+        """
+        Hits, misses and how many responses are kept
+        """
+
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self.count()}
+
+    def close(self):
+        """
+        Releases anything held open, nothing for a cache in memory
+        """
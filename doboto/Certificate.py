@@ -27,25 +27,39 @@ class Certificate(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#certificates
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for certificate interaction.
         """
-        super(Certificate, self).__init__(token, agent)
+        super(Certificate, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/certificates" % url
         self.reports = "%s/reports" % url
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Certificates
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out: A list of Certificate data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-certificates
         """  # nopep8
 
-        return self.pages(self.uri, "certificates")
+        return self.pages(self.uri, "certificates", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Certificates, from a single small page rather than listing them
+
+        out: The number of Certificates
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-certificates
+        """  # nopep8
+
+        return self.total(self.uri, "certificates")
 
     def create(self, name, private_key, leaf_certificate, certificate_chain):
         """
@@ -89,13 +103,7 @@ class Certificate(Endpoint):
 
         """  # nopep8
 
-        certificates = self.list()
-
-        existing = None
-        for certificate in certificates:
-            if name == certificate["name"]:
-                existing = certificate
-                break
+        existing = self.find_first(lambda item: item["name"] == name)
 
         if existing is not None:
             return (existing, None)
@@ -14,34 +14,66 @@ from .Size import Size
 from .FloatingIP import FloatingIP
 from .SSHKey import SSHKey
 from .Tag import Tag
+from .Transport import Transport
+from .Waiter import Waiter
 
 
 class DO(object):
     """
     description:
-        Main class to instantiate.
+        Main class to instantiate.  One instance can be shared by any number of threads.
 
     in:
         token - string - Your DO API token. Create through your account UI on the main site
         url - string - URL to use instead of the main.  Used for experimentation
         agent - string - Agent to use instead of DOBOTO.  Used by the DOBOTO Ansible modules
+        transport - Transport - Shared HTTP transport to use.  Defaults to a pooled Transport()
 
     related: https://developers.digitalocean.com/documentation/v2/#introduction
     """
 
-    def __init__(self, token, url="https://api.digitalocean.com/v2/", agent="DOBOTO"):
+    def __init__(
+        self, token, url="https://api.digitalocean.com/v2/", agent="DOBOTO", transport=None
+    ):
         """Take URL and token, and create a sub instance for each endpoint."""
-        self.account = Account(self, token, url, agent)
-        self.action = Action(self, token, url, agent)
-        self.volume = Volume(self, token, url, agent)
-        self.certificate = Certificate(self, token, url, agent)
-        self.domain = Domain(self, token, url, agent)
-        self.droplet = Droplet(self, token, url, agent)
-        self.image = Image(self, token, url, agent)
-        self.load_balancer = LoadBalancer(self, token, url, agent)
-        self.snapshot = Snapshot(self, token, url, agent)
-        self.region = Region(self, token, url, agent)
-        self.size = Size(self, token, url, agent)
-        self.floating_ip = FloatingIP(self, token, url, agent)
-        self.ssh_key = SSHKey(self, token, url, agent)
-        self.tag = Tag(self, token, url, agent)
+        self.transport = transport if transport is not None else Transport()
+
+        self.account = Account(self, token, url, agent, self.transport)
+        self.action = Action(self, token, url, agent, self.transport)
+        self.volume = Volume(self, token, url, agent, self.transport)
+        self.certificate = Certificate(self, token, url, agent, self.transport)
+        self.domain = Domain(self, token, url, agent, self.transport)
+        self.droplet = Droplet(self, token, url, agent, self.transport)
+        self.image = Image(self, token, url, agent, self.transport)
+        self.load_balancer = LoadBalancer(self, token, url, agent, self.transport)
+        self.snapshot = Snapshot(self, token, url, agent, self.transport)
+        self.region = Region(self, token, url, agent, self.transport)
+        self.size = Size(self, token, url, agent, self.transport)
+        self.floating_ip = FloatingIP(self, token, url, agent, self.transport)
+        self.ssh_key = SSHKey(self, token, url, agent, self.transport)
+        self.tag = Tag(self, token, url, agent, self.transport)
+
+        self.waiter = Waiter(self)
+
+    def map(self, fn, items, workers=None):
+        """
+        description: Calls fn with each item from many threads at once, all sharing this DO
+
+        in:
+            - fn - function - What to call with each item, like lambda id: do.droplet.info(id)
+            - items - list - What to call it with
+            - workers - number - Most calls at once.  Defaults to the transport's pool_size
+
+        out: A list of what fn returned for each item, in order, with any exception raised in place
+             of its result
+        """
+
+        if workers is None:
+            workers = self.transport.pool_size
+
+        return self.action.concurrently(fn, list(items), workers=workers)
+
+    def close(self):
+        """Stop the waiter and close the transport's pooled connections."""
+        self.waiter.close()
+        self.transport.close()
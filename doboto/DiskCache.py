@@ -0,0 +1,206 @@
+"""This holds the DiskCache class."""
+
+import os
+import json
+import time
+import sqlite3
+from contextlib import contextmanager
+from .Cache import Cache
+from .Transport import Response
+
+
+class DiskCache(Cache):
+    """
+    description:
+        Response cache kept in a SQLite file instead of memory, so every process using the same
+        file, like forked Ansible workers, shares what's been fetched.  The first process to list
+        a collection saves the rest a trip until the TTL runs out, and a change made through any
+        of them drops what's kept for all of them.  Same rules, eviction and invalidation as
+        Cache, except hits and misses are counted per process, and a hit only notes it was used
+        once a quarter of what was left of its TTL has gone by since it last did, so most hits
+        are read without taking the file's write lock.  Changes are patched in while
+        holding the file's write lock, so processes changing things at once don't lose each
+        other's patches.
+
+    in:
+        - path - string - File to keep responses in, made readable only by its owner if it
+          doesn't exist.  Tokens are kept only as hashes
+        - ttls - dict - Seconds to keep responses, keyed by collection, like "droplets", optionally
+          narrowed by params, like "images?type=distribution".  Defaults to Cache.CATALOG
+        - size - number - Most responses kept before the least recently used are evicted
+        - timeout - number - Seconds to wait on another process writing before giving up
+    """
+
+    TOUCH = 0.25
+
+    def __init__(self, path, ttls=None, size=10000, timeout=30):
+        """Parse the rules, the file's opened on first use in each process."""
+        super(DiskCache, self).__init__(ttls, size)
+
+        self.path = path
+        self.timeout = timeout
+
+        self.connection = None
+        self.pid = None
+        self.writing = False
+
+    def connect(self):
+        """ Connection to the file for this process, made and set up on first use """
+
+        if self.connection is None or self.pid != os.getpid():
+
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+
+            self.connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            self.pid = os.getpid()
+
+            with self.connection:
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, path TEXT, params TEXT, expires REAL, used REAL, "
+                    "status INTEGER, headers TEXT, body TEXT)"
+                )
+                self.connection.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_used ON responses (used)"
+                )
+
+        return self.connection
+
+    @contextmanager
+    def transaction(self):
+        """ Connection to run statements on, committed together unless within exclusive """
+
+        connection = self.connect()
+
+        if self.writing:
+            yield connection
+            return
+
+        with connection:
+            yield connection
+
+    @contextmanager
+    def exclusive(self):
+        """
+        Takes the file's write lock before write reads what's kept, holding it until the patches
+        are committed, so no other process changes anything in between
+        """
+
+        with self.lock:
+            with self.transaction() as connection:
+
+                connection.execute("BEGIN IMMEDIATE")
+                self.writing = True
+
+                try:
+                    yield
+                finally:
+                    self.writing = False
+
+    @staticmethod
+    def column(key):
+        """ Key as it's stored """
+
+        return json.dumps(key)
+
+    def load(self, key):
+        """
+        Kept expiry and response for a key, None if not kept.  Noted as used only once TOUCH of
+        what was left of its TTL when last noted has gone by, so most hits don't write
+        """
+
+        with self.transaction() as connection:
+
+            row = connection.execute(
+                "SELECT expires, used, status, headers, body FROM responses WHERE key = ?",
+                (self.column(key),)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            now = time.time()
+
+            if now - row[1] > (row[0] - row[1]) * self.TOUCH:
+                connection.execute(
+                    "UPDATE responses SET used = ? WHERE key = ?", (now, self.column(key))
+                )
+
+        return row[0], Response(row[2], json.loads(row[3]), row[4])
+
+    def store(self, key, expires, response, path, params):
+        """ Keeps a response, evicting the least recently used past size """
+
+        with self.transaction() as connection:
+
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, path, params, expires, used, status, headers, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.column(key), path, json.dumps(params), expires, time.time(),
+                    response.status_code, json.dumps(dict(response.headers)), response.text
+                )
+            )
+
+            connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.size,)
+            )
+
+    def forget(self, key):
+        """ Drops the response kept for a key """
+
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM responses WHERE key = ?", (self.column(key),))
+
+    def discard(self, match=None):
+        """ Drops every kept response whose path and params match, or all of them """
+
+        with self.transaction() as connection:
+
+            if match is None:
+                connection.execute("DELETE FROM responses")
+                return
+
+            keys = [
+                (key,) for key, path, params
+                in connection.execute("SELECT key, path, params FROM responses")
+                if match(path, json.loads(params))
+            ]
+
+            connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def select(self, match):
+        """ Key, expiry, response, path and params of every kept response whose path matches """
+
+        return [
+            (
+                json.loads(key), expires, Response(status, json.loads(headers), body), path,
+                json.loads(params)
+            )
+            for key, path, params, expires, status, headers, body in self.connect().execute(
+                "SELECT key, path, params, expires, status, headers, body FROM responses"
+            )
+            if match(path, json.loads(params))
+        ]
+
+    def count(self):
+        """ How many responses are kept """
+
+        return self.connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        """ Closes this process's connection to the file """
+
+        with self.lock:
+
+            if self.connection is not None and self.pid == os.getpid():
+                self.connection.close()
+
+            self.connection = None
+            self.pid = None
@@ -36,23 +36,37 @@ class Domain(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#domains
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for domain interaction.
         """
-        super(Domain, self).__init__(token, agent)
+        super(Domain, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "{}/domains".format(url)
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Domains
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out: A list of Domain data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-domains
         """  # nopep8
-        return self.pages(self.uri, "domains")
+        return self.pages(self.uri, "domains", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Domains, from a single small page rather than listing them
+
+        out: The number of Domains
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-domains
+        """  # nopep8
+
+        return self.total(self.uri, "domains")
 
     def create(self, name, ip_address):
         """
@@ -92,13 +106,7 @@ class Domain(Endpoint):
         related: https://developers.digitalocean.com/documentation/v2/#create-a-new-domain
         """  # nopep8
 
-        domains = self.list()
-
-        existing = None
-        for domain in domains:
-            if name == domain["name"]:
-                existing = domain
-                break
+        existing = self.find_first(lambda item: item["name"] == name)
 
         if existing is not None:
             return (existing, None)
@@ -135,19 +143,35 @@ class Domain(Endpoint):
         uri = "{}/{}".format(self.uri, name)
         return self.request(uri, request_method='DELETE')
 
-    def record_list(self, name):
+    def record_list(self, name, stream=False):
         """
         description: List all Domain Records
 
         in:
             - name - string - The name of the domain, the Domain Records of which to retrieve
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Domain Record data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-domain-records
         """  # nopep8
         uri = "{}/{}/records".format(self.uri, name)
-        return self.pages(uri, "domain_records")
+        return self.pages(uri, "domain_records", stream=stream)
+
+    def record_count(self, name):
+        """
+        description: Count all Domain Records, from a single small page rather than listing them
+
+        in:
+            - name - string - The name of the domain, the Domain Records of which to count
+
+        out: The number of Domain Records
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-domain-records
+        """  # nopep8
+
+        uri = "{}/{}/records".format(self.uri, name)
+        return self.total(uri, "domain_records")
 
     def record_create(self, name, attribs):
         """
@@ -3,6 +3,7 @@
 import time
 import copy
 from .Endpoint import Endpoint
+from .Cache import Cache
 from .exception import DOBOTOException, DOBOTOPollingException
 
 
@@ -64,21 +65,22 @@ class Droplet(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#droplets
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for droplet interaction.
         """
-        super(Droplet, self).__init__(token, agent)
+        super(Droplet, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/droplets" % url
         self.reports = "%s/reports" % url
 
-    def list(self, tag_name=None):
+    def list(self, tag_name=None, stream=False):
         """
         description: List all Droplets or all Droplets with a specific Tag.
 
         in:
             - tag_name - string - Send to retrieve Droplet with this tag.
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Droplet data structures
 
@@ -91,14 +93,38 @@ class Droplet(Endpoint):
         else:
             uri = self.uri
 
-        return self.pages(uri, "droplets")
+        return self.pages(uri, "droplets", stream=stream)
 
-    def neighbor_list(self, id):
+    def count(self, tag_name=None):
+        """
+        description:
+            Count all Droplets or all Droplets with a specific Tag, from a single small page rather
+            than listing them.  Cheap enough to check against the Account's droplet_limit
+
+        in:
+            - tag_name - string - Send to count Droplets with this tag.
+
+        out: The number of Droplets
+
+        related:
+            - https://developers.digitalocean.com/documentation/v2/#list-all-droplets
+            - https://developers.digitalocean.com/documentation/v2/#listing-droplets-by-tag
+        """  # nopep8
+
+        if tag_name is not None:
+            uri = "%s?tag_name=%s" % (self.uri, tag_name)
+        else:
+            uri = self.uri
+
+        return self.total(uri, "droplets")
+
+    def neighbor_list(self, id, stream=False):
         """
         description: List Neighbors for a Droplet running on the same physical server
 
         in:
             - id - number - The id of the Droplet
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Droplet data structures
 
@@ -106,13 +132,16 @@ class Droplet(Endpoint):
         """  # nopep8
         uri = "%s/%s/neighbors" % (self.uri, id)
 
-        return self.pages(uri, "droplets")
+        return self.pages(uri, "droplets", stream=stream)
 
-    def droplet_neighbor_list(self):
+    def droplet_neighbor_list(self, stream=False):
         """
         description:
             List all Droplet Neighbors, any droplets that are running on the same physical hardware
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out:
             A list of neighbor lists of Droplet data structures
 
@@ -120,7 +149,7 @@ class Droplet(Endpoint):
         """  # nopep8
         uri = "%s/droplet_neighbors" % (self.reports)
 
-        return self.pages(uri, "neighbors")
+        return self.pages(uri, "neighbors", stream=stream)
 
     def ready(self, droplet, attribs):
         """
@@ -188,7 +217,8 @@ class Droplet(Endpoint):
                 - tags - list - A flat list of tag names as strings to apply to the Droplet after
                   it is created. Tag names can either be existing or new tags.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: A Droplet data structures if name is sent, or a list of Droplet data structures if
@@ -199,8 +229,7 @@ class Droplet(Endpoint):
             - https://developers.digitalocean.com/documentation/v2/#create-multiple-droplets
         """  # nopep8
 
-        if poll < 1:
-            poll = 1
+        poll = self.waiting(poll)
 
         if "name" in attribs:
 
@@ -210,12 +239,16 @@ class Droplet(Endpoint):
                 return droplet
 
             start_time = time.time()
+            attempt = 0
 
             while not self.ready(droplet, attribs):
 
-                time.sleep(poll)
+                time.sleep(poll.delay(attempt, "create_droplet"))
+                attempt += 1
+
                 try:
-                    droplet = self.info(droplet["id"])
+                    with Cache.fresh():
+                        droplet = self.info(droplet["id"])
                 except Exception as exception:
                     if time.time() - start_time > timeout:
                         raise DOBOTOPollingException(polling=droplet, error=exception)
@@ -223,6 +256,9 @@ class Droplet(Endpoint):
                 if time.time() - start_time > timeout:
                     raise DOBOTOPollingException(polling=droplet)
 
+            if attempt > 0:
+                poll.record("create_droplet", time.time() - start_time)
+
             return droplet
 
         elif "names" in attribs:
@@ -233,26 +269,44 @@ class Droplet(Endpoint):
                 return droplets
 
             start_time = time.time()
+            attempt = 0
+
+            tag_name = attribs["tags"][0] if attribs.get("tags") else None
 
             info = [index for index, droplet in enumerate(droplets)
                     if not self.ready(droplet, attribs)]
 
+            sweep = self.sweep(tag_name) if info else 1
+
             while len(info) > 0:
 
-                time.sleep(poll)
+                time.sleep(poll.delay(attempt, "create_droplet"))
+                attempt += 1
 
-                for index in info:
-                    try:
-                        droplets[index] = self.info(droplets[index]["id"])
-                    except Exception as exception:
+                with Cache.fresh():
+                    results = self.info_list(
+                        [droplets[index]["id"] for index in info],
+                        tag_name=tag_name if len(info) >= sweep else None, sweep=sweep
+                    )
+
+                for index, result in zip(info, results):
+                    if isinstance(result, Exception):
                         if time.time() - start_time > timeout:
-                            raise DOBOTOPollingException(polling=droplets, error=exception)
+                            raise DOBOTOPollingException(polling=droplets, error=result)
+                    else:
+                        droplets[index] = result
 
-                    if time.time() - start_time > timeout:
-                        raise DOBOTOPollingException(polling=droplets)
+                if time.time() - start_time > timeout:
+                    raise DOBOTOPollingException(polling=droplets)
 
-                info = [index for index, droplet in enumerate(droplets)
-                        if not self.ready(droplet, attribs)]
+                remaining = [index for index, droplet in enumerate(droplets)
+                             if not self.ready(droplet, attribs)]
+
+                for index in info:
+                    if index not in remaining:
+                        poll.record("create_droplet", time.time() - start_time)
+
+                info = remaining
 
             return droplets
 
@@ -260,6 +314,114 @@ class Droplet(Endpoint):
 
             raise ValueError("name or names must be specified")
 
+    def sweep(self, tag_name=None):
+        """
+        How many ids it takes for one listing of every Droplet, or every Droplet with a tag, to
+        cost no more calls than retrieving each, what create waits with, info_list's default if
+        the count fails
+        """
+
+        try:
+            return max(-(-self.count(tag_name=tag_name) // 200), 1)
+        except self.failures():
+            return 20
+
+    @staticmethod
+    def batches(names, batch):
+        """ Names split into batches of at most batch each """
+
+        return [names[index:index + batch] for index in range(0, len(names), batch)]
+
+    @staticmethod
+    def batched(batches, results):
+        """
+        Droplets in the order of the names of every batch, with the exception raised in place of
+        any that couldn't be created
+        """
+
+        droplets = []
+
+        for names, created in zip(batches, results):
+
+            if isinstance(created, Exception):
+                droplets.extend([created] * len(names))
+                continue
+
+            named = {}
+
+            for droplet in created:
+                named.setdefault(droplet["name"], []).append(droplet)
+
+            for name in names:
+                if named.get(name):
+                    droplets.append(named[name].pop(0))
+                else:
+                    droplets.append(
+                        DOBOTOException("Requested droplet '%s' not found" % name, created)
+                    )
+
+        return droplets
+
+    def bulk_create(self, attribs, wait=False, poll=5, timeout=300, batch=10, workers=None):
+        """
+        description:
+            Create any number of Droplets, past the 10 a single create of multiple takes.  The
+            names are split into batches the API accepts, the batches are sent as many at once as
+            workers allows, paced by the transport's rate limiter, and if waiting, every Droplet
+            created is handed to the DO's waiter, which checks on all of them together.
+
+        in:
+            - attribs - dict - The data of the Droplets, as for create with names
+            - wait - boolean - Whether to wait until the droplets are ready
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
+            - timeout - number - How many seconds before giving up on a Droplet
+            - batch - number - Most names sent in a single create
+            - workers - number - Most batches sent at once.  Defaults to the transport's pool_size
+
+        out:
+            A list of Droplet data structures in the order of the names, with the exception raised
+            in place of any Droplet that couldn't be created, or didn't become ready in time
+
+        related: https://developers.digitalocean.com/documentation/v2/#create-multiple-droplets
+        """  # nopep8
+
+        if "names" not in attribs:
+            raise ValueError("names must be specified")
+
+        batches = self.batches(attribs["names"], batch)
+
+        def create(names):
+            return self.request(
+                self.uri, "droplets", 'POST', attribs=dict(attribs, names=names)
+            )
+
+        if workers is None:
+            workers = self.transport.pool_size
+
+        droplets = self.batched(batches, self.concurrently(create, batches, workers))
+
+        if not wait:
+            return droplets
+
+        futures = [
+            droplet if isinstance(droplet, Exception) else
+            self.do.waiter.droplet(droplet, attribs, poll=poll, timeout=timeout)
+            for droplet in droplets
+        ]
+
+        results = []
+
+        for future in futures:
+            if isinstance(future, Exception):
+                results.append(future)
+            elif future.exception() is not None:
+                results.append(future.exception())
+            else:
+                results.append(future.result())
+
+        return results
+
     def present(self, attribs, wait=False, poll=5, timeout=300):
         """
         description: Create a new Droplet or multiple Droplets if not already existing
@@ -302,7 +464,8 @@ class Droplet(Endpoint):
                 - tags - list - A flat list of tag names as strings to apply to the Droplet after
                   it is created. Tag names can either be existing or new tags.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: A tuple of two Droplet data structures if name is sent (second is None if already
@@ -314,15 +477,9 @@ class Droplet(Endpoint):
             - https://developers.digitalocean.com/documentation/v2/#create-multiple-droplets
         """  # nopep8
 
-        droplets = self.list()
-
         if "name" in attribs:
 
-            existing = None
-            for droplet in droplets:
-                if attribs["name"] == droplet["name"]:
-                    existing = droplet
-                    break
+            existing = self.find_first(lambda item: item["name"] == attribs["name"])
 
             if existing is not None:
                 return (existing, None)
@@ -332,20 +489,18 @@ class Droplet(Endpoint):
 
         elif "names" in attribs:
 
+            droplets = self.index(self.list())
+
             existing = []
             existing_lookup = {}
             create = copy.deepcopy(attribs)
             create["names"] = []
 
             for name in attribs["names"]:
-                exists = False
-                for droplet in droplets:
-                    if name == droplet["name"]:
-                        exists = True
-                        existing.append(droplet)
-                        existing_lookup[name] = droplet
-                        break
-                if not exists:
+                if name in droplets:
+                    existing.append(droplets[name])
+                    existing_lookup[name] = droplets[name]
+                else:
                     create["names"].append(name)
 
             if not create["names"]:
@@ -384,6 +539,44 @@ class Droplet(Endpoint):
         uri = "%s/%s" % (self.uri, id)
         return self.request(uri, "droplet")
 
+    def info_list(self, ids, tag_name=None, sweep=20):
+        """
+        description:
+            Retrieve many existing Droplets at once.  With a tag, or at least sweep ids, the
+            Droplets are picked out of one list, by tag if there is one, instead of being
+            retrieved one request per id.  Otherwise, or for any not found that way, each is
+            retrieved by id, as many at once as the transport has workers.
+
+        in:
+            - ids - list - The ids of the Droplets to retrieve
+            - tag_name - string - A tag all the Droplets have, to only list those
+            - sweep - number - How many ids it takes to list every Droplet instead
+
+        out:
+            A list of Droplet data structures in the order of the ids, with the exception raised
+            in place of any Droplet that couldn't be retrieved
+        """
+
+        found = {}
+
+        if tag_name is not None or len(ids) >= sweep:
+
+            wanted = set(ids)
+
+            try:
+                for droplet in self.list(tag_name=tag_name, stream=True):
+                    if droplet["id"] in wanted:
+                        found[droplet["id"]] = droplet
+                        if len(found) == len(wanted):
+                            break
+            except self.failures():
+                pass
+
+        missing = [id for id in ids if id not in found]
+        found.update(zip(missing, self.concurrently(self.info, missing)))
+
+        return [found[id] for id in ids]
+
     def destroy(self, id=None, tag_name=None):
         """
         description: Delete a Droplet by id or Droplets by tag
@@ -437,19 +630,189 @@ class Droplet(Endpoint):
         else:
             raise ValueError("id or tag_name must be specified")
 
-    def backup_list(self, id):
+    def bulk(self, method, ids, wait=False, poll=5, timeout=300, workers=None, **kwargs):
+        """
+        description:
+            Run a Droplet action on many Droplets.  The action is sent for every id, as many at once
+            as workers allows, and if waiting, every Action is handed to the DO's waiter, which
+            checks on all of them together rather than one at a time.
+
+        in:
+            - method - string - Name of the action, like "reboot", "resize" or "snapshot_create"
+            - ids - list or dict - The ids of the Droplets, or the ids mapped to a dict of what to
+              send the action for that Droplet alone, like each Droplet's new name for rename
+            - wait - boolean - Whether to wait until the actions are done
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
+            - timeout - number - How many seconds before giving up on an action
+            - workers - number - Most actions sent at once.  Defaults to the transport's pool_size
+            - kwargs - Sent with the action for every Droplet, like size="2gb" for resize
+
+        out:
+            A dict of Action data structures by Droplet id, with the exception raised in place of
+            any action that couldn't be sent or didn't finish in time
+        """
+
+        action = getattr(self, method)
+
+        if not isinstance(ids, dict):
+            ids = {id: {} for id in ids}
+
+        def send(id):
+            attribs = dict(kwargs)
+            attribs.update(ids[id])
+            return action(id, **attribs)
+
+        if workers is None:
+            workers = self.transport.pool_size
+
+        ordered = list(ids)
+        actions = self.concurrently(send, ordered, workers)
+
+        if wait:
+
+            actions = [
+                sent if isinstance(sent, Exception) else
+                self.do.waiter.action(sent, poll=poll, timeout=timeout)
+                for sent in actions
+            ]
+
+            for index, future in enumerate(actions):
+                if not isinstance(future, Exception):
+                    actions[index] = future.exception() or future.result()
+
+        return dict(zip(ordered, actions))
+
+    @staticmethod
+    def completed(result):
+        """ Whether an action bulk ran finished, rather than failing or erroring """
+
+        return not isinstance(result, Exception) and result["status"] == "completed"
+
+    @staticmethod
+    def unsent(result):
+        """ Whether an action bulk ran failed before it was sent, leaving its Droplet alone """
+
+        return isinstance(result, Exception) and not isinstance(result, DOBOTOPollingException)
+
+    @staticmethod
+    def active(droplet):
+        """ Whether a droplet is back up, what rolling checks for unless told otherwise """
+
+        return droplet["status"] == "active"
+
+    def healthy(self, ids, check, poll, timeout):
+        """ Waits until check is true of every droplet, returns whether that happened in time """
+
+        start_time = time.time()
+        attempt = 0
+
+        while True:
+
+            with Cache.fresh():
+                droplets = self.info_list(ids)
+
+            if all(not isinstance(droplet, Exception) and check(droplet) for droplet in droplets):
+                return True
+
+            if time.time() - start_time > timeout:
+                return False
+
+            time.sleep(poll.delay(attempt))
+            attempt += 1
+
+    def rolling(
+        self, method, tag_name, window=1, load_balancer=None, healthy=None, halt=True,
+        poll=5, timeout=300, **kwargs
+    ):
+        """
+        description:
+            Run a Droplet action across every Droplet with a tag a window at a time, so the rest
+            keep serving.  Each window's actions are sent together and waited on, then its Droplets
+            are waited on until they're healthy before the next window starts.  An action counts
+            as done only once it's completed, not errored.  With a Load Balancer, each window is
+            taken out of it before its actions and put back once healthy, a window that isn't
+            healthy in time being left out, except Droplets whose action couldn't be sent, which
+            are put straight back.
+
+        in:
+            - method - string - Name of the action, like "reboot", "resize" or "rebuild"
+            - tag_name - string - Tag of the Droplets to roll through
+            - window - number - How many Droplets to act on at once
+            - load_balancer - string - Id of a Load Balancer to take each window out of
+            - healthy - function - Takes a Droplet data structure, returns whether it's healthy.
+              Defaults to its status being "active"
+            - halt - boolean - Whether to stop after a window with a failed action or that wasn't
+              healthy in time
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
+            - timeout - number - How many seconds before giving up on a window's actions, and
+              again on its health
+            - kwargs - Sent with the action for every Droplet, like size="2gb" for resize
+
+        out:
+            A list of dicts, one per window run:
+                - ids - list - The ids of the Droplets in the window
+                - results - dict - Action data structures by Droplet id, with the exception raised
+                  in place of any that failed
+                - healthy - boolean - Whether the window was healthy in time
+                - seconds - number - How long the window took
+        """
+
+        poll = self.waiting(poll)
+        check = healthy if healthy is not None else self.active
+
+        ids = [droplet["id"] for droplet in self.list(tag_name=tag_name)]
+        windows = []
+
+        for index in range(0, len(ids), window):
+
+            start_time = time.time()
+            batch = ids[index:index + window]
+
+            if load_balancer is not None:
+                self.do.load_balancer.droplet_remove(load_balancer, batch)
+
+            results = self.bulk(
+                method, batch, wait=True, poll=poll, timeout=timeout, workers=window, **kwargs
+            )
+
+            done = [id for id in batch if self.completed(results[id])]
+            up = bool(done) and self.healthy(done, check, poll, timeout)
+
+            if load_balancer is not None:
+
+                back = [id for id in batch if (up and id in done) or self.unsent(results[id])]
+
+                if back:
+                    self.do.load_balancer.droplet_add(load_balancer, back)
+
+            windows.append({
+                "ids": batch,
+                "results": results,
+                "healthy": up,
+                "seconds": time.time() - start_time
+            })
+
+            if halt and (len(done) < len(batch) or not up):
+                break
+
+        return windows
+
+    def backup_list(self, id, stream=False):
         """
         description: List backups for a Droplet
 
         in:
             - id - number - The id of the Droplet
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Image data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-backups-for-a-droplet
         """  # nopep8
         uri = "%s/%s/backups" % (self.uri, id)
-        return self.pages(uri, "backups")
+        return self.pages(uri, "backups", stream=stream)
 
     def backup_enable(self, id=None, tag_name=None, wait=False, poll=5, timeout=300):
         """
@@ -459,7 +822,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -480,7 +844,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -503,7 +868,8 @@ class Droplet(Endpoint):
         in:
             - id - number - The id of the Droplet
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -531,7 +897,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -552,7 +919,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -577,7 +945,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -601,7 +970,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -626,7 +996,8 @@ class Droplet(Endpoint):
             - id - number - The id of the Droplet
             - image - string if an image slug. number if an image ID. - An image slug or ID. This represents the image that the Droplet will use as a base.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure.
@@ -654,7 +1025,8 @@ class Droplet(Endpoint):
         in:
             - id - number - The id of the Droplet
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure.
@@ -680,7 +1052,8 @@ class Droplet(Endpoint):
             - disk - bool - Whether to increase disk size
             - size - string - The size slug that you want to resize to. - true
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure.
@@ -705,7 +1078,8 @@ class Droplet(Endpoint):
             - id - number - The id of the Droplet
             - image - string if an image slug. number if an image ID. - An image slug or ID. This represents the image that the Droplet will use as a base.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure.
@@ -733,7 +1107,8 @@ class Droplet(Endpoint):
             - id - number - The id of the Droplet
             - name - string - The new name for the Droplet.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure.
@@ -747,12 +1122,13 @@ class Droplet(Endpoint):
             wait, poll, timeout
         )
 
-    def kernel_list(self, id):
+    def kernel_list(self, id, stream=False):
         """
         description: List all available Kernels for a Droplet
 
         in:
             - id - number - The id of the Droplet
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out:
             A list of Kernel dict's:
@@ -764,7 +1140,7 @@ class Droplet(Endpoint):
         """  # nopep8
 
         uri = "%s/%s/kernels" % (self.uri, id)
-        return self.pages(uri, "kernels")
+        return self.pages(uri, "kernels", stream=stream)
 
     def kernel_update(self, id, kernel_id, wait=False, poll=5, timeout=300):
         """
@@ -774,7 +1150,8 @@ class Droplet(Endpoint):
             - id - number - The id of the Droplet
             - kernel - number - A unique number used to identify and reference a specific kernel. - true
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure.
@@ -796,7 +1173,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -816,7 +1194,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -828,19 +1207,20 @@ class Droplet(Endpoint):
             wait=wait, poll=poll, timeout=timeout
         )
 
-    def snapshot_list(self, id):
+    def snapshot_list(self, id, stream=False):
         """
         description: List snapshots for a Droplet
 
         in:
             - id - number - The id of the Droplet
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Image data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-snapshots-for-a-droplet
         """  # nopep8
         uri = "%s/%s/snapshots" % (self.uri, id)
-        return self.pages(uri, "snapshots")
+        return self.pages(uri, "snapshots", stream=stream)
 
     def snapshot_create(
         self, id=None, tag_name=None, snapshot_name=None,
@@ -856,7 +1236,8 @@ class Droplet(Endpoint):
             - id - number - Send only to reference a single Droplet by id
             - tag_name - string - Send only to reference all Droplets with this tag.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: If by id, an Action data structure. If by tag, a list of Action data structures
@@ -871,7 +1252,7 @@ class Droplet(Endpoint):
             wait=wait, poll=poll, timeout=timeout
         )
 
-    def action_list(self, id):
+    def action_list(self, id, stream=False):
         """
         description: List all Droplet Actions
 
@@ -893,13 +1274,14 @@ class Droplet(Endpoint):
 
         in:
             - id - number - The id of the Droplet
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Action data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#droplet-actions
         """  # nopep8
         uri = "%s/%s/actions" % (self.uri, id)
-        return self.pages(uri, "actions")
+        return self.pages(uri, "actions", stream=stream)
 
     def action_info(self, id, action_id):
         """
@@ -2,7 +2,13 @@
 
 import time
 import json
-import requests
+import contextvars
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+from .Transport import Transport
+from .Cache import Cache
+from .Wait import Wait
 from .exception import DOBOTOException, DOBOTONotFoundException, DOBOTOPollingException
 
 
@@ -10,10 +16,16 @@ class Endpoint(object):
 
     """Base class for interacting with an endpoint of the DO API."""
 
-    def __init__(self, token, agent):
-        """Take token and sets its token for API authorization and agent for tracking."""
+    transport_class = Transport
+
+    def __init__(self, token, agent, transport=None):
+        """
+        Take token and sets its token for API authorization and agent for tracking.  Uses the
+        transport given (shared by all endpoints of a DO) or makes one of its own.
+        """
         self.token = token
         self.agent = agent
+        self.transport = transport if transport is not None else self.transport_class()
 
     def headers(self):
         """ Headers to use on API calls """
@@ -24,15 +36,29 @@ class Endpoint(object):
             'Content-Type': 'application/json'
         }
 
+    def failures(self):
+        """ Exceptions of a call that failed, from the API or in transit, rather than of a bug """
+
+        return (DOBOTOException, ValueError) + self.transport.errors
+
+    @staticmethod
+    def index(items, key="name"):
+        """ Items by key, to look up many at once without scanning, the first of a key winning """
+
+        indexed = {}
+
+        for item in items:
+            indexed.setdefault(item[key], item)
+
+        return indexed
+
     def request(self, request_url, expect=None, request_method='GET', attribs=None, params=None):
         """ Single API Call """
 
         headers = self.headers()
 
-        requests_method = getattr(requests, request_method.lower())
-
-        response = requests_method(
-            request_url, params=params, data=json.dumps(attribs), headers=headers, timeout=60
+        response = self.transport.request(
+            request_method, request_url, params=params, data=json.dumps(attribs), headers=headers
         )
 
         if expect is None:
@@ -52,39 +78,201 @@ class Endpoint(object):
 
             return result[expect]
 
-    def pages(self, request_url, expect, params=None):
-        """ Paged API Calls """
+    def page(self, request_url, expect, params, headers):
+        """ Single page of a Paged API Call """
+
+        result = self.transport.request(
+            'GET', request_url, params=params, headers=headers
+        ).json()
+
+        if expect not in result:
+            raise DOBOTOException(result=result)
+
+        return result
+
+    @staticmethod
+    def next_page(result):
+        """ URL of the page after this one, if any """
+
+        if 'links' in result and \
+           'pages' in result['links'] and \
+           'next' in result['links']['pages']:
+
+            return result['links']['pages']['next']
+
+        return None
+
+    @staticmethod
+    def remaining_pages(result):
+        """ URLs of every page after the first, known from the first page's last link """
+
+        if 'links' not in result or \
+           'pages' not in result['links'] or \
+           'last' not in result['links']['pages']:
+
+            return []
+
+        last = urlparse(result['links']['pages']['last'])
+        query = parse_qs(last.query)
+
+        if 'page' not in query:
+            return []
+
+        urls = []
+
+        for page in range(2, int(query['page'][0]) + 1):
+            query['page'] = [str(page)]
+            urls.append(urlunparse(last._replace(query=urlencode(query, doseq=True))))
+
+        return urls
+
+    def iter_pages(self, request_url, expect, params=None):
+        """ Paged API Calls, yielding items one page at a time """
 
         if params is None:
             params = {}
 
-        next_url = request_url
         headers = self.headers()
         params["per_page"] = 200
-        items = []
+
+        next_url = request_url
 
         while next_url:
 
-            result = requests.get(next_url, params=params, headers=headers, timeout=60).json()
+            result = self.page(next_url, expect, params, headers)
 
-            if expect not in result:
-                raise DOBOTOException(result=result)
+            for item in result[expect]:
+                yield item
 
-            items.extend(result[expect])
+            next_url = self.next_page(result)
+            params = None
+
+    def pages(self, request_url, expect, params=None, stream=False):
+        """
+        Paged API Calls, if the transport allows more than one worker, every page after the first
+        is fetched concurrently and reassembled in order.  If stream, returns iter_pages instead.
+        """
+
+        if stream:
+            return self.iter_pages(request_url, expect, params)
+
+        if params is None:
+            params = {}
+
+        headers = self.headers()
+        params["per_page"] = 200
 
-            if 'links' in result and \
-               'pages' in result['links'] and \
-               'next' in result['links']['pages']:
+        result = self.page(request_url, expect, params, headers)
+        items = list(result[expect])
 
-                next_url = result['links']['pages']['next']
-                params = None
+        remaining = self.remaining_pages(result) if self.transport.workers > 1 else []
 
-            else:
+        if remaining:
 
-                next_url = None
+            context = contextvars.copy_context()
+
+            with ThreadPoolExecutor(min(self.transport.workers, len(remaining))) as executor:
+                for result in executor.map(
+                    lambda url: context.copy().run(self.page, url, expect, None, headers),
+                    remaining
+                ):
+                    items.extend(result[expect])
+
+            return items
+
+        next_url = self.next_page(result)
+
+        while next_url:
+
+            result = self.page(next_url, expect, None, headers)
+            items.extend(result[expect])
+            next_url = self.next_page(result)
 
         return items
 
+    def total(self, request_url, expect, params=None):
+        """
+        How many items a Paged API Call has, from the meta of a single page of one item rather
+        than fetching every page.  Counts what it has to fetch if the API doesn't say.
+        """
+
+        params = dict(params) if params is not None else {}
+        params["per_page"] = 1
+
+        result = self.page(request_url, expect, params, self.headers())
+
+        if "meta" in result and "total" in result["meta"]:
+            return result["meta"]["total"]
+
+        if self.next_page(result) is None:
+            return len(result[expect])
+
+        del params["per_page"]
+
+        return len(self.pages(request_url, expect, params=params))
+
+    def find_first(self, predicate, **kwargs):
+        """
+        First item the endpoint's list yields that predicate is true of, None if there isn't one.
+        Streams the list, so paging stops at the page with the match.  Any kwargs go to list.
+        """
+
+        for item in self.list(stream=True, **kwargs):
+            if predicate(item):
+                return item
+
+        return None
+
+    def exists(self, predicate, **kwargs):
+        """ Whether the endpoint's list has an item predicate is true of, paging until found """
+
+        return self.find_first(predicate, **kwargs) is not None
+
+    def concurrently(self, method, items, workers=None):
+        """
+        Calls method with each item, as many at once as the transport has workers (or workers if
+        given), returning the results in order with any exception raised in place of its result.
+        Each call runs in a copy of the caller's context, so Cache.fresh() carries over
+        """
+
+        if workers is None:
+            workers = self.transport.workers
+
+        def call(item):
+            try:
+                return method(item)
+            except Exception as exception:
+                return exception
+
+        if workers <= 1 or len(items) <= 1:
+            return [call(item) for item in items]
+
+        context = contextvars.copy_context()
+
+        with ThreadPoolExecutor(min(workers, len(items))) as executor:
+            return list(executor.map(lambda item: context.copy().run(call, item), items))
+
+    @staticmethod
+    def waiting(poll):
+        """ Wait strategy for a poll argument, either a Wait or seconds between checks """
+
+        if isinstance(poll, Wait):
+            return poll
+
+        return Wait(poll)
+
+    @staticmethod
+    def action_seconds(action):
+        """ Seconds a finished action took by its own timestamps, None if they're not there """
+
+        try:
+            return (
+                datetime.strptime(action["completed_at"], "%Y-%m-%dT%H:%M:%SZ") -
+                datetime.strptime(action["started_at"], "%Y-%m-%dT%H:%M:%SZ")
+            ).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            return None
+
     def action_result(self, action, wait, poll, timeout):
         """
         General action result processor for waiting
@@ -93,16 +281,19 @@ class Endpoint(object):
         if not wait:
             return action
 
-        if poll < 1:
-            poll = 1
+        poll = self.waiting(poll)
 
         start_time = time.time()
+        attempt = 0
 
         while action["status"] == "in-progress":
 
-            time.sleep(poll)
+            time.sleep(poll.delay(attempt, action.get("type")))
+            attempt += 1
+
             try:
-                action = self.do.action.info(action["id"])
+                with Cache.fresh():
+                    action = self.do.action.info(action["id"])
             except Exception as exception:
                 if time.time() - start_time > timeout:
                     raise DOBOTOPollingException(polling=action, error=exception)
@@ -110,34 +301,44 @@ class Endpoint(object):
             if time.time() - start_time > timeout:
                 raise DOBOTOPollingException(polling=action)
 
+        if action["status"] == "completed":
+            poll.record(action.get("type"), self.action_seconds(action))
+
         return action
 
     def actions_result(self, actions, wait, poll, timeout):
         """
-        General actions result processor for waiting
+        General actions result processor for waiting, checking on every action still in progress
+        together each poll
         """
 
         if not wait:
             return actions
 
-        if poll < 1:
-            poll = 1
+        poll = self.waiting(poll)
 
         start_time = time.time()
+        attempt = 0
 
         info = [index for index, action in enumerate(actions)
                 if action["status"] == "in-progress"]
 
         while len(info) > 0:
 
-            time.sleep(poll)
+            time.sleep(min(poll.delay(attempt, actions[index].get("type")) for index in info))
+            attempt += 1
+
+            with Cache.fresh():
+                results = self.do.action.info_list([actions[index]["id"] for index in info])
 
-            for index in info:
-                try:
-                    actions[index] = self.do.action.info(actions[index]["id"])
-                except Exception as exception:
+            for index, result in zip(info, results):
+                if isinstance(result, Exception):
                     if time.time() - start_time > timeout:
-                        raise DOBOTOPollingException(polling=actions, error=exception)
+                        raise DOBOTOPollingException(polling=actions, error=result)
+                else:
+                    actions[index] = result
+                    if result["status"] == "completed":
+                        poll.record(result.get("type"), self.action_seconds(result))
 
             if time.time() - start_time > timeout:
                 raise DOBOTOPollingException(polling=actions)
@@ -0,0 +1,1487 @@
+"""This holds the FakeAPI class."""
+
+import re
+import json
+import time
+import uuid
+import random
+import hashlib
+import threading
+import ipaddress
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from .Transport import Response
+
+
+class FakeAPI(object):
+    """
+    description:
+        In-memory stand-in for the DO API, answering the /v2 routes every endpoint uses, so real
+        HTTP behaviour, paging and waits can be measured without touching an account.  Serve it
+        over HTTP with a FakeServer or call handle directly.
+
+        Everything made lives in memory, and things take time like they do for real.  Actions
+        stay in progress, Droplets stay new and Load Balancers have no IP for action_seconds,
+        then finish, and only then does what an Action does take effect.  Pages hold at most
+        page_size items with the links and meta the API gives.  Calls are paced against an
+        hourly limit with the RateLimit headers, and failures can be injected at a rate or one
+        at a time with fail.
+
+    in:
+        - latency - number - Seconds every call takes
+        - page_size - number - Most items a page holds, whatever per_page asks for
+        - action_seconds - number - Seconds Actions, new Droplets and new Load Balancers take to
+          finish.  0 finishes them right away
+        - error_rate - number - Fraction of calls, 0 to 1, answered with error_status instead
+        - error_status - number - HTTP status of failures injected at error_rate
+        - limit - number - Calls allowed per hour before 429s, None for no limit
+        - token - string - Token calls must be authorized with, None to take any
+        - seed - number - Seeds the ids and injected failures, for repeatable runs
+    """
+
+    REGIONS = [
+        {
+            "slug": slug, "name": name, "available": True,
+            "sizes": ["512mb", "1gb", "2gb"],
+            "features": ["private_networking", "backups", "ipv6", "metadata"]
+        }
+        for slug, name in [
+            ("nyc1", "New York 1"), ("nyc3", "New York 3"), ("sfo2", "San Francisco 2"),
+            ("ams3", "Amsterdam 3"), ("lon1", "London 1")
+        ]
+    ]
+
+    SIZES = [
+        {
+            "slug": slug, "memory": memory, "vcpus": vcpus, "disk": disk, "transfer": transfer,
+            "price_monthly": monthly, "price_hourly": round(monthly / 672.0, 5),
+            "regions": ["nyc1", "nyc3", "sfo2", "ams3", "lon1"], "available": True
+        }
+        for slug, memory, vcpus, disk, transfer, monthly in [
+            ("512mb", 512, 1, 20, 1.0, 5.0), ("1gb", 1024, 1, 30, 2.0, 10.0),
+            ("2gb", 2048, 2, 40, 3.0, 20.0)
+        ]
+    ]
+
+    DISTRIBUTIONS = [
+        ("ubuntu-16-04-x64", "16.04.2 x64", "Ubuntu"),
+        ("debian-8-x64", "8.7 x64", "Debian"),
+        ("centos-7-x64", "7.3.1611 x64", "CentOS")
+    ]
+
+    ROUTES = [
+        ("GET", r"account", "account"),
+        ("GET", r"account/keys", "ssh_key_list"),
+        ("POST", r"account/keys", "ssh_key_create"),
+        ("GET", r"account/keys/([^/]+)", "ssh_key_info"),
+        ("PUT", r"account/keys/([^/]+)", "ssh_key_update"),
+        ("DELETE", r"account/keys/([^/]+)", "ssh_key_destroy"),
+        ("GET", r"actions", "action_list"),
+        ("GET", r"actions/(\d+)", "action_info"),
+        ("GET", r"certificates", "certificate_list"),
+        ("POST", r"certificates", "certificate_create"),
+        ("GET", r"certificates/([^/]+)", "certificate_info"),
+        ("DELETE", r"certificates/([^/]+)", "certificate_destroy"),
+        ("GET", r"domains", "domain_list"),
+        ("POST", r"domains", "domain_create"),
+        ("GET", r"domains/([^/]+)", "domain_info"),
+        ("DELETE", r"domains/([^/]+)", "domain_destroy"),
+        ("GET", r"domains/([^/]+)/records", "record_list"),
+        ("POST", r"domains/([^/]+)/records", "record_create"),
+        ("GET", r"domains/([^/]+)/records/(\d+)", "record_info"),
+        ("PUT", r"domains/([^/]+)/records/(\d+)", "record_update"),
+        ("DELETE", r"domains/([^/]+)/records/(\d+)", "record_destroy"),
+        ("GET", r"droplets", "droplet_list"),
+        ("POST", r"droplets", "droplet_create"),
+        ("DELETE", r"droplets", "droplet_destroy_tagged"),
+        ("POST", r"droplets/actions", "droplet_action_tagged"),
+        ("GET", r"droplets/(\d+)", "droplet_info"),
+        ("DELETE", r"droplets/(\d+)", "droplet_destroy"),
+        ("GET", r"droplets/(\d+)/actions", "droplet_action_list"),
+        ("POST", r"droplets/(\d+)/actions", "droplet_action"),
+        ("GET", r"droplets/(\d+)/actions/(\d+)", "droplet_action_info"),
+        ("GET", r"droplets/(\d+)/snapshots", "droplet_snapshot_list"),
+        ("GET", r"droplets/(\d+)/(neighbors|backups|kernels)", "droplet_empty"),
+        ("GET", r"reports/droplet_neighbors", "neighbor_list"),
+        ("GET", r"floating_ips", "floating_ip_list"),
+        ("POST", r"floating_ips", "floating_ip_create"),
+        ("GET", r"floating_ips/([^/]+)", "floating_ip_info"),
+        ("DELETE", r"floating_ips/([^/]+)", "floating_ip_destroy"),
+        ("GET", r"floating_ips/([^/]+)/actions", "floating_ip_action_list"),
+        ("POST", r"floating_ips/([^/]+)/actions", "floating_ip_action"),
+        ("GET", r"floating_ips/([^/]+)/actions/(\d+)", "floating_ip_action_info"),
+        ("GET", r"images", "image_list"),
+        ("GET", r"images/([^/]+)", "image_info"),
+        ("PUT", r"images/([^/]+)", "image_update"),
+        ("DELETE", r"images/([^/]+)", "image_destroy"),
+        ("GET", r"images/([^/]+)/actions", "image_action_list"),
+        ("POST", r"images/([^/]+)/actions", "image_action"),
+        ("GET", r"images/([^/]+)/actions/(\d+)", "image_action_info"),
+        ("GET", r"load_balancers", "load_balancer_list"),
+        ("POST", r"load_balancers", "load_balancer_create"),
+        ("GET", r"load_balancers/([^/]+)", "load_balancer_info"),
+        ("PUT", r"load_balancers/([^/]+)", "load_balancer_update"),
+        ("DELETE", r"load_balancers/([^/]+)", "load_balancer_destroy"),
+        ("POST", r"load_balancers/([^/]+)/(droplets|forwarding_rules)", "load_balancer_add"),
+        ("DELETE", r"load_balancers/([^/]+)/(droplets|forwarding_rules)", "load_balancer_remove"),
+        ("GET", r"regions", "region_list"),
+        ("GET", r"sizes", "size_list"),
+        ("GET", r"snapshots", "snapshot_list"),
+        ("GET", r"snapshots/([^/]+)", "snapshot_info"),
+        ("DELETE", r"snapshots/([^/]+)", "snapshot_destroy"),
+        ("GET", r"tags", "tag_list"),
+        ("POST", r"tags", "tag_create"),
+        ("GET", r"tags/([^/]+)", "tag_info"),
+        ("PUT", r"tags/([^/]+)", "tag_update"),
+        ("DELETE", r"tags/([^/]+)", "tag_destroy"),
+        ("POST", r"tags/([^/]+)/resources", "tag_attach"),
+        ("DELETE", r"tags/([^/]+)/resources", "tag_detach"),
+        ("GET", r"volumes", "volume_list"),
+        ("POST", r"volumes", "volume_create"),
+        ("DELETE", r"volumes", "volume_destroy_named"),
+        ("POST", r"volumes/actions", "volume_action_named"),
+        ("GET", r"volumes/([^/]+)", "volume_info"),
+        ("DELETE", r"volumes/([^/]+)", "volume_destroy"),
+        ("GET", r"volumes/([^/]+)/actions", "volume_action_list"),
+        ("POST", r"volumes/([^/]+)/actions", "volume_action"),
+        ("GET", r"volumes/([^/]+)/actions/(\d+)", "volume_action_info"),
+        ("GET", r"volumes/([^/]+)/snapshots", "volume_snapshot_list"),
+        ("POST", r"volumes/([^/]+)/snapshots", "volume_snapshot_create")
+    ]
+
+    class Failure(Exception):
+        """ Error answered in place of a call """
+
+        def __init__(self, status, id, message):
+            """Keep what's answered."""
+            super(FakeAPI.Failure, self).__init__(message)
+            self.status = status
+            self.id = id
+            self.message = message
+
+    def __init__(
+        self, latency=0, page_size=200, action_seconds=0, error_rate=0, error_status=500,
+        limit=5000, token=None, seed=None
+    ):
+        """Start with an empty account, but for the distribution images everyone has."""
+        self.latency = latency
+        self.page_size = page_size
+        self.action_seconds = action_seconds
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.limit = limit
+        self.token = token
+
+        self.random = random.Random(seed)
+        self.lock = threading.RLock()
+
+        self.counts = {}
+        self.failures = []
+        self.remaining = limit
+        self.reset = time.time() + 3600
+
+        self.serial = 1000
+        self.later = []
+
+        self.droplets = {}
+        self.actions = {}
+        self.images = {}
+        self.volumes = {}
+        self.snapshots = {}
+        self.floating_ips = {}
+        self.load_balancers = {}
+        self.certificates = {}
+        self.domains = {}
+        self.records = {}
+        self.ssh_keys = {}
+        self.tags = {}
+
+        for slug, name, distribution in self.DISTRIBUTIONS:
+            id = self.ident()
+            self.images[id] = {
+                "id": id, "name": name, "distribution": distribution, "slug": slug,
+                "public": True, "regions": [region["slug"] for region in self.REGIONS],
+                "created_at": self.stamp(), "type": "snapshot", "min_disk_size": 20,
+                "size_gigabytes": 2.0
+            }
+
+    # Plumbing
+
+    def fail(self, status, method=None, path=None, times=1):
+        """
+        description: Answer the next calls that match with an error instead
+
+        in:
+            - status - number - HTTP status to answer with
+            - method - string - Only calls with this method, any if None
+            - path - string - Only calls whose path after /v2/ starts with this, any if None
+            - times - number - How many calls to fail
+        """
+
+        with self.lock:
+            self.failures.append({
+                "status": status, "method": method, "path": path, "times": times
+            })
+
+    def ident(self):
+        """ Next numeric id """
+
+        with self.lock:
+            self.serial += 1
+            return self.serial
+
+    def uuid(self):
+        """ Next string id, repeatable with a seed """
+
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    @staticmethod
+    def stamp(when=None):
+        """ Timestamp like the API gives """
+
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(when))
+
+    def region(self, slug):
+        """ Region data structure for a slug """
+
+        for region in self.REGIONS:
+            if region["slug"] == slug:
+                return dict(region)
+
+        raise self.Failure(422, "unprocessable_entity", "region is invalid")
+
+    def size(self, slug):
+        """ Size data structure for a slug """
+
+        for size in self.SIZES:
+            if size["slug"] == slug:
+                return dict(size)
+
+        raise self.Failure(422, "unprocessable_entity", "size is invalid")
+
+    @staticmethod
+    def required(attribs, *keys):
+        """ Fails unless attribs has every key """
+
+        for key in keys:
+            if not isinstance(attribs, dict) or attribs.get(key) in (None, ""):
+                raise FakeAPI.Failure(422, "unprocessable_entity", "%s is required" % key)
+
+    @staticmethod
+    def found(kept, id, what):
+        """ What's kept under id, failing with a 404 if nothing is """
+
+        if id not in kept:
+            raise FakeAPI.Failure(
+                404, "not_found", "The %s you requested could not be found." % what
+            )
+
+        return kept[id]
+
+    def soon(self, fn):
+        """ Calls fn once action_seconds have passed, right away if they're 0 """
+
+        if self.action_seconds <= 0:
+            fn()
+        else:
+            self.later.append((time.time() + self.action_seconds, fn))
+
+    def settle(self):
+        """ Finishes everything that's had its time """
+
+        now = time.time()
+
+        due = [fn for when, fn in self.later if when <= now]
+        self.later = [(when, fn) for when, fn in self.later if when > now]
+
+        for fn in due:
+            fn()
+
+    def act(self, type, resource_type, resource_id, region=None, done=None):
+        """ Starts an Action, calling done once it's completed """
+
+        id = self.ident()
+
+        action = self.actions[id] = {
+            "id": id, "status": "in-progress", "type": type, "started_at": self.stamp(),
+            "completed_at": None, "resource_id": resource_id, "resource_type": resource_type,
+            "region": self.region(region) if region else None, "region_slug": region
+        }
+
+        def complete():
+            if done is not None:
+                done()
+            action["status"] = "completed"
+            action["completed_at"] = self.stamp()
+
+        self.soon(complete)
+
+        return dict(action)
+
+    def acted(self, resource_type, resource_id):
+        """ Actions on a resource, newest first """
+
+        return [
+            action for id, action in sorted(self.actions.items(), reverse=True)
+            if action["resource_type"] == resource_type and
+            str(action["resource_id"]) == str(resource_id)
+        ]
+
+    def action_of(self, resource_type, resource_id, action_id):
+        """ An Action on a resource """
+
+        action = self.found(self.actions, int(action_id), "action")
+
+        if action["resource_type"] != resource_type or \
+           str(action["resource_id"]) != str(resource_id):
+            raise self.Failure(404, "not_found", "The action you requested could not be found.")
+
+        return 200, {"action": action}
+
+    def paged(self, url, params, key, items):
+        """ One page of a listing, with links to the others and the total """
+
+        per_page = min(int(params.get("per_page", 20)), self.page_size)
+        page = max(int(params.get("page", 1)), 1)
+        last = max((len(items) + per_page - 1) // per_page, 1)
+
+        parsed = urlparse(url)
+
+        def link(number):
+            query = dict(params, page=str(number), per_page=str(per_page))
+            return urlunparse(parsed._replace(query=urlencode(query)))
+
+        pages = {}
+
+        if page > 1:
+            pages["first"] = link(1)
+            pages["prev"] = link(page - 1)
+
+        if page < last:
+            pages["next"] = link(page + 1)
+            pages["last"] = link(last)
+
+        return 200, {
+            key: items[(page - 1) * per_page:page * per_page],
+            "links": {"pages": pages} if pages else {},
+            "meta": {"total": len(items)}
+        }
+
+    def limited(self, headers):
+        """ Takes a call from the hourly budget, failing with a 429 once it's spent """
+
+        now = time.time()
+
+        if now >= self.reset:
+            self.remaining = self.limit
+            self.reset = now + 3600
+
+        headers["RateLimit-Limit"] = str(self.limit)
+        headers["RateLimit-Reset"] = str(int(self.reset))
+
+        if self.remaining <= 0:
+            headers["RateLimit-Remaining"] = "0"
+            headers["Retry-After"] = str(max(int(self.reset - now), 1))
+            raise self.Failure(429, "too_many_requests", "API Rate limit exceeded.")
+
+        self.remaining -= 1
+        headers["RateLimit-Remaining"] = str(self.remaining)
+
+    def injected(self, method, path):
+        """ Status of an injected failure for a call, None if it isn't failed """
+
+        for failure in self.failures:
+
+            if (failure["method"] is None or failure["method"] == method) and \
+               (failure["path"] is None or path.startswith(failure["path"])):
+
+                failure["times"] -= 1
+
+                if failure["times"] <= 0:
+                    self.failures.remove(failure)
+
+                return failure["status"]
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            return self.error_status
+
+        return None
+
+    def handle(self, method, url, params=None, data=None, headers=None):
+        """
+        description: Answer a call like the API would
+
+        in:
+            - method - string - HTTP method of the call
+            - url - string - Full URL called, /v2/ and all
+            - params - dict - Query params, on top of any in the url
+            - data - string - JSON body sent
+            - headers - dict - Headers sent
+
+        out: A Response
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        method = method.upper()
+        parsed = urlparse(url)
+
+        query = dict(parse_qsl(parsed.query))
+        query.update({key: str(value) for key, value in (params or {}).items()})
+
+        segments = [segment for segment in parsed.path.split("/") if segment]
+        path = "/".join(segments[segments.index("v2") + 1:] if "v2" in segments else segments)
+
+        base = urlunparse(parsed._replace(query=""))
+
+        try:
+            body = json.loads(data) if data else None
+        except ValueError:
+            body = None
+
+        sent = {}
+
+        with self.lock:
+
+            self.counts[method] = self.counts.get(method, 0) + 1
+
+            try:
+
+                if self.limit is not None:
+                    self.limited(sent)
+
+                if self.token is not None and \
+                   (headers or {}).get("Authorization") != "Bearer %s" % self.token:
+                    raise self.Failure(
+                        401, "unauthorized", "Unable to authenticate you."
+                    )
+
+                status = self.injected(method, path)
+
+                if status is not None:
+                    raise self.Failure(status, "server_error", "Injected failure.")
+
+                self.settle()
+
+                status, result = self.route(method, path, base, query, body)
+
+            except self.Failure as failure:
+                status, result = failure.status, {"id": failure.id, "message": failure.message}
+
+            text = json.dumps(result) if result is not None else ""
+
+        sent["Content-Type"] = "application/json"
+
+        return Response(status, sent, text)
+
+    def route(self, method, path, url, params, body):
+        """ Status and body from the handler for a path """
+
+        allowed = False
+
+        for route_method, pattern, name in self.ROUTES:
+
+            match = re.match("^%s$" % pattern, path)
+
+            if match is None:
+                continue
+
+            if route_method == method:
+                return getattr(self, name)(url, params, body, *match.groups())
+
+            allowed = True
+
+        if allowed:
+            raise self.Failure(405, "method_not_allowed", "Method Not Allowed")
+
+        raise self.Failure(404, "not_found", "The resource you were accessing could not be found.")
+
+    # Account and Keys
+
+    def account(self, url, params, body):
+        """ The account """
+
+        return 200, {"account": {
+            "droplet_limit": 25, "floating_ip_limit": 5, "email": "fake@example.com",
+            "uuid": "b6fr89dbf6d9156cace5f3c78dc9851d957381ef", "email_verified": True,
+            "status": "active", "status_message": ""
+        }}
+
+    def ssh_key(self, id_fingerprint):
+        """ Key by id or fingerprint """
+
+        for key in self.ssh_keys.values():
+            if str(key["id"]) == id_fingerprint or key["fingerprint"] == id_fingerprint:
+                return key
+
+        raise self.Failure(404, "not_found", "The resource you were accessing could not be found.")
+
+    def ssh_key_list(self, url, params, body):
+        """ Every key """
+
+        return self.paged(url, params, "ssh_keys", list(self.ssh_keys.values()))
+
+    def ssh_key_create(self, url, params, body):
+        """ Adds a key """
+
+        self.required(body, "name", "public_key")
+
+        digest = hashlib.md5(body["public_key"].encode()).hexdigest()
+
+        id = self.ident()
+        key = self.ssh_keys[id] = {
+            "id": id, "name": body["name"], "public_key": body["public_key"],
+            "fingerprint": ":".join(digest[index:index + 2] for index in range(0, 32, 2))
+        }
+
+        return 201, {"ssh_key": key}
+
+    def ssh_key_info(self, url, params, body, id_fingerprint):
+        """ A key """
+
+        return 200, {"ssh_key": self.ssh_key(id_fingerprint)}
+
+    def ssh_key_update(self, url, params, body, id_fingerprint):
+        """ Renames a key """
+
+        key = self.ssh_key(id_fingerprint)
+        key.update({"name": body["name"]} if body and "name" in body else {})
+
+        return 200, {"ssh_key": key}
+
+    def ssh_key_destroy(self, url, params, body, id_fingerprint):
+        """ Removes a key """
+
+        del self.ssh_keys[self.ssh_key(id_fingerprint)["id"]]
+
+        return 204, None
+
+    # Actions
+
+    def action_list(self, url, params, body):
+        """ Every Action, newest first """
+
+        return self.paged(url, params, "actions", [
+            action for id, action in sorted(self.actions.items(), reverse=True)
+        ])
+
+    def action_info(self, url, params, body, id):
+        """ An Action """
+
+        return 200, {"action": self.found(self.actions, int(id), "action")}
+
+    # Certificates
+
+    def certificate_list(self, url, params, body):
+        """ Every certificate """
+
+        return self.paged(url, params, "certificates", list(self.certificates.values()))
+
+    def certificate_create(self, url, params, body):
+        """ Uploads a certificate """
+
+        self.required(body, "name", "private_key", "leaf_certificate")
+
+        id = self.uuid()
+        certificate = self.certificates[id] = {
+            "id": id, "name": body["name"], "not_after": self.stamp(time.time() + 90 * 86400),
+            "sha1_fingerprint": hashlib.sha1(body["leaf_certificate"].encode()).hexdigest(),
+            "created_at": self.stamp()
+        }
+
+        return 201, {"certificate": certificate}
+
+    def certificate_info(self, url, params, body, id):
+        """ A certificate """
+
+        return 200, {"certificate": self.found(self.certificates, id, "certificate")}
+
+    def certificate_destroy(self, url, params, body, id):
+        """ Removes a certificate """
+
+        del self.certificates[self.found(self.certificates, id, "certificate")["id"]]
+
+        return 204, None
+
+    # Domains and Records
+
+    def domain_list(self, url, params, body):
+        """ Every domain """
+
+        return self.paged(url, params, "domains", list(self.domains.values()))
+
+    def domain_create(self, url, params, body):
+        """ Adds a domain, with NS records and an A record for its IP """
+
+        self.required(body, "name", "ip_address")
+
+        if body["name"] in self.domains:
+            raise self.Failure(422, "unprocessable_entity", "Name already exists")
+
+        domain = self.domains[body["name"]] = {"name": body["name"], "ttl": 1800, "zone_file": ""}
+        self.records[body["name"]] = {}
+
+        for type, data in [
+            ("NS", "ns1.digitalocean.com"), ("NS", "ns2.digitalocean.com"),
+            ("NS", "ns3.digitalocean.com"), ("A", body["ip_address"])
+        ]:
+            self.record_create(None, {}, {"type": type, "name": "@", "data": data}, body["name"])
+
+        return 201, {"domain": domain}
+
+    def domain_info(self, url, params, body, name):
+        """ A domain """
+
+        return 200, {"domain": self.found(self.domains, name, "domain")}
+
+    def domain_destroy(self, url, params, body, name):
+        """ Removes a domain and its records """
+
+        self.found(self.domains, name, "domain")
+
+        del self.domains[name]
+        del self.records[name]
+
+        return 204, None
+
+    def record_list(self, url, params, body, name):
+        """ Every record of a domain """
+
+        self.found(self.domains, name, "domain")
+
+        return self.paged(url, params, "domain_records", list(self.records[name].values()))
+
+    def record_create(self, url, params, body, name):
+        """ Adds a record to a domain """
+
+        self.found(self.domains, name, "domain")
+        self.required(body, "type")
+
+        id = self.ident()
+        record = self.records[name][id] = {
+            "id": id, "type": body["type"], "name": body.get("name"), "data": body.get("data"),
+            "priority": body.get("priority"), "port": body.get("port"),
+            "ttl": body.get("ttl", 1800), "weight": body.get("weight")
+        }
+
+        return 201, {"domain_record": record}
+
+    def record_info(self, url, params, body, name, id):
+        """ A record of a domain """
+
+        self.found(self.domains, name, "domain")
+
+        return 200, {"domain_record": self.found(self.records[name], int(id), "domain record")}
+
+    def record_update(self, url, params, body, name, id):
+        """ Changes a record of a domain """
+
+        self.found(self.domains, name, "domain")
+
+        record = self.found(self.records[name], int(id), "domain record")
+        record.update({key: value for key, value in (body or {}).items() if key in record})
+
+        return 200, {"domain_record": record}
+
+    def record_destroy(self, url, params, body, name, id):
+        """ Removes a record from a domain """
+
+        self.found(self.domains, name, "domain")
+
+        del self.records[name][self.found(self.records[name], int(id), "domain record")["id"]]
+
+        return 204, None
+
+    # Droplets
+
+    def droplet(self, id):
+        """ A Droplet by id """
+
+        return self.found(self.droplets, int(id), "droplet")
+
+    def tagged(self, tag_name):
+        """ Droplets with a tag """
+
+        return [droplet for droplet in self.droplets.values() if tag_name in droplet["tags"]]
+
+    def address(self, prefix):
+        """ Next address in a /16 """
+
+        serial = self.ident()
+
+        return "%s.%s.%s" % (prefix, serial // 256 % 256, serial % 256)
+
+    def droplet_list(self, url, params, body):
+        """ Every Droplet, or those with a tag """
+
+        if "tag_name" in params:
+            droplets = self.tagged(params["tag_name"])
+        else:
+            droplets = list(self.droplets.values())
+
+        return self.paged(url, params, "droplets", droplets)
+
+    def droplet_create(self, url, params, body):
+        """ Makes a Droplet, or one for each of names, new until its create Action completes """
+
+        self.required(body, "region", "size", "image")
+
+        if not body.get("name") and not body.get("names"):
+            raise self.Failure(422, "unprocessable_entity", "name is required")
+
+        if len(body.get("names") or []) > 10:
+            raise self.Failure(
+                422, "unprocessable_entity", "names can have at most 10 Droplet names"
+            )
+
+        region = self.region(body["region"])
+        size = self.size(body["size"])
+        image = self.image(str(body["image"]))
+
+        droplets = []
+
+        for name in body.get("names") or [body["name"]]:
+
+            id = self.ident()
+
+            droplet = self.droplets[id] = {
+                "id": id, "name": name, "memory": size["memory"], "vcpus": size["vcpus"],
+                "disk": size["disk"], "locked": False, "status": "new",
+                "created_at": self.stamp(), "features": [], "backup_ids": [],
+                "snapshot_ids": [], "image": dict(image), "size": size, "size_slug": size["slug"],
+                "networks": {"v4": []}, "region": region, "kernel": None,
+                "tags": list(body.get("tags") or []), "volume_ids": list(body.get("volumes") or [])
+            }
+
+            for tag in droplet["tags"]:
+                self.tags.setdefault(tag, {"name": tag})
+
+            for volume_id in droplet["volume_ids"]:
+                self.found(self.volumes, volume_id, "volume")["droplet_ids"].append(id)
+
+            if body.get("backups"):
+                droplet["features"].append("backups")
+
+            def boot(droplet=droplet):
+                droplet["status"] = "active"
+                droplet["networks"]["v4"].append({
+                    "ip_address": self.address("104.131"), "netmask": "255.255.192.0",
+                    "gateway": "104.131.0.1", "type": "public"
+                })
+                if body.get("private_networking"):
+                    droplet["features"].append("private_networking")
+                    droplet["networks"]["v4"].append({
+                        "ip_address": self.address("10.132"), "netmask": "255.255.0.0",
+                        "gateway": "10.132.0.1", "type": "private"
+                    })
+                if body.get("ipv6"):
+                    droplet["features"].append("ipv6")
+                    droplet["networks"]["v6"] = [{
+                        "ip_address": "2604:a880:0:1010::%x" % droplet["id"], "netmask": 64,
+                        "gateway": "2604:a880:0:1010::1", "type": "public"
+                    }]
+
+            self.act("create", "droplet", id, region["slug"], boot)
+
+            droplets.append(dict(droplet))
+
+        if body.get("names"):
+            return 202, {"droplets": droplets}
+
+        return 202, {"droplet": droplets[0]}
+
+    def droplet_info(self, url, params, body, id):
+        """ A Droplet """
+
+        return 200, {"droplet": self.droplet(id)}
+
+    def unplug(self, id):
+        """ Lets go of a Droplet going away, everything attached to it let go too """
+
+        del self.droplets[id]
+
+        for volume in self.volumes.values():
+            if id in volume["droplet_ids"]:
+                volume["droplet_ids"].remove(id)
+
+        for floating_ip in self.floating_ips.values():
+            if floating_ip["droplet"] is not None and floating_ip["droplet"]["id"] == id:
+                floating_ip["droplet"] = None
+
+        for load_balancer in self.load_balancers.values():
+            if id in load_balancer["droplet_ids"]:
+                load_balancer["droplet_ids"].remove(id)
+
+    def droplet_destroy(self, url, params, body, id):
+        """ Removes a Droplet """
+
+        self.unplug(self.droplet(id)["id"])
+
+        return 204, None
+
+    def droplet_destroy_tagged(self, url, params, body):
+        """ Removes every Droplet with a tag """
+
+        self.required(params, "tag_name")
+
+        for droplet in self.tagged(params["tag_name"]):
+            self.unplug(droplet["id"])
+
+        return 204, None
+
+    def droplet_done(self, droplet, body):
+        """ What a Droplet Action does once it completes """
+
+        type = body["type"]
+
+        def done():
+
+            if type in ("power_off", "shutdown"):
+                droplet["status"] = "off"
+            elif type in ("power_on", "reboot", "power_cycle"):
+                droplet["status"] = "active"
+            elif type == "rename":
+                droplet["name"] = body.get("name", droplet["name"])
+            elif type == "resize":
+                droplet["size"] = self.size(body.get("size", droplet["size_slug"]))
+                droplet["size_slug"] = droplet["size"]["slug"]
+                droplet["memory"] = droplet["size"]["memory"]
+                droplet["vcpus"] = droplet["size"]["vcpus"]
+                if body.get("disk"):
+                    droplet["disk"] = droplet["size"]["disk"]
+            elif type in ("rebuild", "restore"):
+                droplet["image"] = dict(self.image(str(body.get("image"))))
+            elif type == "change_kernel":
+                droplet["kernel"] = {"id": body.get("kernel")}
+            elif type in ("enable_backups", "disable_backups"):
+                features = [feature for feature in droplet["features"] if feature != "backups"]
+                droplet["features"] = features + (["backups"] if type == "enable_backups" else [])
+            elif type == "enable_ipv6" and "v6" not in droplet["networks"]:
+                droplet["features"].append("ipv6")
+                droplet["networks"]["v6"] = [{
+                    "ip_address": "2604:a880:0:1010::%x" % droplet["id"], "netmask": 64,
+                    "gateway": "2604:a880:0:1010::1", "type": "public"
+                }]
+            elif type == "enable_private_networking" and \
+                    "private_networking" not in droplet["features"]:
+                droplet["features"].append("private_networking")
+                droplet["networks"]["v4"].append({
+                    "ip_address": self.address("10.132"), "netmask": "255.255.0.0",
+                    "gateway": "10.132.0.1", "type": "private"
+                })
+            elif type == "snapshot":
+                id = self.ident()
+                self.images[id] = {
+                    "id": id, "name": body.get("name") or "%s-snapshot" % droplet["name"],
+                    "distribution": droplet["image"].get("distribution"), "slug": None,
+                    "public": False, "regions": [droplet["region"]["slug"]],
+                    "created_at": self.stamp(), "type": "snapshot",
+                    "min_disk_size": droplet["disk"], "size_gigabytes": 1.0,
+                    "droplet_id": droplet["id"]
+                }
+                droplet["snapshot_ids"].append(id)
+
+        return done
+
+    def droplet_action(self, url, params, body, id):
+        """ Starts an Action on a Droplet """
+
+        droplet = self.droplet(id)
+        self.required(body, "type")
+
+        return 201, {"action": self.act(
+            body["type"], "droplet", droplet["id"], droplet["region"]["slug"],
+            self.droplet_done(droplet, body)
+        )}
+
+    def droplet_action_tagged(self, url, params, body):
+        """ Starts an Action on every Droplet with a tag """
+
+        self.required(params, "tag_name")
+        self.required(body, "type")
+
+        return 201, {"actions": [
+            self.act(
+                body["type"], "droplet", droplet["id"], droplet["region"]["slug"],
+                self.droplet_done(droplet, body)
+            )
+            for droplet in self.tagged(params["tag_name"])
+        ]}
+
+    def droplet_action_list(self, url, params, body, id):
+        """ Actions on a Droplet """
+
+        return self.paged(url, params, "actions", self.acted("droplet", self.droplet(id)["id"]))
+
+    def droplet_action_info(self, url, params, body, id, action_id):
+        """ An Action on a Droplet """
+
+        return self.action_of("droplet", self.droplet(id)["id"], action_id)
+
+    def droplet_snapshot_list(self, url, params, body, id):
+        """ Snapshots of a Droplet """
+
+        droplet = self.droplet(id)
+
+        return self.paged(url, params, "snapshots", [
+            self.images[image_id] for image_id in droplet["snapshot_ids"]
+            if image_id in self.images
+        ])
+
+    def droplet_empty(self, url, params, body, id, kind):
+        """ Neighbors, backups and kernels, of which there are none """
+
+        self.droplet(id)
+
+        return self.paged(url, params, "droplets" if kind == "neighbors" else kind, [])
+
+    def neighbor_list(self, url, params, body):
+        """ Droplets sharing hardware, of which there are none """
+
+        return self.paged(url, params, "neighbors", [])
+
+    # Floating IPs
+
+    def floating_ip(self, ip):
+        """ A Floating IP by address """
+
+        return self.found(self.floating_ips, ip, "floating ip")
+
+    def floating_ip_list(self, url, params, body):
+        """ Every Floating IP """
+
+        return self.paged(url, params, "floating_ips", list(self.floating_ips.values()))
+
+    def floating_ip_create(self, url, params, body):
+        """ Reserves a Floating IP, in a region or assigned to a Droplet """
+
+        if not body or (not body.get("droplet_id") and not body.get("region")):
+            raise self.Failure(422, "unprocessable_entity", "droplet_id or region is required")
+
+        ip = self.address("45.55")
+
+        if body.get("droplet_id"):
+            droplet = self.droplet(body["droplet_id"])
+            floating_ip = {"ip": ip, "region": droplet["region"], "droplet": droplet}
+        else:
+            floating_ip = {"ip": ip, "region": self.region(body["region"]), "droplet": None}
+
+        self.floating_ips[ip] = floating_ip
+
+        return 202, {"floating_ip": floating_ip}
+
+    def floating_ip_info(self, url, params, body, ip):
+        """ A Floating IP """
+
+        return 200, {"floating_ip": self.floating_ip(ip)}
+
+    def floating_ip_destroy(self, url, params, body, ip):
+        """ Releases a Floating IP """
+
+        del self.floating_ips[self.floating_ip(ip)["ip"]]
+
+        return 204, None
+
+    def floating_ip_action(self, url, params, body, ip):
+        """ Assigns a Floating IP to a Droplet, or unassigns it """
+
+        floating_ip = self.floating_ip(ip)
+        self.required(body, "type")
+
+        if body["type"] == "assign":
+            self.required(body, "droplet_id")
+            droplet = self.droplet(body["droplet_id"])
+        else:
+            droplet = None
+
+        def done():
+            floating_ip["droplet"] = droplet
+
+        return 201, {"action": self.act(
+            body["type"], "floating_ip", int(ipaddress.ip_address(ip)),
+            floating_ip["region"]["slug"], done
+        )}
+
+    def floating_ip_action_list(self, url, params, body, ip):
+        """ Actions on a Floating IP """
+
+        self.floating_ip(ip)
+
+        return self.paged(
+            url, params, "actions", self.acted("floating_ip", int(ipaddress.ip_address(ip)))
+        )
+
+    def floating_ip_action_info(self, url, params, body, ip, action_id):
+        """ An Action on a Floating IP """
+
+        self.floating_ip(ip)
+
+        return self.action_of("floating_ip", int(ipaddress.ip_address(ip)), action_id)
+
+    # Images
+
+    def image(self, id_slug):
+        """ An Image by id or slug """
+
+        for image in self.images.values():
+            if str(image["id"]) == id_slug or image["slug"] == id_slug:
+                return image
+
+        raise self.Failure(404, "not_found", "The image you requested could not be found.")
+
+    def image_list(self, url, params, body):
+        """ Every Image, or those of a type, or the private ones """
+
+        images = list(self.images.values())
+
+        if params.get("type") == "distribution":
+            images = [image for image in images if image["distribution"] and image["public"]]
+        elif params.get("type") == "application":
+            images = [image for image in images if image.get("application")]
+
+        if params.get("private") == "true":
+            images = [image for image in images if not image["public"]]
+
+        return self.paged(url, params, "images", images)
+
+    def image_info(self, url, params, body, id_slug):
+        """ An Image """
+
+        return 200, {"image": self.image(id_slug)}
+
+    def image_update(self, url, params, body, id):
+        """ Renames an Image """
+
+        image = self.image(id)
+        image.update({"name": body["name"]} if body and "name" in body else {})
+
+        return 200, {"image": image}
+
+    def image_destroy(self, url, params, body, id):
+        """ Removes an Image """
+
+        del self.images[self.image(id)["id"]]
+
+        return 204, None
+
+    def image_action(self, url, params, body, id):
+        """ Transfers an Image to a region, or converts it to a snapshot """
+
+        image = self.image(id)
+        self.required(body, "type")
+
+        def done():
+            if body["type"] == "transfer" and body.get("region") not in image["regions"]:
+                image["regions"].append(body.get("region"))
+            elif body["type"] == "convert":
+                image["type"] = "snapshot"
+
+        return 201, {"action": self.act(
+            body["type"], "image", image["id"], body.get("region"), done
+        )}
+
+    def image_action_list(self, url, params, body, id):
+        """ Actions on an Image """
+
+        return self.paged(url, params, "actions", self.acted("image", self.image(id)["id"]))
+
+    def image_action_info(self, url, params, body, id, action_id):
+        """ An Action on an Image """
+
+        return self.action_of("image", self.image(id)["id"], action_id)
+
+    # Load Balancers
+
+    def load_balancer(self, id):
+        """ A Load Balancer by id """
+
+        return self.found(self.load_balancers, id, "load balancer")
+
+    def load_balancer_list(self, url, params, body):
+        """ Every Load Balancer """
+
+        return self.paged(url, params, "load_balancers", list(self.load_balancers.values()))
+
+    def load_balancer_create(self, url, params, body):
+        """ Makes a Load Balancer, without an IP until it's had its time """
+
+        self.required(body, "name", "region", "forwarding_rules")
+
+        if body.get("tag"):
+            droplet_ids = [droplet["id"] for droplet in self.tagged(body["tag"])]
+        else:
+            droplet_ids = [self.droplet(id)["id"] for id in body.get("droplet_ids") or []]
+
+        id = self.uuid()
+
+        load_balancer = self.load_balancers[id] = {
+            "id": id, "name": body["name"], "ip": "", "status": "new",
+            "algorithm": body.get("algorithm", "round_robin"), "created_at": self.stamp(),
+            "forwarding_rules": list(body["forwarding_rules"]),
+            "health_check": body.get("health_check", {}),
+            "sticky_sessions": body.get("sticky_sessions", {"type": "none"}),
+            "region": self.region(body["region"]), "tag": body.get("tag", ""),
+            "droplet_ids": droplet_ids,
+            "redirect_http_to_https": body.get("redirect_http_to_https", False)
+        }
+
+        def up():
+            load_balancer["ip"] = self.address("104.236")
+            load_balancer["status"] = "active"
+
+        self.soon(up)
+
+        return 202, {"load_balancer": dict(load_balancer)}
+
+    def load_balancer_info(self, url, params, body, id):
+        """ A Load Balancer """
+
+        return 200, {"load_balancer": self.load_balancer(id)}
+
+    def load_balancer_update(self, url, params, body, id):
+        """ Changes a Load Balancer """
+
+        load_balancer = self.load_balancer(id)
+        self.required(body, "name", "region", "forwarding_rules")
+
+        load_balancer.update({
+            key: value for key, value in body.items()
+            if key in load_balancer and key not in ("id", "ip", "status", "created_at", "region")
+        })
+
+        return 200, {"load_balancer": load_balancer}
+
+    def load_balancer_destroy(self, url, params, body, id):
+        """ Removes a Load Balancer """
+
+        del self.load_balancers[self.load_balancer(id)["id"]]
+
+        return 204, None
+
+    def load_balancer_add(self, url, params, body, id, kind):
+        """ Adds Droplets or forwarding rules to a Load Balancer """
+
+        load_balancer = self.load_balancer(id)
+        key = "droplet_ids" if kind == "droplets" else "forwarding_rules"
+        self.required(body, key)
+
+        for item in body[key]:
+            if key == "droplet_ids":
+                self.droplet(item)
+            if item not in load_balancer[key]:
+                load_balancer[key].append(item)
+
+        return 204, None
+
+    def load_balancer_remove(self, url, params, body, id, kind):
+        """ Removes Droplets or forwarding rules from a Load Balancer """
+
+        load_balancer = self.load_balancer(id)
+        key = "droplet_ids" if kind == "droplets" else "forwarding_rules"
+        self.required(body, key)
+
+        load_balancer[key] = [item for item in load_balancer[key] if item not in body[key]]
+
+        return 204, None
+
+    # Regions and Sizes
+
+    def region_list(self, url, params, body):
+        """ Every region """
+
+        return self.paged(url, params, "regions", self.REGIONS)
+
+    def size_list(self, url, params, body):
+        """ Every size """
+
+        return self.paged(url, params, "sizes", self.SIZES)
+
+    # Snapshots
+
+    def snapshot_all(self):
+        """ Snapshots of Droplets and Volumes both """
+
+        droplets = [
+            {
+                "id": str(image["id"]), "name": image["name"], "regions": image["regions"],
+                "created_at": image["created_at"], "resource_id": str(image["droplet_id"]),
+                "resource_type": "droplet", "min_disk_size": image["min_disk_size"],
+                "size_gigabytes": image["size_gigabytes"]
+            }
+            for image in self.images.values() if "droplet_id" in image
+        ]
+
+        return droplets + list(self.snapshots.values())
+
+    def snapshot(self, id):
+        """ A snapshot of a Droplet or Volume by id """
+
+        for snapshot in self.snapshot_all():
+            if snapshot["id"] == id:
+                return snapshot
+
+        raise self.Failure(404, "not_found", "The snapshot you requested could not be found.")
+
+    def snapshot_list(self, url, params, body):
+        """ Every snapshot, or those of Droplets or Volumes """
+
+        snapshots = self.snapshot_all()
+
+        if "resource_type" in params:
+            snapshots = [
+                snapshot for snapshot in snapshots
+                if snapshot["resource_type"] == params["resource_type"]
+            ]
+
+        return self.paged(url, params, "snapshots", snapshots)
+
+    def snapshot_info(self, url, params, body, id):
+        """ A snapshot """
+
+        return 200, {"snapshot": self.snapshot(id)}
+
+    def snapshot_destroy(self, url, params, body, id):
+        """ Removes a snapshot """
+
+        snapshot = self.snapshot(id)
+
+        if snapshot["resource_type"] == "droplet":
+            del self.images[int(id)]
+        else:
+            del self.snapshots[id]
+
+        return 204, None
+
+    # Tags
+
+    def tag(self, name):
+        """ A tag with what it's on counted """
+
+        tag = self.found(self.tags, name, "tag")
+        droplets = self.tagged(name)
+
+        return dict(tag, resources={"droplets": {
+            "count": len(droplets), "last_tagged": droplets[-1] if droplets else None
+        }})
+
+    def tag_list(self, url, params, body):
+        """ Every tag """
+
+        return self.paged(url, params, "tags", [self.tag(name) for name in self.tags])
+
+    def tag_create(self, url, params, body):
+        """ Makes a tag """
+
+        self.required(body, "name")
+
+        self.tags.setdefault(body["name"], {"name": body["name"]})
+
+        return 201, {"tag": self.tag(body["name"])}
+
+    def tag_info(self, url, params, body, name):
+        """ A tag """
+
+        return 200, {"tag": self.tag(name)}
+
+    def tag_update(self, url, params, body, name):
+        """ Renames a tag, and on everything it's on """
+
+        self.found(self.tags, name, "tag")
+        self.required(body, "name")
+
+        del self.tags[name]
+        self.tags[body["name"]] = {"name": body["name"]}
+
+        for droplet in self.droplets.values():
+            droplet["tags"] = [body["name"] if tag == name else tag for tag in droplet["tags"]]
+
+        return 200, {"tag": self.tag(body["name"])}
+
+    def tag_destroy(self, url, params, body, name):
+        """ Removes a tag, and from everything it's on """
+
+        self.found(self.tags, name, "tag")
+
+        del self.tags[name]
+
+        for droplet in self.droplets.values():
+            droplet["tags"] = [tag for tag in droplet["tags"] if tag != name]
+
+        return 204, None
+
+    def tag_attach(self, url, params, body, name):
+        """ Tags Droplets """
+
+        self.found(self.tags, name, "tag")
+        self.required(body, "resources")
+
+        for resource in body["resources"]:
+            droplet = self.droplet(resource["resource_id"])
+            if name not in droplet["tags"]:
+                droplet["tags"].append(name)
+
+        return 204, None
+
+    def tag_detach(self, url, params, body, name):
+        """ Untags Droplets """
+
+        self.found(self.tags, name, "tag")
+        self.required(body, "resources")
+
+        for resource in body["resources"]:
+            droplet = self.droplet(resource["resource_id"])
+            droplet["tags"] = [tag for tag in droplet["tags"] if tag != name]
+
+        return 204, None
+
+    # Volumes
+
+    def volume(self, id):
+        """ A Volume by id """
+
+        return self.found(self.volumes, id, "volume")
+
+    def named(self, name, region):
+        """ A Volume by name and region """
+
+        for volume in self.volumes.values():
+            if volume["name"] == name and volume["region"]["slug"] == region:
+                return volume
+
+        raise self.Failure(404, "not_found", "The volume you requested could not be found.")
+
+    def volume_list(self, url, params, body):
+        """ Every Volume, or those in a region, or of a name """
+
+        volumes = [
+            volume for volume in self.volumes.values()
+            if params.get("region", volume["region"]["slug"]) == volume["region"]["slug"] and
+            params.get("name", volume["name"]) == volume["name"]
+        ]
+
+        return self.paged(url, params, "volumes", volumes)
+
+    def volume_create(self, url, params, body):
+        """ Makes a Volume """
+
+        self.required(body, "name", "region")
+
+        if not body.get("size_gigabytes") and not body.get("snapshot_id"):
+            raise self.Failure(422, "unprocessable_entity", "size_gigabytes is required")
+
+        try:
+            self.named(body["name"], body["region"])
+        except self.Failure:
+            pass
+        else:
+            raise self.Failure(409, "conflict", "a volume with that name already exists")
+
+        id = self.uuid()
+
+        volume = self.volumes[id] = {
+            "id": id, "region": self.region(body["region"]), "droplet_ids": [],
+            "name": body["name"], "description": body.get("description", ""),
+            "size_gigabytes": body.get("size_gigabytes") or 10, "created_at": self.stamp()
+        }
+
+        return 201, {"volume": volume}
+
+    def volume_info(self, url, params, body, id):
+        """ A Volume """
+
+        return 200, {"volume": self.volume(id)}
+
+    def volume_release(self, volume):
+        """ Removes a Volume, unless it's attached """
+
+        if volume["droplet_ids"]:
+            raise self.Failure(409, "conflict", "volume is attached to a droplet")
+
+        del self.volumes[volume["id"]]
+
+        return 204, None
+
+    def volume_destroy(self, url, params, body, id):
+        """ Removes a Volume by id """
+
+        return self.volume_release(self.volume(id))
+
+    def volume_destroy_named(self, url, params, body):
+        """ Removes a Volume by name and region """
+
+        self.required(params, "name", "region")
+
+        return self.volume_release(self.named(params["name"], params["region"]))
+
+    def volume_act(self, volume, body):
+        """ Attaches, detaches or resizes a Volume """
+
+        self.required(body, "type")
+
+        type = body["type"]
+
+        if type in ("attach", "detach"):
+            self.required(body, "droplet_id")
+            droplet = self.droplet(body["droplet_id"])
+
+        def done():
+            if type == "attach" and droplet["id"] not in volume["droplet_ids"]:
+                volume["droplet_ids"].append(droplet["id"])
+                droplet["volume_ids"].append(volume["id"])
+            elif type == "detach" and droplet["id"] in volume["droplet_ids"]:
+                volume["droplet_ids"].remove(droplet["id"])
+                droplet["volume_ids"].remove(volume["id"])
+            elif type == "resize":
+                volume["size_gigabytes"] = body.get("size_gigabytes", volume["size_gigabytes"])
+
+        return 202, {"action": self.act(
+            type, "volume", volume["id"], volume["region"]["slug"], done
+        )}
+
+    def volume_action(self, url, params, body, id):
+        """ Starts an Action on a Volume by id """
+
+        return self.volume_act(self.volume(id), body)
+
+    def volume_action_named(self, url, params, body):
+        """ Starts an Action on a Volume by name and region """
+
+        self.required(body, "volume_name", "region")
+
+        return self.volume_act(self.named(body["volume_name"], body["region"]), body)
+
+    def volume_action_list(self, url, params, body, id):
+        """ Actions on a Volume """
+
+        return self.paged(url, params, "actions", self.acted("volume", self.volume(id)["id"]))
+
+    def volume_action_info(self, url, params, body, id, action_id):
+        """ An Action on a Volume """
+
+        return self.action_of("volume", self.volume(id)["id"], action_id)
+
+    def volume_snapshot_list(self, url, params, body, id):
+        """ Snapshots of a Volume """
+
+        volume = self.volume(id)
+
+        return self.paged(url, params, "snapshots", [
+            snapshot for snapshot in self.snapshots.values()
+            if snapshot["resource_id"] == volume["id"]
+        ])
+
+    def volume_snapshot_create(self, url, params, body, id):
+        """ Snapshots a Volume """
+
+        volume = self.volume(id)
+        self.required(body, "name")
+
+        snapshot_id = self.uuid()
+
+        snapshot = self.snapshots[snapshot_id] = {
+            "id": snapshot_id, "name": body["name"], "regions": [volume["region"]["slug"]],
+            "created_at": self.stamp(), "resource_id": volume["id"], "resource_type": "volume",
+            "min_disk_size": volume["size_gigabytes"], "size_gigabytes": 0
+        }
+
+        return 201, {"snapshot": snapshot}
@@ -0,0 +1,102 @@
+"""This holds the FakeServer class."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from .FakeAPI import FakeAPI
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """ Hands every call to the server's FakeAPI, keeping connections alive like the API """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        """ Keeps quiet """
+
+    def answer(self):
+        """ Reads the call, has the FakeAPI answer it and sends back what it says """
+
+        length = int(self.headers.get("Content-Length", 0))
+        data = self.rfile.read(length).decode() if length else None
+
+        response = self.server.api.handle(
+            self.command, "http://%s%s" % (self.headers.get("Host", "localhost"), self.path),
+            data=data, headers=dict(self.headers)
+        )
+
+        text = response.text.encode()
+
+        self.send_response(response.status_code)
+
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(text)))
+        self.end_headers()
+        self.wfile.write(text)
+
+    do_GET = do_POST = do_PUT = do_DELETE = answer
+
+
+class FakeServer(ThreadingMixIn, HTTPServer):
+    """
+    description:
+        Serves a FakeAPI over HTTP on a local port, a thread per connection, so a DO can be
+        pointed at it and load tested offline.  Point a DO's url at the server's url.
+
+    in:
+        - api - FakeAPI - What answers the calls.  Defaults to FakeAPI()
+        - host - string - Address to listen on
+        - port - number - Port to listen on, 0 for any free one
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, api=None, host="127.0.0.1", port=0):
+        """Bind the port, calls are answered once started."""
+        HTTPServer.__init__(self, (host, port), FakeHandler)
+
+        self.api = api if api is not None else FakeAPI()
+        self.thread = None
+
+    @property
+    def url(self):
+        """ URL to give a DO """
+
+        return "http://%s:%s/v2" % self.server_address[:2]
+
+    def start(self):
+        """
+        description: Answer calls from a background thread
+
+        out: The server, to chain
+        """
+
+        self.thread = threading.Thread(target=self.serve_forever, name="doboto-fake-server")
+        self.thread.daemon = True
+        self.thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        description: Stop answering calls and let go of the port
+        """
+
+        self.shutdown()
+        self.server_close()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        """Start on entering a with."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Stop on leaving a with."""
+        self.stop()
@@ -0,0 +1,29 @@
+"""This holds the FakeTransport class."""
+
+from .Transport import Transport
+from .FakeAPI import FakeAPI
+
+
+class FakeTransport(Transport):
+    """
+    description:
+        Transport answering calls from a FakeAPI in the same process, without sockets, for
+        simulations and tests that need an API but not the network.  Pacing, retries, caching and
+        sharing calls in flight still happen as they would over the wire, so pass
+        rate_limiter=False to run as fast as the FakeAPI answers.
+
+    in:
+        - api - FakeAPI - What answers the calls.  Defaults to FakeAPI()
+        - everything else - Same as Transport
+    """
+
+    def __init__(self, api=None, *args, **kwargs):
+        """Keep the FakeAPI to answer with."""
+        super(FakeTransport, self).__init__(*args, **kwargs)
+
+        self.api = api if api is not None else FakeAPI()
+
+    def send(self, method, url, params=None, data=None, headers=None):
+        """ Single call answered by the FakeAPI """
+
+        return self.api.handle(method, url, params=params, data=data, headers=headers)
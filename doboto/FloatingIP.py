@@ -28,25 +28,39 @@ class FloatingIP(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#floating-ips
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for floating ip interaction.
         """
-        super(FloatingIP, self).__init__(token, agent)
+        super(FloatingIP, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "{}/floating_ips".format(url)
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Floating IPs
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out:
             A list of Floating IP dict's:
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-floating-ips
         """  # nopep8
 
-        return self.pages(self.uri, "floating_ips")
+        return self.pages(self.uri, "floating_ips", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Floating IPs, from a single small page rather than listing them
+
+        out: The number of Floating IPs
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-floating-ips
+        """  # nopep8
+
+        return self.total(self.uri, "floating_ips")
 
     def create(self, droplet_id=None, region=None):
         """
@@ -112,7 +126,8 @@ class FloatingIP(Endpoint):
             - ip - string - The public IP address of the Floating IP.
             - droplet_id - int - The ID of Droplet that the Floating IP will be assigned to.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -135,7 +150,8 @@ class FloatingIP(Endpoint):
         in:
             - ip - string - The public IP address of the Floating IP.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -151,15 +167,17 @@ class FloatingIP(Endpoint):
             wait, poll, timeout
         )
 
-    def action_list(self, ip):
+    def action_list(self, ip, stream=False):
         """
         description: List all actions for a Floating IP
 
         in:
             - ip - string - The public IP address of the Floating IP.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Action data structures
 
@@ -167,7 +185,7 @@ class FloatingIP(Endpoint):
         """  # nopep8
         uri = self.uri + "/%s/actions" % ip
 
-        return self.pages(uri, "actions")
+        return self.pages(uri, "actions", stream=stream)
 
     def action_info(self, ip, action_id):
         """
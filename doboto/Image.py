@@ -41,21 +41,22 @@ class Image(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#images
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for floating ip interaction.
         """
-        super(Image, self).__init__(token, agent)
+        super(Image, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/images" % url
 
-    def list(self, type=None, private=None):
+    def list(self, type=None, private=None, stream=False):
         """
         description: List all, distribution, application, or user images.
 
         in:
             - type - string - Can be "distribution" or "application" for images thereof.
             - private - boolean - Set to True for user images
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Image data structures
 
@@ -74,7 +75,30 @@ class Image(Endpoint):
         if private is not None:
             params["private"] = private
 
-        return self.pages(self.uri, "images", params=params)
+        return self.pages(self.uri, "images", params=params, stream=stream)
+
+    def count(self, type=None, private=None):
+        """
+        description: Count all, distribution, application, or user images, from a single small page
+
+        in:
+            - type - string - Can be "distribution" or "application" for images thereof.
+            - private - boolean - Set to True for user images
+
+        out: The number of Images
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-images
+        """  # nopep8
+
+        params = {}
+
+        if type is not None:
+            params["type"] = type
+
+        if private is not None:
+            params["private"] = private
+
+        return self.total(self.uri, "images", params=params)
 
     def info(self, id_slug):
         """
@@ -132,7 +156,8 @@ class Image(Endpoint):
             - id - number - id of the Image
             - region - string - The region slug that represents the region target.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -154,7 +179,8 @@ class Image(Endpoint):
         in:
             - id - number - id of the Image
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -168,12 +194,13 @@ class Image(Endpoint):
             wait, poll, timeout
         )
 
-    def action_list(self, id):
+    def action_list(self, id, stream=False):
         """
         description: List all actions for an Image
 
         in:
             - id - number - id of the Image
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Action data structures
 
@@ -181,7 +208,7 @@ class Image(Endpoint):
         """  # nopep8
         uri = self.uri + "/%s/actions" % id
 
-        return self.pages(uri, "actions")
+        return self.pages(uri, "actions", stream=stream)
 
     def action_info(self, id, action_id):
         """
@@ -0,0 +1,238 @@
+"""This holds the Inventory class."""
+
+import ipaddress
+import threading
+from .Endpoint import Endpoint
+from .Cache import Cache
+from .exception import DOBOTONotFoundException
+
+
+class Inventory(object):
+    """
+    description:
+        Local snapshot of an account's Droplets, Volumes, private Images and Floating IPs, kept
+        current from the Action feed rather than by listing everything again.  The first sync
+        lists everything.  Every sync after reads the Actions newer than the last one it saw,
+        newest first, and retrieves only the resources those Actions touched, dropping any that
+        are gone.  Resources touched by Actions still in progress, including any among the newest
+        page of them when everything's listed, are retrieved again on every sync until those
+        Actions finish.  Nothing a sync reads is answered from a cache.
+
+        Changes that don't record an Action, like creating a Volume or renaming an Image, only
+        show up after a full sync.
+
+    in:
+        - do - DO - What to sync with
+        - kinds - list - Resource types to keep, any of "droplet", "volume", "image" and
+          "floating_ip".  Defaults to all of them
+    """
+
+    KINDS = ["droplet", "volume", "image", "floating_ip"]
+
+    HEAD = 200
+
+    def __init__(self, do, kinds=None):
+        """Nothing's kept until the first sync."""
+        self.do = do
+        self.kinds = kinds if kinds is not None else list(self.KINDS)
+
+        self.resources = {kind: {} for kind in self.kinds}
+        self.last = None
+        self.unfinished = {}
+
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def ident(kind, resource):
+        """ What a resource of a kind is retrieved by """
+
+        return resource["ip"] if kind == "floating_ip" else resource["id"]
+
+    @staticmethod
+    def touched(action):
+        """ Kind and id of the resource an Action touched, Floating IPs by their address """
+
+        kind = action.get("resource_type")
+        id = action.get("resource_id")
+
+        if kind == "floating_ip" and isinstance(id, int) and id:
+            id = str(ipaddress.ip_address(id))
+
+        return kind, id
+
+    def listing(self, kind):
+        """ Every resource of a kind """
+
+        if kind == "image":
+            return self.do.image.list(private=True)
+
+        return getattr(self.do, kind).list()
+
+    def fetch(self, touched):
+        """ Latest of a resource, by the kind and id an Action touched """
+
+        kind, id = touched
+
+        return getattr(self.do, kind).info(id)
+
+    def head(self):
+        """
+        Id of the newest Action, 0 if there are none, and those still in progress among the
+        newest HEAD of them, the first page of the feed
+        """
+
+        newest = 0
+        unfinished = {}
+
+        for count, action in enumerate(self.do.action.list(stream=True), 1):
+
+            newest = max(newest, action["id"])
+
+            if action["status"] == "in-progress":
+                unfinished[action["id"]] = self.touched(action)
+
+            if count >= self.HEAD:
+                break
+
+        return newest, unfinished
+
+    def load(self, kinds):
+        """ Lists every resource of the kinds given, all at once """
+
+        for kind, listing in zip(kinds, self.do.action.concurrently(self.listing, kinds)):
+
+            if isinstance(listing, Exception):
+                raise listing
+
+            self.resources[kind] = {
+                self.ident(kind, resource): resource for resource in listing
+            }
+
+    def full(self):
+        """
+        Lists everything, taking the newest Actions first so nothing after them is missed, and
+        those still in progress, along with any that were before, to check on next sync
+        """
+
+        last, unfinished = self.head()
+
+        self.load(self.kinds)
+
+        self.last = last
+        self.unfinished.update(unfinished)
+
+        return [(kind, id) for kind in self.kinds for id in self.resources[kind]]
+
+    def sync(self, full=False):
+        """
+        description: Bring the snapshot up to date
+
+        in:
+            - full - boolean - Whether to list everything again rather than reading the Action
+              feed.  The first sync always does
+
+        out: A list of (kind, id) pairs of the resources retrieved or dropped
+        """
+
+        with self.lock, Cache.fresh():
+
+            if full or self.last is None:
+                return self.full()
+
+            actions = []
+
+            for action in self.do.action.list(stream=True):
+
+                if action["id"] <= self.last:
+                    break
+
+                actions.append(action)
+
+            seen = set(action["id"] for action in actions)
+            still = [id for id in self.unfinished if id not in seen]
+
+            if still:
+                actions.extend(
+                    action for action in self.do.action.info_list(still)
+                    if not isinstance(action, Exception)
+                )
+
+            pairs = []
+            relist = []
+
+            for action in actions:
+
+                kind, id = self.touched(action)
+
+                if kind not in self.kinds:
+                    continue
+
+                if not id:
+                    if kind not in relist:
+                        relist.append(kind)
+                elif (kind, id) not in pairs:
+                    pairs.append((kind, id))
+
+            pairs = [(kind, id) for kind, id in pairs if kind not in relist]
+
+            for (kind, id), result in zip(pairs, self.do.action.concurrently(self.fetch, pairs)):
+
+                if isinstance(result, DOBOTONotFoundException):
+                    self.resources[kind].pop(id, None)
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    self.resources[kind][self.ident(kind, result)] = result
+
+            if relist:
+                self.load(relist)
+
+            self.unfinished = {
+                action["id"]: self.touched(action) for action in actions
+                if action["status"] == "in-progress"
+            }
+
+            if seen:
+                self.last = max(seen)
+
+            return pairs + [(kind, id) for kind in relist for id in self.resources[kind]]
+
+    def list(self, kind):
+        """
+        description: Every resource of a kind as of the last sync
+
+        in:
+            - kind - string - "droplet", "volume", "image" or "floating_ip"
+
+        out: A list of data structures
+        """
+
+        with self.lock:
+            return list(self.resources[kind].values())
+
+    def info(self, kind, id):
+        """
+        description: A resource as of the last sync
+
+        in:
+            - kind - string - "droplet", "volume", "image" or "floating_ip"
+            - id - number or string - The id of the resource, or the address of a Floating IP
+
+        out: A data structure, None if there's no such resource
+        """
+
+        with self.lock:
+            return self.resources[kind].get(id)
+
+    def index(self, kind, key="name"):
+        """
+        description: Resources of a kind by key as of the last sync, like present() uses
+
+        in:
+            - kind - string - "droplet", "volume", "image" or "floating_ip"
+            - key - string - Field to look resources up by
+
+        out: A dict of data structures by key
+        """
+
+        return Endpoint.index(self.list(kind), key)
@@ -0,0 +1,76 @@
+"""This holds the LearnedWait class."""
+
+import threading
+from collections import deque
+from .Wait import Wait
+from .BackoffWait import BackoffWait
+
+
+class LearnedWait(Wait):
+    """
+    description:
+        Wait strategy that learns how long each kind of thing takes, like reboot, snapshot,
+        resize or transfer actions, and schedules the first check near the median time it's taken
+        so far.  After that, or for a kind not seen yet, it checks as the fallback does.  Share one
+        instance across calls so it has something to learn from.
+
+    in:
+        - fallback - Wait - Strategy for kinds not seen yet and checks after the first.  Defaults
+          to BackoffWait()
+        - history - number - How many of the most recent times to keep per kind
+        - samples - number - How many times a kind needs before the median is used
+    """
+
+    def __init__(self, fallback=None, history=50, samples=3):
+        """Start with nothing learned."""
+        self.fallback = fallback if fallback is not None else BackoffWait()
+        self.history = history
+        self.samples = samples
+
+        self.durations = {}
+
+        self.lock = threading.Lock()
+
+    def median(self, kind):
+        """
+        Median seconds kind has taken, None if it hasn't been seen enough
+        """
+
+        with self.lock:
+            durations = sorted(self.durations.get(kind, ()))
+
+        if len(durations) < self.samples:
+            return None
+
+        middle = len(durations) // 2
+
+        if len(durations) % 2:
+            return durations[middle]
+
+        return (durations[middle - 1] + durations[middle]) / 2.0
+
+    def delay(self, attempt, kind=None):
+        """
+        Seconds to sleep before check number attempt (0 being the first) on something of kind
+        """
+
+        median = self.median(kind) if kind is not None else None
+
+        if median is None:
+            return self.fallback.delay(attempt, kind)
+
+        if attempt == 0:
+            return max(1, median)
+
+        return self.fallback.delay(attempt - 1, kind)
+
+    def record(self, kind, seconds):
+        """
+        Notes that something of kind took seconds to finish
+        """
+
+        if kind is None or seconds is None or seconds < 0:
+            return
+
+        with self.lock:
+            self.durations.setdefault(kind, deque(maxlen=self.history)).append(seconds)
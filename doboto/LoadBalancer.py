@@ -3,6 +3,7 @@
 import time
 import copy
 from .Endpoint import Endpoint
+from .Cache import Cache
 from .exception import DOBOTOPollingException
 
 
@@ -80,19 +81,22 @@ class LoadBalancer(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#load-balancers
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for load_balancer interaction.
         """
-        super(LoadBalancer, self).__init__(token, agent)
+        super(LoadBalancer, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/load_balancers" % url
         self.reports = "%s/reports" % url
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Load Balancers
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out:
             A list of Load Balancer data structures
 
@@ -100,7 +104,18 @@ class LoadBalancer(Endpoint):
 
         """  # nopep8
 
-        return self.pages(self.uri, "load_balancers")
+        return self.pages(self.uri, "load_balancers", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Load Balancers, from a single small page rather than listing them
+
+        out: The number of Load Balancers
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-load-balancers
+        """  # nopep8
+
+        return self.total(self.uri, "load_balancers")
 
     def create(self, attribs, wait=False, poll=5, timeout=300):
         """
@@ -125,7 +140,8 @@ class LoadBalancer(Endpoint):
                 - redirect_http_to_https - bool - A boolean value indicating whether HTTP requests
                   to the Load Balancer on port 80 will be redirected to HTTPS on port 443.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
         out: A Load Balancer data structure
 
@@ -139,17 +155,19 @@ class LoadBalancer(Endpoint):
         if not wait:
             return load_balancer
 
-        if poll < 1:
-            poll = 1
+        poll = self.waiting(poll)
 
         start_time = time.time()
+        attempt = 0
 
         while not load_balancer["ip"]:
 
-            time.sleep(poll)
+            time.sleep(poll.delay(attempt, "create_load_balancer"))
+            attempt += 1
 
             try:
-                load_balancer = self.info(load_balancer["id"])
+                with Cache.fresh():
+                    load_balancer = self.info(load_balancer["id"])
             except Exception as exception:
                 if time.time() - start_time > timeout:
                     raise DOBOTOPollingException(polling=load_balancer, error=exception)
@@ -157,6 +175,8 @@ class LoadBalancer(Endpoint):
             if time.time() - start_time > timeout:
                 raise DOBOTOPollingException(polling=load_balancer)
 
+        poll.record("create_load_balancer", time.time() - start_time)
+
         return load_balancer
 
     def present(self, attribs, wait=False, poll=5, timeout=300):
@@ -182,21 +202,16 @@ class LoadBalancer(Endpoint):
                 - redirect_http_to_https - bool - A boolean value indicating whether HTTP requests
                   to the Load Balancer on port 80 will be redirected to HTTPS on port 443.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: A tuple of two Load Balancer data structures (second is None if already present)
         """  # nopep8
 
-        load_balancers = self.list()
-
         if "name" in attribs:
 
-            existing = None
-            for load_balancer in load_balancers:
-                if attribs["name"] == load_balancer["name"]:
-                    existing = load_balancer
-                    break
+            existing = self.find_first(lambda item: item["name"] == attribs["name"])
 
             if existing is not None:
                 return (existing, None)
@@ -0,0 +1,137 @@
+"""This holds the RateLimiter class."""
+
+import time
+import asyncio
+import threading
+
+
+class RateLimiter(object):
+    """
+    description:
+        Paces the calls of a Transport or AsyncTransport so every endpoint of a DO, on every
+        thread or task, shares one budget.  Calls are spread out by a token bucket, and the budget
+        the API reports back in the RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset
+        headers is tracked so that once it's spent, calls sleep until it resets rather than fail.
+
+    in:
+        - rate - number - Calls per second the bucket refills at, None to not pace
+        - burst - number - Most calls that can go out back to back
+        - waits - number - Most times one call waits out a 429 before the 429 is returned
+    """
+
+    def __init__(self, rate=250 / 60.0, burst=250, waits=5):
+        """Start with a full bucket and no budget reported yet."""
+        self.rate = rate
+        self.burst = burst
+        self.waits = waits
+
+        self.tokens = float(burst)
+        self.updated = time.time()
+
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+
+        self.lock = threading.Lock()
+
+    def refill(self, now):
+        """
+        Adds tokens for the time passed, and forgets the reported budget once it's reset
+        """
+
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+
+        self.updated = now
+
+        if self.reset is not None and now >= self.reset:
+            self.remaining = None
+            self.reset = None
+
+    def take(self):
+        """
+        Takes a call from the budget if one can go out now, otherwise returns the seconds to wait
+        before trying again
+        """
+
+        with self.lock:
+
+            now = time.time()
+            self.refill(now)
+
+            if self.remaining is not None and self.remaining <= 0 and self.reset is not None:
+                return self.reset - now
+
+            if self.rate is None or self.tokens >= 1:
+                self.tokens -= 1
+                if self.remaining is not None:
+                    self.remaining -= 1
+                return None
+
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """
+        Blocks until a call can go out, then takes it from the budget
+        """
+
+        wait = self.take()
+
+        while wait is not None:
+            time.sleep(wait)
+            wait = self.take()
+
+    async def acquire_async(self):
+        """
+        Waits without blocking the event loop until a call can go out, then takes it from the
+        budget, what an AsyncTransport paces with
+        """
+
+        wait = self.take()
+
+        while wait is not None:
+            await asyncio.sleep(wait)
+            wait = self.take()
+
+    def update(self, headers):
+        """
+        Takes the budget reported by the API
+        """
+
+        with self.lock:
+
+            if "RateLimit-Limit" in headers:
+                self.limit = int(headers["RateLimit-Limit"])
+
+            if "RateLimit-Remaining" in headers:
+                self.remaining = int(headers["RateLimit-Remaining"])
+
+            if "RateLimit-Reset" in headers:
+                self.reset = int(headers["RateLimit-Reset"])
+
+    def exhausted(self, headers):
+        """
+        Marks the budget spent after a 429, until Retry-After in seconds, otherwise the reported
+        reset
+        """
+
+        with self.lock:
+
+            now = time.time()
+
+            self.remaining = 0
+            self.reset = None
+
+            if "Retry-After" in headers:
+                try:
+                    self.reset = now + float(headers["Retry-After"])
+                except ValueError:
+                    pass
+
+            if self.reset is None and "RateLimit-Reset" in headers:
+                self.reset = int(headers["RateLimit-Reset"])
+
+            if self.reset is None:
+                self.reset = now + 60
+
+            self.reset = max(self.reset, now + 1)
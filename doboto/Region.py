@@ -29,21 +29,35 @@ class Region(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#regions
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for floating ip interaction.
         """
-        super(Region, self).__init__(token, agent)
+        super(Region, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/regions" % url
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Regions
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out: A list of Region data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-regions
         """  # nopep8
 
-        return self.pages(self.uri, "regions")
+        return self.pages(self.uri, "regions", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Regions, from a single small page rather than listing them
+
+        out: The number of Regions
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-regions
+        """  # nopep8
+
+        return self.total(self.uri, "regions")
@@ -0,0 +1,70 @@
+"""This holds the Retry class."""
+
+import random
+
+
+class Retry(object):
+    """
+    description:
+        Retry policy for a Transport.  Calls that fail with a connection error or come back with
+        one of the retry statuses are tried again, waiting an exponentially growing, jittered
+        delay in between, or whatever Retry-After says.  Only idempotent methods are retried
+        by default, as a POST that made it to the API might have gone through.
+
+    in:
+        - attempts - number - Most times a call is tried, 1 to never retry
+        - backoff - number - Seconds to wait before the first retry
+        - factor - number - How much the wait grows with each retry
+        - cap - number - Most seconds to wait between tries
+        - jitter - boolean - Whether to wait a random amount up to the delay, to spread out
+          clients retrying together
+        - retry_after - boolean - Whether to wait as long as a Retry-After header says
+        - statuses - list - HTTP statuses worth retrying
+        - methods - list - HTTP methods that can be retried, None for all
+    """
+
+    def __init__(
+        self, attempts=3, backoff=0.5, factor=2, cap=30, jitter=True, retry_after=True,
+        statuses=(429, 500, 502, 503, 504), methods=("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    ):
+        """Keep the policy."""
+        self.attempts = attempts
+        self.backoff = backoff
+        self.factor = factor
+        self.cap = cap
+        self.jitter = jitter
+        self.retry_after = retry_after
+        self.statuses = statuses
+        self.methods = methods
+
+    def retryable(self, method, attempt, response=None):
+        """
+        Whether a call on this attempt (0 being the first) should be tried again, after either
+        a response or, with no response, a connection error
+        """
+
+        if attempt + 1 >= self.attempts:
+            return False
+
+        if self.methods is not None and method.upper() not in self.methods:
+            return False
+
+        return response is None or response.status_code in self.statuses
+
+    def delay(self, attempt, response=None):
+        """
+        Seconds to wait before trying again after this attempt
+        """
+
+        if self.retry_after and response is not None and "Retry-After" in response.headers:
+            try:
+                return min(self.cap, float(response.headers["Retry-After"]))
+            except ValueError:
+                pass
+
+        delay = min(self.cap, self.backoff * self.factor ** attempt)
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
@@ -27,25 +27,39 @@ class SSHKey(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#ssh-keys
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for floating ip interaction.
         """
-        super(SSHKey, self).__init__(token, agent)
+        super(SSHKey, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/account/keys" % url
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Keys
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out:
             A list of SSH Key data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-keys
         """  # nopep8
 
-        return self.pages(self.uri, "ssh_keys")
+        return self.pages(self.uri, "ssh_keys", stream=stream)
+
+    def count(self):
+        """
+        description: Count all SSH Keys, from a single small page rather than listing them
+
+        out: The number of SSH Keys
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-keys
+        """  # nopep8
+
+        return self.total(self.uri, "ssh_keys")
 
     def create(self, name, public_key):
         """
@@ -78,13 +92,7 @@ class SSHKey(Endpoint):
         related: https://developers.digitalocean.com/documentation/v2/#create-a-new-key
         """  # nopep8
 
-        ssh_keys = self.list()
-
-        existing = None
-        for ssh_key in ssh_keys:
-            if name == ssh_key["name"]:
-                existing = ssh_key
-                break
+        existing = self.find_first(lambda item: item["name"] == name)
 
         if existing is not None:
             return (existing, None)
@@ -38,22 +38,36 @@ class Size(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#sizes
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for floating ip interaction.
         """
-        super(Size, self).__init__(token, agent)
+        super(Size, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/sizes" % url
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all Sizes
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out:
             A list of Size data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-sizes
         """  # nopep8
 
-        return self.pages(self.uri, "sizes")
+        return self.pages(self.uri, "sizes", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Sizes, from a single small page rather than listing them
+
+        out: The number of Sizes
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-sizes
+        """  # nopep8
+
+        return self.total(self.uri, "sizes")
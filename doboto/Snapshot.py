@@ -31,20 +31,21 @@ class Snapshot(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#snapshots
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for floating ip interaction.
         """
-        super(Snapshot, self).__init__(token, agent)
+        super(Snapshot, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "%s/snapshots" % url
 
-    def list(self, resource_type=None):
+    def list(self, resource_type=None, stream=False):
         """
         description: List all, droplet, or volume snapshots
 
         in:
             - resource_type - string - Can be "droplet" or "volume" for snapshots thereof.
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Snapshot data structures
 
@@ -59,7 +60,26 @@ class Snapshot(Endpoint):
         if resource_type is not None:
             params["resource_type"] = resource_type
 
-        return self.pages(self.uri, "snapshots", params=params)
+        return self.pages(self.uri, "snapshots", params=params, stream=stream)
+
+    def count(self, resource_type=None):
+        """
+        description: Count all, droplet, or volume snapshots, from a single small page
+
+        in:
+            - resource_type - string - Can be "droplet" or "volume" for snapshots thereof.
+
+        out: The number of Snapshots
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-snapshots
+        """  # nopep8
+
+        params = {}
+
+        if resource_type is not None:
+            params["resource_type"] = resource_type
+
+        return self.total(self.uri, "snapshots", params=params)
 
     def info(self, id):
         """
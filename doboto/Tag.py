@@ -26,26 +26,40 @@ class Tag(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#tags
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for tag interaction.
         """
-        super(Tag, self).__init__(token, agent)
+        super(Tag, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "{}/tags".format(url)
 
-    def list(self):
+    def list(self, stream=False):
         """
         description: List all tags
 
             Currently only a resource_type of 'droplet' is supported.  Thus, resource_id is
             droplet id.
 
+        in:
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+
         out: A list of Tag data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-tags
         """  # nopep8
-        return self.pages(self.uri, "tags")
+        return self.pages(self.uri, "tags", stream=stream)
+
+    def count(self):
+        """
+        description: Count all Tags, from a single small page rather than listing them
+
+        out: The number of Tags
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-tags
+        """  # nopep8
+
+        return self.total(self.uri, "tags")
 
     def name_list(self):
         """
@@ -92,13 +106,7 @@ class Tag(Endpoint):
         related: https://developers.digitalocean.com/documentation/v2/#create-a-new-tag
         """  # nopep8
 
-        tags = self.list()
-
-        existing = None
-        for tag in tags:
-            if name == tag["name"]:
-                existing = tag
-                break
+        existing = self.find_first(lambda item: item["name"] == name)
 
         if existing is not None:
             return (existing, None)
@@ -0,0 +1,252 @@
+"""This holds the Transport and Response classes."""
+
+import time
+import json
+import weakref
+import threading
+from concurrent.futures import Future
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from .RateLimiter import RateLimiter
+from .Retry import Retry
+
+
+class Response(object):
+    """
+    description:
+        A response already read off the wire, for transports that don't hand back a requests
+        Response.  Offers the same status_code, headers and json() that endpoints use.
+
+    in:
+        - status_code - number - HTTP status of the response
+        - headers - dict - Response headers
+        - text - string - Raw body of the response
+    """
+
+    def __init__(self, status_code, headers=None, text=""):
+        """Keep status, headers and body."""
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers if headers is not None else {})
+        self.text = text
+
+    def json(self):
+        """ Parsed JSON body """
+
+        return json.loads(self.text)
+
+
+class Transport(object):
+    """
+    description:
+        Shared HTTP transport used by every endpoint of a DO instance.  Holds a single keep-alive
+        connection pool so repeated calls reuse TCP/TLS connections rather than doing a new
+        handshake on every request.
+
+        Safe to share across threads.  Each thread gets its own session, all of them mounting the
+        one pooled adapter, dropped once its thread exits, and the cache, rate limiter and
+        counters are guarded by locks.  Size
+        pool_size to the number of threads making calls at once, or connections past it are
+        dropped after use rather than kept.
+
+    in:
+        - pool_size - number - Max connections kept open per host
+        - connect_timeout - number - Seconds to wait to establish a connection
+        - read_timeout - number - Seconds to wait for a response once connected
+        - retries - number or Retry - Retry policy for failed calls, or just how many times to
+          retry with the default policy.  Defaults to Retry()
+        - workers - number - Max concurrent requests a single call can make, like fetching the
+          pages of a list.  1 does everything in sequence
+        - rate_limiter - RateLimiter - Paces calls to the API's budget.  Defaults to RateLimiter(),
+          False to not limit at all
+        - cache - Cache - Answers GETs of things that hardly ever change from memory.  None, the
+          default, to not cache
+        - coalesce - boolean - Whether identical GETs made at the same time, by different threads,
+          share one call rather than each making their own
+    """
+
+    errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+        self, pool_size=10, connect_timeout=10, read_timeout=60, retries=None, workers=1,
+        rate_limiter=None, cache=None, coalesce=True
+    ):
+        """Build the session and mount a pooled adapter for http and https."""
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+
+        if retries is None:
+            self.retries = Retry()
+        elif isinstance(retries, Retry):
+            self.retries = retries
+        else:
+            self.retries = Retry(attempts=retries + 1)
+
+        self.workers = workers
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.cache = cache
+        self.coalesce = coalesce
+
+        self.flights = {}
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.coalesced = 0
+
+        self.adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        self.local = threading.local()
+        self.sessions = weakref.WeakSet()
+
+        self.connect()
+
+    def connect(self):
+        """
+        This thread's session, made on first use, mounting the shared pooled adapter.  Only the
+        thread holds onto it, so it's dropped when the thread exits, its connections staying in
+        the adapter's pool
+        """
+
+        session = getattr(self.local, "session", None)
+
+        if session is None:
+
+            session = self.local.session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+
+            with self.lock:
+                self.sessions.add(session)
+
+        return session
+
+    @property
+    def session(self):
+        """ This thread's session """
+
+        return self.connect()
+
+    def send(self, method, url, params=None, data=None, headers=None):
+        """ Single HTTP call over the pooled session """
+
+        return self.session.request(
+            method, url, params=params, data=data, headers=headers, timeout=self.timeout
+        )
+
+    @staticmethod
+    def flight(method, url, params=None, headers=None):
+        """ What makes a call the same as another in flight, None if it can't be shared """
+
+        if method.upper() != "GET":
+            return None
+
+        return (
+            url, json.dumps(params, sort_keys=True, default=str),
+            (headers or {}).get("Authorization")
+        )
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        """
+        API call, answered from the cache if it can be, or shared with an identical GET already
+        in flight, otherwise paced by the rate limiter, waiting out 429s and retrying failures as
+        the retry policy allows
+        """
+
+        if self.cache is not None:
+
+            cached = self.cache.get(method, url, params=params, headers=headers)
+
+            if cached is not None:
+                return cached
+
+        key = self.flight(method, url, params, headers) if self.coalesce else None
+
+        if key is None:
+            return self.call(method, url, params=params, data=data, headers=headers)
+
+        with self.lock:
+
+            flight = self.flights.get(key)
+            leader = flight is None
+
+            if leader:
+                flight = self.flights[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return flight.result()
+
+        try:
+            flight.set_result(self.call(method, url, params=params, data=data, headers=headers))
+        except BaseException as exception:
+            flight.set_exception(exception)
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+
+        return flight.result()
+
+    def call(self, method, url, params=None, data=None, headers=None):
+        """ API call made over the wire, with pacing and retries """
+
+        attempt = 0
+        waits = 0
+
+        while True:
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            with self.lock:
+                self.sent += 1
+
+            try:
+                response = self.send(method, url, params=params, data=data, headers=headers)
+            except self.errors:
+                if not self.retries.retryable(method, attempt):
+                    raise
+                time.sleep(self.retries.delay(attempt))
+                attempt += 1
+                continue
+
+            if self.rate_limiter:
+
+                self.rate_limiter.update(response.headers)
+
+                if response.status_code == 429 and waits < self.rate_limiter.waits:
+                    self.rate_limiter.exhausted(response.headers)
+                    waits += 1
+                    continue
+
+            if not self.retries.retryable(method, attempt, response):
+
+                if self.cache is not None:
+                    self.cache.put(
+                        method, url, params=params, headers=headers, response=response, data=data
+                    )
+
+                return response
+
+            time.sleep(self.retries.delay(attempt, response))
+            attempt += 1
+
+    def stats(self):
+        """ How many calls went over the wire, and how many were saved by sharing one in flight """
+
+        with self.lock:
+            return {"sent": self.sent, "coalesced": self.coalesced}
+
+    def close(self):
+        """ Closes every thread's session and pooled connection, and the cache's if it has any """
+
+        with self.lock:
+            sessions, self.sessions = list(self.sessions), weakref.WeakSet()
+
+        for session in sessions:
+            session.close()
+
+        self.local = threading.local()
+
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,56 @@
+"""This holds the Urllib3Transport class."""
+
+from urllib.parse import urlencode
+import requests
+import urllib3
+from urllib3 import exceptions
+from .Transport import Transport, Response
+
+
+class Urllib3Transport(Transport):
+    """
+    description:
+        Transport sending calls straight through a urllib3 pool, skipping the requests Session
+        machinery on every call.  Everything else, pacing, retries, caching and sharing calls in
+        flight, is Transport's.  Failures to connect and timeouts are raised as requests'
+        ConnectionError and Timeout so the retry policy treats them the same.
+
+    in:
+        Same as Transport
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Build the pool, one for every host, shared by every thread."""
+        super(Urllib3Transport, self).__init__(*args, **kwargs)
+
+        self.pool = urllib3.PoolManager(
+            num_pools=self.pool_size, maxsize=self.pool_size,
+            timeout=urllib3.Timeout(connect=self.timeout[0], read=self.timeout[1]), retries=False
+        )
+
+    def send(self, method, url, params=None, data=None, headers=None):
+        """ Single HTTP call over the urllib3 pool """
+
+        if params:
+            url = "%s%s%s" % (url, "&" if "?" in url else "?", urlencode(params, doseq=True))
+
+        try:
+            response = self.pool.request(
+                method, url, body=data.encode() if isinstance(data, str) else data,
+                headers=headers
+            )
+        except exceptions.NewConnectionError as exception:
+            raise requests.ConnectionError(exception)
+        except exceptions.TimeoutError as exception:
+            raise requests.Timeout(exception)
+        except exceptions.HTTPError as exception:
+            raise requests.ConnectionError(exception)
+
+        return Response(response.status, dict(response.headers), response.data.decode())
+
+    def close(self):
+        """ Closes all pooled connections, and the cache's if it has any """
+
+        self.pool.clear()
+
+        super(Urllib3Transport, self).close()
@@ -2,6 +2,7 @@
 
 import time
 from .Endpoint import Endpoint
+from .Cache import Cache
 from .exception import DOBOTOException, DOBOTONotFoundException, DOBOTOPollingException
 
 
@@ -35,29 +36,62 @@ class Volume(Endpoint):
     related: https://developers.digitalocean.com/documentation/v2/#block-storage
     """
 
-    def __init__(self, do, token, url, agent):
+    def __init__(self, do, token, url, agent, transport=None):
         """
         Takes token and agent and sets its DO for reference and URI for volume interaction.
         """
-        super(Volume, self).__init__(token, agent)
+        super(Volume, self).__init__(token, agent, transport)
         self.do = do
         self.uri = "{}/volumes".format(url)
 
-    def list(self, region=None):
+    def list(self, region=None, stream=False, name=None):
         """
         description: List all volumes
 
         in:
             - region - string - Region slug for listing on snapshots from that region - optional
+            - stream - boolean - Whether to return a generator that fetches a page at a time
+            - name - string - Only list volumes with this name - optional
 
         out: A list of Volume data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-block-storage-volumes
         """  # nopep8
+        params = {}
+
         if region is not None:
-            return self.pages(self.uri, "volumes", params={"region": region})
+            params["region"] = region
+
+        if name is not None:
+            params["name"] = name
+
+        if params:
+            return self.pages(self.uri, "volumes", params=params, stream=stream)
         else:
-            return self.pages(self.uri, "volumes")
+            return self.pages(self.uri, "volumes", stream=stream)
+
+    def count(self, region=None, name=None):
+        """
+        description: Count all volumes, from a single small page rather than listing them
+
+        in:
+            - region - string - Region slug to count volumes in - optional
+            - name - string - Only count volumes with this name - optional
+
+        out: The number of Volumes
+
+        related: https://developers.digitalocean.com/documentation/v2/#list-all-block-storage-volumes
+        """  # nopep8
+
+        params = {}
+
+        if region is not None:
+            params["region"] = region
+
+        if name is not None:
+            params["name"] = name
+
+        return self.total(self.uri, "volumes", params=params)
 
     def create(self, attribs, wait=False, poll=5, timeout=300):
         """
@@ -79,7 +113,8 @@ class Volume(Endpoint):
                 - snapshot_id - string - The unique identifier for the volume snapshot from which
                   to create the volume. Should not be specified with a region_id.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out:  A Volume data structure
@@ -92,17 +127,19 @@ class Volume(Endpoint):
         if not wait:
             return volume
 
-        if poll < 1:
-            poll = 1
+        poll = self.waiting(poll)
 
         start_time = time.time()
+        attempt = 0
 
         while True:
 
-            time.sleep(poll)
+            time.sleep(poll.delay(attempt, "create_volume"))
+            attempt += 1
 
             try:
-                volume = self.info(volume["id"])
+                with Cache.fresh():
+                    volume = self.info(volume["id"])
                 break
             except DOBOTONotFoundException as exception:
                 pass
@@ -113,6 +150,8 @@ class Volume(Endpoint):
             if time.time() - start_time > timeout:
                 raise DOBOTOPollingException(polling=volume)
 
+        poll.record("create_volume", time.time() - start_time)
+
         return volume
 
     def present(self, attribs, wait=False, poll=5, timeout=300):
@@ -135,20 +174,21 @@ class Volume(Endpoint):
                 - snapshot_id - string - The unique identifier for the volume snapshot from which
                   to create the volume. Should not be specified with a region_id.
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: A tuple of Volume data structures, the intended and created (None if already exists)
 
         related: https://developers.digitalocean.com/documentation/v2/#create-a-new-block-storage-volume
         """  # nopep8
-        volumes = self.list()
+        def named(item):
+            return item["name"] == attribs["name"]
 
-        existing = None
-        for volume in volumes:
-            if attribs["name"] == volume["name"]:
-                existing = volume
-                break
+        if "region" in attribs:
+            existing = self.find_first(named, region=attribs["region"], name=attribs["name"])
+        else:
+            existing = self.find_first(named)
 
         if existing is not None:
             return (existing, None)
@@ -202,19 +242,20 @@ class Volume(Endpoint):
         else:
             raise ValueError("Must supply an id or name and region")
 
-    def snapshot_list(self, id):
+    def snapshot_list(self, id, stream=False):
         """
         description: List snapshots for a volume
 
         in:
             - id - number - The id of the volume
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Image data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-snapshots-for-a-volume
         """  # nopep8
         uri = "{}/{}/snapshots".format(self.uri, id)
-        return self.pages(uri, "snapshots")
+        return self.pages(uri, "snapshots", stream=stream)
 
     def snapshot_create(self, id, snapshot_name, wait=False, poll=5, timeout=300):
         """
@@ -224,7 +265,8 @@ class Volume(Endpoint):
             - id - number - The id of the volume
             - snapshot_name - string - The name of the snapshot
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Image data structure
@@ -249,7 +291,8 @@ class Volume(Endpoint):
             - region - string - The region slug of the volume if no id
             - droplet_id - number - The id of the droplet
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -297,7 +340,8 @@ class Volume(Endpoint):
             - region - string - The region slug of the volume if no id
             - droplet_id - number - The id of the droplet
             - wait - boolean - Whether to wait until the droplet is ready
-            - poll - number - Number of seconds between checks (min 1 sec)
+            - poll - number or Wait - Number of seconds between checks (min 1 sec), or a Wait
+              strategy like BackoffWait or LearnedWait
             - timeout - number - How many seconds before giving up
 
         out: An Action data structure
@@ -360,19 +404,20 @@ class Volume(Endpoint):
             wait, poll, timeout
         )
 
-    def action_list(self, id):
+    def action_list(self, id, stream=False):
         """
         description: List all actions for a volume
 
         in:
             - id - number - The id of the volume
+            - stream - boolean - Whether to return a generator that fetches a page at a time
 
         out: A list of Action data structures
 
         related: https://developers.digitalocean.com/documentation/v2/#list-all-actions-for-a-volume
         """  # nopep8
         uri = "{}/{}/actions".format(self.uri, id)
-        return self.pages(uri, "actions")
+        return self.pages(uri, "actions", stream=stream)
 
     def action_info(self, id, action_id):
         """
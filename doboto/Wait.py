@@ -0,0 +1,30 @@
+"""This holds the Wait class."""
+
+
+class Wait(object):
+    """
+    description:
+        Wait strategy for calls made with wait=True, deciding how long to sleep before each check
+        on whatever is being waited on.  This one checks every interval seconds, what a plain
+        number given as poll does.  Any Wait can be passed as poll instead of a number.
+
+    in:
+        - interval - number - Number of seconds between checks (min 1 sec)
+    """
+
+    def __init__(self, interval=5):
+        """Keep the interval."""
+        self.interval = max(1, interval)
+
+    def delay(self, attempt, kind=None):
+        """
+        Seconds to sleep before check number attempt (0 being the first) on something of kind,
+        like an action type
+        """
+
+        return self.interval
+
+    def record(self, kind, seconds):
+        """
+        Notes that something of kind took seconds to finish.  Ignored unless the strategy learns
+        """
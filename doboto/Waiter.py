@@ -0,0 +1,301 @@
+"""This holds the Waiter class."""
+
+import time
+import threading
+from concurrent.futures import Future
+from .Endpoint import Endpoint
+from .Cache import Cache
+from .LearnedWait import LearnedWait
+from .exception import DOBOTONotFoundException, DOBOTOPollingException
+
+
+class Waiter(object):
+    """
+    description:
+        Background wait engine shared by everything waited on through a DO.  Actions in progress,
+        Droplets not yet ready, Volumes not yet visible and Load Balancers without an IP are
+        handed over and a Future comes back right away.  A single thread checks on all of them,
+        and everything due on the same tick is checked together, one batch per kind, rather than
+        each wait sleeping in its own thread with its own loop.
+
+    in:
+        - do - DO - What to check with
+        - poll - number or Wait - How long to wait between checks unless told otherwise.
+          Defaults to LearnedWait()
+    """
+
+    def __init__(self, do, poll=None):
+        """Nothing pending and no thread until something's waited on."""
+        self.do = do
+        self.poll = poll if poll is not None else LearnedWait()
+
+        self.pending = []
+
+        self.condition = threading.Condition()
+        self.running = False
+        self.thread = None
+
+    def submit(self, kind, resource, attribs=None, poll=None, timeout=300):
+        """
+        description: Wait on something in the background
+
+        in:
+            - kind - string - What's being waited on, "action", "droplet", "volume" or
+              "load_balancer"
+            - resource - dict - The data structure of what's being waited on
+            - attribs - dict - What a droplet was created with, to tell when it's ready
+            - poll - number or Wait - How long to wait between checks, defaults to the Waiter's
+            - timeout - number - How many seconds before giving up
+
+        out: A Future resolving to the data structure once it's done, or raising
+             DOBOTOPollingException if it times out
+        """
+
+        now = time.time()
+
+        entry = {
+            "kind": kind,
+            "resource": resource,
+            "attribs": attribs if attribs is not None else {},
+            "poll": Endpoint.waiting(poll if poll is not None else self.poll),
+            "timeout": timeout,
+            "start": now,
+            "attempt": 0,
+            "found": False,
+            "error": None,
+            "future": Future()
+        }
+
+        if kind != "volume" and self.finished(entry):
+            entry["future"].set_result(resource)
+            return entry["future"]
+
+        entry["due"] = now + entry["poll"].delay(0, self.key(entry))
+
+        with self.condition:
+
+            self.pending.append(entry)
+
+            if self.thread is None or not self.thread.is_alive():
+                self.running = True
+                self.thread = threading.Thread(target=self.run, name="doboto-waiter")
+                self.thread.daemon = True
+                self.thread.start()
+
+            self.condition.notify()
+
+        return entry["future"]
+
+    def action(self, action, poll=None, timeout=300):
+        """
+        description: Wait on an Action until it's no longer in progress
+
+        in:
+            - action - dict - An Action data structure, like the ones Droplet actions return
+            - poll - number or Wait - How long to wait between checks, defaults to the Waiter's
+            - timeout - number - How many seconds before giving up
+
+        out: A Future resolving to the finished Action data structure
+        """
+
+        return self.submit("action", action, poll=poll, timeout=timeout)
+
+    def droplet(self, droplet, attribs=None, poll=None, timeout=300):
+        """
+        description: Wait on a Droplet until it's ready
+
+        in:
+            - droplet - dict - A Droplet data structure, like the one create returns
+            - attribs - dict - What the Droplet was created with, to know when networking and
+              tags are in place
+            - poll - number or Wait - How long to wait between checks, defaults to the Waiter's
+            - timeout - number - How many seconds before giving up
+
+        out: A Future resolving to the ready Droplet data structure
+        """
+
+        return self.submit("droplet", droplet, attribs=attribs, poll=poll, timeout=timeout)
+
+    def volume(self, volume, poll=None, timeout=300):
+        """
+        description: Wait on a Volume until it can be retrieved
+
+        in:
+            - volume - dict - A Volume data structure, like the one create returns
+            - poll - number or Wait - How long to wait between checks, defaults to the Waiter's
+            - timeout - number - How many seconds before giving up
+
+        out: A Future resolving to the retrieved Volume data structure
+        """
+
+        return self.submit("volume", volume, poll=poll, timeout=timeout)
+
+    def load_balancer(self, load_balancer, poll=None, timeout=300):
+        """
+        description: Wait on a Load Balancer until it has an IP
+
+        in:
+            - load_balancer - dict - A Load Balancer data structure, like the one create returns
+            - poll - number or Wait - How long to wait between checks, defaults to the Waiter's
+            - timeout - number - How many seconds before giving up
+
+        out: A Future resolving to the Load Balancer data structure with its IP
+        """
+
+        return self.submit("load_balancer", load_balancer, poll=poll, timeout=timeout)
+
+    @staticmethod
+    def key(entry):
+        """ What the Wait strategy knows this kind of wait as """
+
+        if entry["kind"] == "action":
+            return entry["resource"].get("type")
+
+        return "create_%s" % entry["kind"]
+
+    def finished(self, entry):
+        """ Whether what's waited on is done """
+
+        if entry["kind"] == "action":
+            return entry["resource"]["status"] != "in-progress"
+
+        if entry["kind"] == "droplet":
+            return self.do.droplet.ready(entry["resource"], entry["attribs"])
+
+        if entry["kind"] == "volume":
+            return entry["found"]
+
+        return bool(entry["resource"]["ip"])
+
+    def fetch(self, kind, entries):
+        """ Latest of everything of a kind, one batch for all of them, exceptions in place """
+
+        ids = [entry["resource"]["id"] for entry in entries]
+
+        if kind == "action":
+            return self.do.action.info_list(ids)
+
+        if kind == "droplet":
+            return self.do.droplet.info_list(ids)
+
+        endpoint = getattr(self.do, kind)
+
+        return endpoint.concurrently(endpoint.info, ids)
+
+    def due(self, now):
+        """ Takes everything due to be checked by now off of pending """
+
+        with self.condition:
+
+            due = [entry for entry in self.pending if entry["due"] <= now]
+            self.pending = [entry for entry in self.pending if entry["due"] > now]
+
+        return [entry for entry in due if not entry["future"].cancelled()]
+
+    def check(self, entries):
+        """ Checks on all entries, resolving what's done or timed out and putting back the rest """
+
+        kinds = {}
+
+        for entry in entries:
+            kinds.setdefault(entry["kind"], []).append(entry)
+
+        requeue = []
+
+        for kind, group in kinds.items():
+
+            try:
+                with Cache.fresh():
+                    results = self.fetch(kind, group)
+            except Exception as exception:
+                results = [exception] * len(group)
+
+            now = time.time()
+
+            for entry, result in zip(group, results):
+
+                if entry["future"].cancelled():
+                    continue
+
+                try:
+                    if self.update(entry, result, now):
+                        requeue.append(entry)
+                except Exception as exception:
+                    entry["future"].set_exception(exception)
+
+        with self.condition:
+            self.pending.extend(requeue)
+
+    def update(self, entry, result, now):
+        """ Takes a check's result, returns whether the entry still needs waiting on """
+
+        if isinstance(result, DOBOTONotFoundException) and entry["kind"] == "volume":
+            entry["error"] = None
+        elif isinstance(result, Exception):
+            entry["error"] = result
+        else:
+            entry["resource"] = result
+            entry["found"] = True
+            entry["error"] = None
+
+        if entry["error"] is None and self.finished(entry):
+
+            if entry["kind"] != "action":
+                entry["poll"].record(self.key(entry), now - entry["start"])
+            elif entry["resource"]["status"] == "completed":
+                entry["poll"].record(
+                    self.key(entry), Endpoint.action_seconds(entry["resource"])
+                )
+
+            entry["future"].set_result(entry["resource"])
+            return False
+
+        if now - entry["start"] > entry["timeout"]:
+            entry["future"].set_exception(
+                DOBOTOPollingException(polling=entry["resource"], error=entry["error"])
+            )
+            return False
+
+        entry["attempt"] += 1
+        entry["due"] = now + entry["poll"].delay(entry["attempt"], self.key(entry))
+
+        return True
+
+    def run(self):
+        """ Engine thread, sleeps until something's due, then checks everything due together """
+
+        while True:
+
+            with self.condition:
+
+                if not self.running:
+                    return
+
+                if not self.pending:
+                    self.condition.wait()
+                    continue
+
+                wait = min(entry["due"] for entry in self.pending) - time.time()
+
+                if wait > 0:
+                    self.condition.wait(wait)
+                    continue
+
+            self.check(self.due(time.time()))
+
+    def close(self):
+        """ Stops the engine thread, cancelling anything still pending """
+
+        with self.condition:
+
+            self.running = False
+            self.condition.notify()
+
+            for entry in self.pending:
+                entry["future"].cancel()
+
+            self.pending = []
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
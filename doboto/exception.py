@@ -15,6 +15,7 @@ class DOBOTOException(Exception):
 
         super(Exception, self).__init__(message)
 
+        self.message = message
         self.result = result
 
     def __str__(self):
@@ -38,6 +39,8 @@ class DOBOTONotFoundException(DOBOTOException):
 
         super(Exception, self).__init__(message)
 
+        self.message = message
+
 
 class DOBOTOPollingException(DOBOTOException):
     """
@@ -54,6 +57,7 @@ class DOBOTOPollingException(DOBOTOException):
 
         super(Exception, self).__init__(message)
 
+        self.message = message
         self.polling = polling
         self.error = error
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-from distutils.core import setup
+from setuptools import setup
 import os
 
 setup(
@@ -12,9 +12,10 @@ setup(
     author="Digital Ocean Data Team",
     author_email="swe-data@do.co",
     classifiers=[
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7'
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only'
     ],
+    python_requires=">=3.7",
     install_requires=[
         "requests[security]"
     ],
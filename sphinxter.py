@@ -2,10 +2,11 @@ import re
 import yaml
 import json
 from doboto.DO import DO
+from doboto.Endpoint import Endpoint
 
 do = DO(token="secret")
 
-DEFINITIONS = re.compile('def (\w+)\(\s*?(.+)\s*?\)')
+DEFINITIONS = re.compile(r'^    def (\w+)\((.*?)\):', re.MULTILINE | re.DOTALL)
 
 
 def write_data(doc_file, args, indent=""):
@@ -14,10 +15,10 @@ def write_data(doc_file, args, indent=""):
         for arg in args:
             write_data(doc_file, arg, indent)
     elif isinstance(args, dict):
-        for key, value in args.iteritems():
+        for key, value in args.items():
             write_data(doc_file, key, indent)
             write_data(doc_file, value, "%s  " % indent)
-    elif isinstance(args, basestring):
+    elif isinstance(args, str):
         if " - " in args:
             (name, rest) = args.split(" - ", 1)
             doc_file.write("%s- *%s* - %s\n\n" % (indent, name, rest))
@@ -29,20 +30,20 @@ for sub_name in dir(do):
 
     sub = getattr(do, sub_name)
 
-    if callable(sub) or sub_name[:2] == "__":
+    if not isinstance(sub, Endpoint) or sub_name[:2] == "__":
         continue
 
-    sub_doc = yaml.load(sub.__doc__)
+    sub_doc = yaml.safe_load(sub.__doc__)
 
-    print sub_name
-    print sub.__class__.__name__
-    print json.dumps(sub_doc, indent=2, sort_keys=True)
+    print(sub_name)
+    print(sub.__class__.__name__)
+    print(json.dumps(sub_doc, indent=2, sort_keys=True))
 
-    sub_file = open("doboto/%s.py" % sub.__class__.__name__, "rb")
+    sub_file = open("doboto/%s.py" % sub.__class__.__name__, "r")
     sub_text = sub_file.read()
     sub_file.close()
 
-    doc_file = open("docs/%s.rst" % sub_name, "wb")
+    doc_file = open("docs/%s.rst" % sub_name, "w")
 
     doc_file.write(""".. DOBOTO documentation sub class file, created bysphinxter.py.
 
@@ -69,7 +70,7 @@ for sub_name in dir(do):
             continue
 
         method_order.append(definition[0])
-        method_args[definition[0]] = definition[1].split(', ')
+        method_args[definition[0]] = " ".join(definition[1].split()).split(', ')
 
     methods = {}
     for method_name in dir(sub):
@@ -81,27 +82,28 @@ for sub_name in dir(do):
 
         methods[method_name] = method
 
-    print methods
+    print(methods)
 
     for method_name in method_order:
 
         if method_name not in methods:
             continue
 
-        method_doc = yaml.load(methods[method_name].__doc__)
+        method_doc = yaml.safe_load(methods[method_name].__doc__)
 
         if "description" not in method_doc:
             continue
 
-        print "%s.%s" % (sub_name, method_name)
-        print method_args[method_name][1:]
-        print json.dumps(method_doc, indent=2, sort_keys=True)
+        print("%s.%s" % (sub_name, method_name))
+        print(method_args[method_name][1:])
+        print(json.dumps(method_doc, indent=2, sort_keys=True))
 
-        intitial_description = method_doc["description"].split("\n")[0]
+        separator = "\n" if "\n" in method_doc["description"] else ".  "
+        intitial_description = method_doc["description"].split(separator)[0]
         full_description = ""
 
-        if "\n" in method_doc["description"]:
-            full_description = "\n%s\n" % method_doc["description"].split("\n",1)[1:][0]
+        if separator in method_doc["description"]:
+            full_description = "\n%s\n" % method_doc["description"].split(separator, 1)[1:][0]
 
         doc_file.write("""\n\n%s
 ----------------------------------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 This module contains tests for the Action class
 """
 
+import requests
 from unittest import TestCase
 from mock import MagicMock, patch
 from doboto import Action
@@ -48,6 +49,18 @@ class TestAction(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Action.Action.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        action = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(action.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "actions")
+
     @patch('doboto.Action.Action.pages')
     def test_list(self, mock_pages):
         """
@@ -57,7 +70,7 @@ class TestAction(TestCase):
         action = self.klass(*self.instantiate_args)
         result = action.list()
 
-        mock_pages.assert_called_with(self.test_uri, "actions")
+        mock_pages.assert_called_with(self.test_uri, "actions", stream=False)
 
     @patch('doboto.Action.Action.request')
     def test_info(self, mock_request):
@@ -71,3 +84,46 @@ class TestAction(TestCase):
 
         test_uri = "{}/{}".format(self.test_uri, id)
         mock_request.assert_called_with(test_uri, "action")
+
+    def test_info_list(self):
+        """
+        info_list gets few actions by id and many by reading the list
+        """
+
+        action = self.klass(*self.instantiate_args)
+        action.info = MagicMock(side_effect=lambda id: {"id": id, "status": "completed"})
+        action.list = MagicMock(return_value=iter([
+            {"id": 9, "status": "completed"},
+            {"id": 7, "status": "in-progress"},
+            {"id": 6, "status": "completed"},
+            {"id": 4, "status": "completed"},
+            {"id": 3, "status": "completed"}
+        ]))
+
+        self.assertEqual(action.info_list([4, 7]), [
+            {"id": 4, "status": "completed"},
+            {"id": 7, "status": "completed"}
+        ])
+        action.list.assert_not_called()
+
+        self.assertEqual(action.info_list([7, 4, 5], sweep=2), [
+            {"id": 7, "status": "in-progress"},
+            {"id": 4, "status": "completed"},
+            {"id": 5, "status": "completed"}
+        ])
+        action.list.assert_called_once_with(stream=True)
+        action.info.assert_called_with(5)
+        self.assertEqual(action.info.call_count, 3)
+
+        action.list = MagicMock(side_effect=requests.ConnectionError("down"))
+        action.info = MagicMock(side_effect=[{"id": 1}, Exception("Not yet")])
+
+        results = action.info_list([1, 2], sweep=1)
+        self.assertEqual(results[0], {"id": 1})
+        self.assertEqual(str(results[1]), "Not yet")
+
+        # Only a failed call falls back, anything else is raised
+
+        action.list = MagicMock(side_effect=TypeError("bug"))
+
+        self.assertRaisesRegex(TypeError, "bug", action.info_list, [1, 2], sweep=1)
@@ -0,0 +1,69 @@
+"""
+This module contains tests for the AsyncAccount class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch
+from doboto import AsyncAccount, Account
+
+
+class TestAsyncAccount(TestCase):
+    """
+    This class implements unittests for the AsyncAccount class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncAccount"
+        self.klass = getattr(AsyncAccount, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncAccount class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncAccount, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncAccount class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_is_account(self):
+        """
+        AsyncAccount is a Account
+        """
+
+        self.assertIsInstance(self.klass(*self.instantiate_args), Account.Account)
+
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.request', new_callable=AsyncMock)
+    def test_info(self, mock_request):
+        """
+        info can be awaited
+        """
+
+        mock_request.return_value = "awaited"
+
+        self.assertEqual(
+            asyncio.run(self.klass(*self.instantiate_args).info()), "awaited"
+        )
+        mock_request.assert_awaited_with("{}/account".format(self.test_url), "account")
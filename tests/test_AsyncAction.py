@@ -0,0 +1,135 @@
+"""
+This module contains tests for the AsyncAction class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch
+from doboto import AsyncAction, Action
+from doboto.exception import DOBOTOException
+
+
+class TestAsyncAction(TestCase):
+    """
+    This class implements unittests for the AsyncAction class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncAction"
+        self.klass = getattr(AsyncAction, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncAction class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncAction, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncAction class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_is_action(self):
+        """
+        AsyncAction is a Action
+        """
+
+        self.assertIsInstance(self.klass(*self.instantiate_args), Action.Action)
+
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.pages', new_callable=AsyncMock)
+    def test_list(self, mock_pages):
+        """
+        list can be awaited
+        """
+
+        mock_pages.return_value = "awaited"
+
+        self.assertEqual(
+            asyncio.run(self.klass(*self.instantiate_args).list()), "awaited"
+        )
+        mock_pages.assert_awaited_with("{}/actions".format(self.test_url), "actions", stream=False)
+
+    def test_info_list(self):
+        """
+        info_list gets few actions by id and many by reading the list, all awaited
+        """
+
+        action = self.klass(*self.instantiate_args)
+
+        async def info(id):
+            if id == 5:
+                raise Exception("Not yet")
+            return {"id": id, "status": "completed"}
+
+        async def actions():
+            for id, status in [(9, "completed"), (7, "in-progress"), (4, "completed"),
+                               (3, "completed")]:
+                yield {"id": id, "status": status}
+
+        action.info = AsyncMock(side_effect=info)
+        action.list = AsyncMock(side_effect=lambda stream: actions())
+
+        self.assertEqual(asyncio.run(action.info_list([4, 7])), [
+            {"id": 4, "status": "completed"},
+            {"id": 7, "status": "completed"}
+        ])
+        action.list.assert_not_awaited()
+
+        results = asyncio.run(action.info_list([7, 4, 5], sweep=2))
+        self.assertEqual(results[:2], [
+            {"id": 7, "status": "in-progress"},
+            {"id": 4, "status": "completed"}
+        ])
+        self.assertEqual(str(results[2]), "Not yet")
+        action.list.assert_awaited_once_with(stream=True)
+        action.info.assert_awaited_with(5)
+        self.assertEqual(action.info.await_count, 3)
+
+        action.list = AsyncMock(side_effect=DOBOTOException("down"))
+
+        self.assertEqual(asyncio.run(action.info_list([4], sweep=1)), [
+            {"id": 4, "status": "completed"}
+        ])
+
+        action.list = AsyncMock(side_effect=TypeError("bug"))
+
+        with self.assertRaisesRegex(TypeError, "bug"):
+            asyncio.run(action.info_list([4], sweep=1))
+
+        # No more by id at once than the transport has workers
+
+        running = []
+        most = []
+
+        async def counted(id):
+            running.append(id)
+            most.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(id)
+            return {"id": id, "status": "completed"}
+
+        action.info = AsyncMock(side_effect=counted)
+        action.transport.workers = 2
+
+        self.assertEqual(len(asyncio.run(action.info_list([1, 2, 3, 4, 5]))), 5)
+        self.assertEqual(max(most), 2)
@@ -0,0 +1,72 @@
+"""
+This module contains tests for the AsyncCertificate class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock
+from doboto import AsyncCertificate
+
+
+class TestAsyncCertificate(TestCase):
+    """
+    This class implements unittests for the AsyncCertificate class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/certificates".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncCertificate"
+        self.klass = getattr(AsyncCertificate, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncCertificate class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncCertificate, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncCertificate class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_present(self):
+        """
+        present only creates if not listed
+        """
+
+        certificate = self.klass(*self.instantiate_args)
+        async def listing():
+            yield {"id": 1, "name": "people"}
+
+        certificate.list = AsyncMock(side_effect=lambda stream: listing())
+        certificate.create = AsyncMock(return_value={"id": 2, "name": "stuff"})
+
+        self.assertEqual(
+            asyncio.run(certificate.present("people", "p", "l", "c")),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(certificate.present("stuff", "p", "l", "c")),
+            ({"id": 2, "name": "stuff"}, {"id": 2, "name": "stuff"})
+        )
+        certificate.create.assert_awaited_once_with("stuff", "p", "l", "c")
@@ -0,0 +1,75 @@
+"""
+This module contains tests for the AsyncDO class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock
+from doboto import AsyncDO, AsyncEndpoint, AsyncTransport
+
+
+class TestAsyncDO(TestCase):
+    """
+    This class implements unittests for the AsyncDO class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com/"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncDO"
+        self.klass = getattr(AsyncDO, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncDO class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncDO, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncDO class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_endpoints(self):
+        """
+        AsyncDO shares one async transport across every async endpoint
+        """
+
+        do = self.klass(*self.instantiate_args)
+        self.assertIsInstance(do.transport, AsyncTransport.AsyncTransport)
+
+        for name in (
+            'account', 'action', 'volume', 'certificate', 'domain', 'droplet', 'image',
+            'load_balancer', 'snapshot', 'region', 'size', 'floating_ip', 'ssh_key', 'tag'
+        ):
+            self.assertIsInstance(getattr(do, name), AsyncEndpoint.AsyncEndpoint)
+            self.assertIs(getattr(do, name).transport, do.transport)
+            self.assertIs(getattr(do, name).do, do)
+
+    def test_close(self):
+        """
+        close closes the transport
+        """
+
+        do = self.klass(*self.instantiate_args)
+        do.transport.close = AsyncMock()
+
+        asyncio.run(do.close())
+        do.transport.close.assert_awaited_once_with()
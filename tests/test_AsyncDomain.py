@@ -0,0 +1,72 @@
+"""
+This module contains tests for the AsyncDomain class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock
+from doboto import AsyncDomain
+
+
+class TestAsyncDomain(TestCase):
+    """
+    This class implements unittests for the AsyncDomain class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/domains".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncDomain"
+        self.klass = getattr(AsyncDomain, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncDomain class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncDomain, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncDomain class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_present(self):
+        """
+        present only creates if not listed
+        """
+
+        domain = self.klass(*self.instantiate_args)
+        async def listing():
+            yield {"id": 1, "name": "people"}
+
+        domain.list = AsyncMock(side_effect=lambda stream: listing())
+        domain.create = AsyncMock(return_value={"id": 2, "name": "stuff"})
+
+        self.assertEqual(
+            asyncio.run(domain.present("people", "1.2.3.4")),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(domain.present("stuff", "1.2.3.4")),
+            ({"id": 2, "name": "stuff"}, {"id": 2, "name": "stuff"})
+        )
+        domain.create.assert_awaited_once_with("stuff", "1.2.3.4")
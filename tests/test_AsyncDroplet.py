@@ -0,0 +1,352 @@
+"""
+This module contains tests for the AsyncDroplet class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch, call
+from doboto import AsyncDroplet
+from doboto.exception import DOBOTOException, DOBOTOPollingException
+
+
+class TestAsyncDroplet(TestCase):
+    """
+    This class implements unittests for the AsyncDroplet class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/droplets".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncDroplet"
+        self.klass = getattr(AsyncDroplet, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncDroplet class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncDroplet, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncDroplet class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_create(self, mock_sleep):
+        """
+        create works with name or names
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.count = AsyncMock(return_value=1000)
+        drop.request = AsyncMock(return_value={"id": 1, "status": "new"})
+        drop.info = AsyncMock(side_effect=[
+            Exception("Not yet"), {"id": 1, "status": "active"}
+        ])
+
+        self.assertEqual(
+            asyncio.run(drop.create({"name": "people"})), {"id": 1, "status": "new"}
+        )
+        self.assertEqual(
+            asyncio.run(drop.create({"name": "people"}, wait=True, poll=0)),
+            {"id": 1, "status": "active"}
+        )
+        mock_sleep.assert_has_awaits([call(1), call(1)])
+
+        drop.info = AsyncMock(return_value={"id": 1, "status": "new"})
+
+        with self.assertRaises(DOBOTOPollingException):
+            asyncio.run(drop.create({"name": "people"}, wait=True, timeout=-1))
+
+        drop.request = AsyncMock(return_value=[
+            {"id": 1, "status": "new"},
+            {"id": 2, "status": "new"}
+        ])
+
+        statuses = {1: ["new", "active"], 2: ["active"]}
+
+        async def info(id):
+            return {"id": id, "status": statuses[id].pop(0)}
+
+        drop.info = AsyncMock(side_effect=info)
+
+        self.assertEqual(
+            asyncio.run(drop.create({"names": ["people", "stuff"]}, wait=True, poll=2)),
+            [{"id": 1, "status": "active"}, {"id": 2, "status": "active"}]
+        )
+        drop.info.assert_has_awaits([call(1), call(2), call(1)])
+
+        drop.request = AsyncMock(return_value=[{"id": 1, "status": "new"}])
+        drop.info = AsyncMock(side_effect=Exception("Not yet"))
+
+        with self.assertRaisesRegex(DOBOTOPollingException, "Not yet"):
+            asyncio.run(drop.create({"names": ["people"]}, wait=True, timeout=-1))
+
+        drop.info = AsyncMock(return_value={"id": 1, "status": "new"})
+
+        with self.assertRaises(DOBOTOPollingException):
+            asyncio.run(drop.create({"names": ["people"]}, wait=True, timeout=-1))
+
+        with self.assertRaises(ValueError):
+            asyncio.run(drop.create({}))
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_create_sweep(self, mock_sleep):
+        """
+        create lists every Droplet to check on many when that's fewer calls than each by id
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.request = AsyncMock(side_effect=lambda *args, **kwargs: [
+            {"id": id, "status": "new"} for id in range(3)
+        ])
+        drop.count = AsyncMock(return_value=250)
+        drop.info_list = AsyncMock(side_effect=lambda ids, tag_name, sweep: [
+            {"id": id, "status": "active", "tags": ["web"]} for id in ids
+        ])
+
+        asyncio.run(drop.create({"names": ["a", "b", "c"]}, wait=True))
+
+        drop.info_list.assert_awaited_once_with([0, 1, 2], tag_name=None, sweep=2)
+        drop.count.assert_awaited_once_with(tag_name=None)
+
+        # Tagged lists just the tag, unless the tag has more pages than there are ids
+
+        drop.count = AsyncMock(return_value=350)
+        drop.info_list.reset_mock()
+
+        asyncio.run(drop.create({"names": ["a", "b", "c"], "tags": ["web"]}, wait=True))
+
+        drop.count.assert_awaited_once_with(tag_name="web")
+        drop.info_list.assert_awaited_once_with([0, 1, 2], tag_name="web", sweep=2)
+
+        drop.count = AsyncMock(return_value=2000)
+        drop.info_list.reset_mock()
+
+        asyncio.run(drop.create({"names": ["a", "b", "c"], "tags": ["web"]}, wait=True))
+
+        drop.info_list.assert_awaited_once_with([0, 1, 2], tag_name=None, sweep=10)
+
+        drop.count = AsyncMock(side_effect=DOBOTOException("down"))
+
+        self.assertEqual(asyncio.run(drop.sweep()), 20)
+
+    def test_info_list(self):
+        """
+        info_list gets few droplets by id and many or tagged from one list
+        """
+
+        drop = self.klass(*self.instantiate_args)
+
+        async def info(id):
+            if id == 5:
+                raise Exception("Not yet")
+            return {"id": id, "status": "new"}
+
+        async def droplets():
+            for id in [1, 2, 3]:
+                yield {"id": id, "status": "active"}
+
+        drop.info = AsyncMock(side_effect=info)
+        drop.list = AsyncMock(side_effect=lambda tag_name, stream: droplets())
+
+        self.assertEqual(asyncio.run(drop.info_list([2, 1])), [
+            {"id": 2, "status": "new"},
+            {"id": 1, "status": "new"}
+        ])
+        drop.list.assert_not_awaited()
+
+        results = asyncio.run(drop.info_list([3, 4, 5], tag_name="web"))
+        self.assertEqual(results[:2], [
+            {"id": 3, "status": "active"},
+            {"id": 4, "status": "new"}
+        ])
+        self.assertEqual(str(results[2]), "Not yet")
+        drop.list.assert_awaited_once_with(tag_name="web", stream=True)
+
+    def test_bulk_create(self):
+        """
+        bulk_create creates every batch and keeps the names' order
+        """
+
+        drop = self.klass(*self.instantiate_args)
+
+        async def create(attribs, wait, poll, timeout):
+            if "bad" in attribs["names"]:
+                raise DOBOTOException("bad batch")
+            return [{"name": name} for name in attribs["names"]]
+
+        drop.create = AsyncMock(side_effect=create)
+
+        droplets = asyncio.run(drop.bulk_create({"names": ["a", "b", "c", "bad"]}, True, batch=2))
+
+        self.assertEqual(droplets[:2], [{"name": "a"}, {"name": "b"}])
+        self.assertIsInstance(droplets[2], DOBOTOException)
+        self.assertIsInstance(droplets[3], DOBOTOException)
+        drop.create.assert_has_awaits([call({"names": ["a", "b"]}, True, 5, 300)])
+
+        # No more batches at once than workers
+
+        running = []
+        most = []
+
+        async def counted(attribs, wait, poll, timeout):
+            running.append(attribs)
+            most.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(attribs)
+            return [{"name": name} for name in attribs["names"]]
+
+        drop.create = AsyncMock(side_effect=counted)
+
+        asyncio.run(drop.bulk_create({"names": list("abcdef")}, batch=1, workers=2))
+        self.assertEqual(max(most), 2)
+
+        most.clear()
+        asyncio.run(drop.bulk_create({"names": list("abcdef")}, batch=1))
+        self.assertEqual(max(most), 6)
+
+    def test_bulk(self):
+        """
+        bulk awaits an action for every id, keyed by id with errors in place
+        """
+
+        drop = self.klass(*self.instantiate_args)
+
+        async def reboot(id, wait, poll, timeout):
+            if id == 2:
+                raise DOBOTOException("busy")
+            return {"id": id, "status": "completed" if wait else "in-progress"}
+
+        drop.reboot = AsyncMock(side_effect=reboot)
+
+        results = asyncio.run(drop.bulk("reboot", [1, 2], wait=True))
+
+        self.assertEqual(results[1], {"id": 1, "status": "completed"})
+        self.assertIsInstance(results[2], DOBOTOException)
+
+    def test_rolling(self):
+        """
+        rolling can be awaited and goes a window at a time
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = AsyncMock()
+        drop.list = AsyncMock(return_value=[{"id": 1}, {"id": 2}, {"id": 3}])
+        drop.bulk = AsyncMock(side_effect=lambda method, ids, **kwargs: {
+            id: {"id": id * 10, "status": "completed"} for id in ids
+        })
+        drop.info_list = AsyncMock(side_effect=lambda ids: [
+            {"id": id, "status": "active"} for id in ids
+        ])
+
+        windows = asyncio.run(drop.rolling("reboot", "web", window=2, load_balancer="lb"))
+
+        self.assertEqual([window["ids"] for window in windows], [[1, 2], [3]])
+        drop.do.load_balancer.droplet_remove.assert_has_awaits([call("lb", [1, 2]),
+                                                                call("lb", [3])])
+        drop.do.load_balancer.droplet_add.assert_has_awaits([call("lb", [1, 2]),
+                                                             call("lb", [3])])
+
+        # What couldn't be sent goes back, errored actions count as failed
+
+        drop.do = AsyncMock()
+        drop.bulk = AsyncMock(return_value={
+            1: DOBOTOException("not sent"),
+            2: {"id": 20, "status": "errored"},
+            3: DOBOTOPollingException(polling={"id": 30, "status": "in-progress"})
+        })
+
+        windows = asyncio.run(drop.rolling("reboot", "web", window=3, load_balancer="lb"))
+
+        self.assertFalse(windows[0]["healthy"])
+        drop.do.load_balancer.droplet_add.assert_awaited_once_with("lb", [1])
+
+    def test_present(self):
+        """
+        present works with name or names
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        listed = [
+            {"id": 1, "name": "people"},
+            {"id": 2, "name": "stuff"}
+        ]
+
+        async def listing():
+            for droplet in listed:
+                yield droplet
+
+        drop.list = AsyncMock(side_effect=lambda stream=False: listing() if stream else listed)
+
+        ids = [3, 4, 5]
+
+        async def create(attribs, wait, poll, timeout):
+            if "name" in attribs:
+                return {"id": ids.pop(0), "name": attribs["name"]}
+            return [{"id": ids.pop(0), "name": name} for name in attribs["names"]]
+
+        drop.create = AsyncMock(side_effect=create)
+
+        self.assertEqual(
+            asyncio.run(drop.present({"name": "people"})),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(drop.present({"name": "dogs"}, True, 2, 3)),
+            ({"id": 3, "name": "dogs"}, {"id": 3, "name": "dogs"})
+        )
+        self.assertEqual(
+            asyncio.run(drop.present({"names": ["stuff", "people"]})),
+            ([{"id": 2, "name": "stuff"}, {"id": 1, "name": "people"}], [])
+        )
+        self.assertEqual(
+            asyncio.run(drop.present({"names": ["cats", "people"]}, True, 4, 5)),
+            (
+                [{"id": 4, "name": "cats"}, {"id": 1, "name": "people"}],
+                [{"id": 4, "name": "cats"}]
+            )
+        )
+        drop.create.assert_has_awaits([call({"names": ["cats"]}, True, 4, 5)])
+
+        drop.create = AsyncMock(return_value=[{"name": "something"}])
+
+        with self.assertRaises(DOBOTOException):
+            asyncio.run(drop.present({"names": ["nothing"]}))
+
+        with self.assertRaises(ValueError):
+            asyncio.run(drop.present({}))
+
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.request', new_callable=AsyncMock)
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.action_result', new_callable=AsyncMock)
+    def test_reboot(self, mock_action_result, mock_request):
+        """
+        reboot can be awaited
+        """
+
+        mock_action_result.return_value = {"id": 1, "status": "completed"}
+
+        drop = self.klass(*self.instantiate_args)
+
+        self.assertEqual(
+            asyncio.run(drop.reboot(1, wait=True)), {"id": 1, "status": "completed"}
+        )
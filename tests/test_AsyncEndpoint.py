@@ -0,0 +1,319 @@
+"""
+This module contains tests for the AsyncEndpoint class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import MagicMock, AsyncMock, patch, call
+from doboto import AsyncEndpoint, AsyncTransport
+from doboto.exception import DOBOTOException, DOBOTONotFoundException, DOBOTOPollingException
+
+
+class TestAsyncEndpoint(TestCase):
+    """
+    This class implements unittests for the AsyncEndpoint class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_token, self.test_agent)
+
+        self.klass_name = "AsyncEndpoint"
+        self.klass = getattr(AsyncEndpoint, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncEndpoint class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncEndpoint, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncEndpoint class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_transport(self):
+        """
+        AsyncEndpoint makes an AsyncTransport of its own
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+        self.assertIsInstance(endpoint.transport, AsyncTransport.AsyncTransport)
+
+    def test_request(self):
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.transport = MagicMock()
+        response = MagicMock()
+        response.status_code = 200
+        response.json = MagicMock(return_value={"people": {"a": 1}})
+        endpoint.transport.request = AsyncMock(return_value=response)
+
+        result = asyncio.run(endpoint.request("people", "people", attribs={"b": 2}, params={"c": 2}))
+        self.assertEqual(result, {"a": 1})
+
+        endpoint.transport.request.assert_awaited_with(
+            "GET",
+            "people",
+            params={"c": 2},
+            data='{"b": 2}',
+            headers={
+                'Authorization': "Bearer %s" % self.test_token,
+                'User-Agent': self.test_agent,
+                'Content-Type': 'application/json'
+            }
+        )
+
+        with self.assertRaises(DOBOTOException):
+            asyncio.run(endpoint.request("people", "stuff"))
+
+        response.status_code = 204
+        self.assertIsNone(asyncio.run(endpoint.request("people")))
+
+        response.status_code = 202
+        with self.assertRaises(DOBOTOException):
+            asyncio.run(endpoint.request("people"))
+
+        response.json = MagicMock(return_value={"id": "not_found"})
+        with self.assertRaises(DOBOTONotFoundException):
+            asyncio.run(endpoint.request("people", "stuff"))
+
+    def test_pages(self):
+
+        fake_requests = []
+        fake_results = [
+            {"people": [1, 2, 3], "links": {"pages": {"next": "stuff"}}},
+            {"people": [4, 5, 6], "links": {"pages": {}}}
+        ]
+
+        async def fake_request(method, url, params=None, headers=None):
+            fake_requests.append({"url": url, "params": params})
+            response = MagicMock()
+            response.json = MagicMock(return_value=fake_results.pop(0))
+            return response
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.transport = MagicMock()
+        endpoint.transport.workers = 1
+        endpoint.transport.request = fake_request
+
+        self.assertEqual(
+            asyncio.run(endpoint.pages("people", "people", params={"c": 2})),
+            [1, 2, 3, 4, 5, 6]
+        )
+        self.assertEqual(fake_requests, [
+            {"url": "people", "params": {"c": 2, "per_page": 200}},
+            {"url": "stuff", "params": None}
+        ])
+
+        fake_results = [{"people": [1, 2, 3]}]
+
+        with self.assertRaises(DOBOTOException):
+            asyncio.run(endpoint.pages("people", "items"))
+
+    def test_iter_pages(self):
+        """
+        iter_pages yields items a page at a time
+        """
+
+        fake_requests = []
+        fake_results = [
+            {"people": [1, 2], "links": {"pages": {"next": "stuff"}}},
+            {"people": [3], "links": {"pages": {}}}
+        ]
+
+        async def fake_request(method, url, params=None, headers=None):
+            fake_requests.append(url)
+            response = MagicMock()
+            response.json = MagicMock(return_value=fake_results.pop(0))
+            return response
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.transport = MagicMock()
+        endpoint.transport.request = fake_request
+
+        async def first_two():
+            seen = []
+            async for item in await endpoint.pages("people", "people", stream=True):
+                seen.append(item)
+                if len(seen) == 2:
+                    break
+            return seen
+
+        self.assertEqual(asyncio.run(first_two()), [1, 2])
+        self.assertEqual(fake_requests, ["people"])
+
+    def test_total(self):
+        """
+        total can be awaited and reads meta off of a single page
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.page = AsyncMock(return_value={"people": [1], "meta": {"total": 1234}})
+
+        self.assertEqual(asyncio.run(endpoint.total("people", "people")), 1234)
+        endpoint.page.assert_awaited_once_with(
+            "people", "people", {"per_page": 1}, endpoint.headers()
+        )
+
+        endpoint.page = AsyncMock(return_value={"people": [1], "links": {"pages": {"next": "2"}}})
+        endpoint.pages = AsyncMock(return_value=[1, 2, 3])
+
+        self.assertEqual(asyncio.run(endpoint.total("people", "people")), 3)
+
+    def test_find_first(self):
+        """
+        find_first and exists can be awaited and page only until there's a match
+        """
+
+        fake_requests = []
+
+        async def fake_page(url, expect, params, headers):
+            fake_requests.append(url)
+            return {
+                "first": {"people": [{"name": "a"}], "links": {"pages": {"next": "second"}}},
+                "second": {"people": [{"name": "b"}], "links": {"pages": {}}}
+            }[url]
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.page = fake_page
+        endpoint.list = AsyncMock(
+            side_effect=lambda stream: endpoint.iter_pages("first", "people")
+        )
+
+        self.assertEqual(
+            asyncio.run(endpoint.find_first(lambda item: item["name"] == "a")), {"name": "a"}
+        )
+        self.assertEqual(fake_requests, ["first"])
+
+        self.assertTrue(asyncio.run(endpoint.exists(lambda item: item["name"] == "b")))
+        self.assertFalse(asyncio.run(endpoint.exists(lambda item: item["name"] == "c")))
+
+    def test_pages_parallel(self):
+        """
+        pages fetches every page after the first concurrently, in order
+        """
+
+        fake_requests = []
+
+        async def fake_request(method, url, params=None, headers=None):
+            fake_requests.append(url)
+            page = int(url.split("page=")[1].split("&")[0]) if "page=" in url else 1
+            response = MagicMock()
+            response.json = MagicMock(return_value={
+                "people": [page * 10, page * 10 + 1],
+                "links": {"pages": {"last": "http://x/people?page=3&per_page=200"}}
+            })
+            return response
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.transport = MagicMock()
+        endpoint.transport.workers = 2
+        endpoint.transport.request = fake_request
+
+        self.assertEqual(
+            asyncio.run(endpoint.pages("http://x/people", "people")),
+            [10, 11, 20, 21, 30, 31]
+        )
+        self.assertEqual(fake_requests, [
+            "http://x/people",
+            "http://x/people?page=2&per_page=200",
+            "http://x/people?page=3&per_page=200"
+        ])
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_action_result(self, mock_sleep):
+        """
+        action_result awaits the action then polls it until complete
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+
+        async def pending():
+            return {"id": 1, "status": "in-progress"}
+
+        self.assertEqual(
+            asyncio.run(endpoint.action_result(pending(), False, 2, 3)),
+            {"id": 1, "status": "in-progress"}
+        )
+
+        endpoint.do = MagicMock()
+        endpoint.do.action.info = AsyncMock(
+            side_effect=[Exception("Not yet"), {"id": 1, "status": "completed"}]
+        )
+
+        self.assertEqual(
+            asyncio.run(endpoint.action_result(pending(), True, 0, 3)),
+            {"id": 1, "status": "completed"}
+        )
+        mock_sleep.assert_has_awaits([call(1), call(1)])
+
+        endpoint.do.action.info = AsyncMock(side_effect=[Exception("Not yet")])
+
+        with self.assertRaisesRegex(DOBOTOPollingException, "DO API Timeout: Not yet"):
+            asyncio.run(endpoint.action_result(pending(), True, 4, -1))
+
+        endpoint.do.action.info = AsyncMock(return_value={"id": 1, "status": "in-progress"})
+
+        with self.assertRaisesRegex(DOBOTOPollingException, "DO API Timeout while polling"):
+            asyncio.run(endpoint.action_result(pending(), True, 4, -1))
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_actions_result(self, mock_sleep):
+        """
+        actions_result polls all in progress actions together
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.do = MagicMock()
+
+        endpoint.do.action.info_list = AsyncMock(side_effect=[
+            [Exception("Not yet"), {"id": 2, "status": "completed"}],
+            [{"id": 1, "status": "completed"}]
+        ])
+
+        self.assertEqual(
+            asyncio.run(endpoint.actions_result([
+                {"id": 1, "status": "in-progress"},
+                {"id": 2, "status": "in-progress"},
+                {"id": 3, "status": "completed"}
+            ], True, 2, 3)),
+            [
+                {"id": 1, "status": "completed"},
+                {"id": 2, "status": "completed"},
+                {"id": 3, "status": "completed"}
+            ]
+        )
+        endpoint.do.action.info_list.assert_has_awaits([call([1, 2]), call([1])])
+        mock_sleep.assert_has_awaits([call(2), call(2)])
+
+        endpoint.do.action.info_list = AsyncMock(return_value=[Exception("Not yet")])
+
+        with self.assertRaisesRegex(DOBOTOPollingException, "DO API Timeout: Not yet"):
+            asyncio.run(endpoint.actions_result(
+                [{"id": 1, "status": "in-progress"}], True, 4, -1
+            ))
+
+        endpoint.do.action.info_list = AsyncMock(
+            return_value=[{"id": 1, "status": "in-progress"}]
+        )
+
+        with self.assertRaisesRegex(DOBOTOPollingException, "DO API Timeout while polling"):
+            asyncio.run(endpoint.actions_result(
+                [{"id": 1, "status": "in-progress"}], True, 4, -1
+            ))
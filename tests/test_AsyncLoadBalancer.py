@@ -0,0 +1,106 @@
+"""
+This module contains tests for the AsyncLoadBalancer class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch, call
+from doboto import AsyncLoadBalancer
+from doboto.exception import DOBOTOPollingException
+
+
+class TestAsyncLoadBalancer(TestCase):
+    """
+    This class implements unittests for the AsyncLoadBalancer class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/load_balancers".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncLoadBalancer"
+        self.klass = getattr(AsyncLoadBalancer, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncLoadBalancer class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncLoadBalancer, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncLoadBalancer class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_create(self, mock_sleep):
+        """
+        create waits for an ip
+        """
+
+        load_balancer = self.klass(*self.instantiate_args)
+        load_balancer.request = AsyncMock(return_value={"id": 1, "ip": ""})
+        load_balancer.info = AsyncMock(side_effect=[
+            Exception("Not yet"), {"id": 1, "ip": "1.2.3.4"}
+        ])
+
+        self.assertEqual(
+            asyncio.run(load_balancer.create({"name": "people"})), {"id": 1, "ip": ""}
+        )
+        load_balancer.request.assert_awaited_with(
+            self.test_uri, "load_balancer", 'POST', attribs={"name": "people"}
+        )
+
+        self.assertEqual(
+            asyncio.run(load_balancer.create({"name": "people"}, wait=True, poll=0)),
+            {"id": 1, "ip": "1.2.3.4"}
+        )
+        mock_sleep.assert_has_awaits([call(1), call(1)])
+
+        load_balancer.info = AsyncMock(return_value={"id": 1, "ip": ""})
+
+        with self.assertRaises(DOBOTOPollingException):
+            asyncio.run(load_balancer.create({"name": "people"}, wait=True, timeout=-1))
+
+    def test_present(self):
+        """
+        present only creates if not listed
+        """
+
+        load_balancer = self.klass(*self.instantiate_args)
+        async def listing():
+            yield {"id": 1, "name": "people"}
+
+        load_balancer.list = AsyncMock(side_effect=lambda stream: listing())
+        load_balancer.create = AsyncMock(return_value={"id": 2, "name": "stuff"})
+
+        self.assertEqual(
+            asyncio.run(load_balancer.present({"name": "people"})),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(load_balancer.present({"name": "stuff"}, True, 2, 3)),
+            ({"id": 2, "name": "stuff"}, {"id": 2, "name": "stuff"})
+        )
+        load_balancer.create.assert_awaited_once_with({"name": "stuff"}, True, 2, 3)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(load_balancer.present({}))
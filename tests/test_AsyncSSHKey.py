@@ -0,0 +1,72 @@
+"""
+This module contains tests for the AsyncSSHKey class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock
+from doboto import AsyncSSHKey
+
+
+class TestAsyncSSHKey(TestCase):
+    """
+    This class implements unittests for the AsyncSSHKey class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/account/keys".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncSSHKey"
+        self.klass = getattr(AsyncSSHKey, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncSSHKey class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncSSHKey, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncSSHKey class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_present(self):
+        """
+        present only creates if not listed
+        """
+
+        ssh_key = self.klass(*self.instantiate_args)
+        async def listing():
+            yield {"id": 1, "name": "people"}
+
+        ssh_key.list = AsyncMock(side_effect=lambda stream: listing())
+        ssh_key.create = AsyncMock(return_value={"id": 2, "name": "stuff"})
+
+        self.assertEqual(
+            asyncio.run(ssh_key.present("people", "ssh-rsa")),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(ssh_key.present("stuff", "ssh-rsa")),
+            ({"id": 2, "name": "stuff"}, {"id": 2, "name": "stuff"})
+        )
+        ssh_key.create.assert_awaited_once_with("stuff", "ssh-rsa")
@@ -0,0 +1,69 @@
+"""
+This module contains tests for the AsyncSize class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch
+from doboto import AsyncSize, Size
+
+
+class TestAsyncSize(TestCase):
+    """
+    This class implements unittests for the AsyncSize class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncSize"
+        self.klass = getattr(AsyncSize, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncSize class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncSize, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncSize class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_is_size(self):
+        """
+        AsyncSize is a Size
+        """
+
+        self.assertIsInstance(self.klass(*self.instantiate_args), Size.Size)
+
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.pages', new_callable=AsyncMock)
+    def test_list(self, mock_pages):
+        """
+        list can be awaited
+        """
+
+        mock_pages.return_value = "awaited"
+
+        self.assertEqual(
+            asyncio.run(self.klass(*self.instantiate_args).list()), "awaited"
+        )
+        mock_pages.assert_awaited_with("{}/sizes".format(self.test_url), "sizes", stream=False)
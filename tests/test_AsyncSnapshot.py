@@ -0,0 +1,69 @@
+"""
+This module contains tests for the AsyncSnapshot class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch
+from doboto import AsyncSnapshot, Snapshot
+
+
+class TestAsyncSnapshot(TestCase):
+    """
+    This class implements unittests for the AsyncSnapshot class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncSnapshot"
+        self.klass = getattr(AsyncSnapshot, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncSnapshot class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncSnapshot, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncSnapshot class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_is_snapshot(self):
+        """
+        AsyncSnapshot is a Snapshot
+        """
+
+        self.assertIsInstance(self.klass(*self.instantiate_args), Snapshot.Snapshot)
+
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.request', new_callable=AsyncMock)
+    def test_info(self, mock_request):
+        """
+        info can be awaited
+        """
+
+        mock_request.return_value = "awaited"
+
+        self.assertEqual(
+            asyncio.run(self.klass(*self.instantiate_args).info(1)), "awaited"
+        )
+        mock_request.assert_awaited_with("{}/snapshots/1".format(self.test_url), "snapshot")
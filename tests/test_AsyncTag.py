@@ -0,0 +1,84 @@
+"""
+This module contains tests for the AsyncTag class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch
+from doboto import AsyncTag
+
+
+class TestAsyncTag(TestCase):
+    """
+    This class implements unittests for the AsyncTag class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/tags".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncTag"
+        self.klass = getattr(AsyncTag, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncTag class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncTag, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncTag class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_present(self):
+        """
+        present only creates if not listed
+        """
+
+        tag = self.klass(*self.instantiate_args)
+        async def listing():
+            yield {"id": 1, "name": "people"}
+
+        tag.list = AsyncMock(side_effect=lambda stream: listing())
+        tag.create = AsyncMock(return_value={"id": 2, "name": "stuff"})
+
+        self.assertEqual(
+            asyncio.run(tag.present("people")),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(tag.present("stuff")),
+            ({"id": 2, "name": "stuff"}, {"id": 2, "name": "stuff"})
+        )
+        tag.create.assert_awaited_once_with("stuff")
+
+    @patch('doboto.AsyncEndpoint.AsyncEndpoint.pages', new_callable=AsyncMock)
+    def test_name_list(self, mock_pages):
+        """
+        name_list awaits the tags
+        """
+
+        mock_pages.return_value = [{"name": "people"}, {"name": "stuff"}]
+
+        tag = self.klass(*self.instantiate_args)
+        self.assertEqual(asyncio.run(tag.name_list()), ["people", "stuff"])
+        mock_pages.assert_awaited_with(self.test_uri, "tags")
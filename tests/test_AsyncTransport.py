@@ -0,0 +1,282 @@
+"""
+This module contains tests for the AsyncTransport class
+"""
+
+import asyncio
+from unittest import TestCase
+import aiohttp
+from mock import MagicMock, AsyncMock, patch
+from doboto import AsyncTransport, Cache, Retry, RateLimiter
+
+
+class TestAsyncTransport(TestCase):
+    """
+    This class implements unittests for the AsyncTransport class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "AsyncTransport"
+        self.klass = getattr(AsyncTransport, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncTransport class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncTransport, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncTransport class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_request(self):
+        """
+        request reads the aiohttp response into a Response
+        """
+
+        transport = self.klass()
+
+        response = MagicMock()
+        response.status = 200
+        response.headers = {"RateLimit-Remaining": "10"}
+        response.text = AsyncMock(return_value='{"a": 1}')
+
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(return_value=context)
+
+        result = asyncio.run(transport.request(
+            "GET", "people", params={"private": True, "page": 2}, data="null", headers={"b": 2}
+        ))
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.json(), {"a": 1})
+        self.assertEqual(result.headers["ratelimit-remaining"], "10")
+        transport.session.request.assert_called_with(
+            "GET", "people", params={"private": "True", "page": 2}, data="null", headers={"b": 2}
+        )
+
+    def test_request_cache(self):
+        """
+        request answers cached GETs without sending them
+        """
+
+        transport = self.klass(cache=Cache.Cache({"regions": 60}))
+
+        response = MagicMock()
+        response.status = 200
+        response.headers = {}
+        response.text = AsyncMock(return_value='{"regions": []}')
+
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(return_value=context)
+
+        first = asyncio.run(transport.request("GET", "http://do/v2/regions"))
+        second = asyncio.run(transport.request("GET", "http://do/v2/regions"))
+
+        self.assertIs(first, second)
+        self.assertEqual(transport.session.request.call_count, 1)
+
+    def test_request_coalesce(self):
+        """
+        request shares one call between identical GETs in flight at the same time
+        """
+
+        transport = self.klass()
+
+        response = MagicMock()
+        response.status = 200
+        response.headers = {}
+        response.text = AsyncMock(return_value='{"regions": []}')
+
+        async def enter():
+            await asyncio.sleep(0.01)
+            return response
+
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(side_effect=enter)
+        context.__aexit__ = AsyncMock(return_value=False)
+
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(return_value=context)
+
+        async def together():
+            return await asyncio.gather(
+                transport.request("GET", "http://do/v2/regions"),
+                transport.request("GET", "http://do/v2/regions"),
+                transport.request("GET", "http://do/v2/sizes")
+            )
+
+        first, second, sizes = asyncio.run(together())
+
+        self.assertIs(first, second)
+        self.assertEqual(transport.session.request.call_count, 2)
+        self.assertEqual(transport.stats(), {"sent": 2, "coalesced": 1})
+        self.assertEqual(transport.flights, {})
+
+    @staticmethod
+    def answer(status):
+        """
+        What session.request gives back for a response with this status
+        """
+
+        response = MagicMock()
+        response.status = status
+        response.headers = {}
+        response.text = AsyncMock(return_value='{"regions": []}')
+
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+
+        return context
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_request_retry(self, mock_sleep):
+        """
+        request retries connection errors and retryable statuses as the policy allows
+        """
+
+        transport = self.klass(retries=Retry.Retry(attempts=3, jitter=False))
+
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(side_effect=[
+            aiohttp.ClientConnectionError("reset"), self.answer(503), self.answer(200)
+        ])
+
+        response = asyncio.run(transport.request("GET", "http://do/v2/regions"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(transport.session.request.call_count, 3)
+        self.assertEqual(transport.stats()["sent"], 3)
+        self.assertEqual([args[0][0] for args in mock_sleep.await_args_list], [0.5, 1.0])
+
+        # Not past the attempts, and not for methods that aren't safe to repeat
+
+        transport.session.request = MagicMock(side_effect=[self.answer(503)] * 3)
+
+        response = asyncio.run(transport.request("GET", "http://do/v2/regions"))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(transport.session.request.call_count, 3)
+
+        transport.session.request = MagicMock(side_effect=[self.answer(503)])
+
+        response = asyncio.run(transport.request("POST", "http://do/v2/droplets"))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(transport.session.request.call_count, 1)
+
+        transport = self.klass(retries=0)
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(side_effect=aiohttp.ClientConnectionError("reset"))
+
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            asyncio.run(transport.request("GET", "http://do/v2/regions"))
+
+        self.assertEqual(transport.retries.attempts, 1)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_request_rate_limit(self, mock_sleep):
+        """
+        request is paced by the rate limiter, waiting out 429s before retrying
+        """
+
+        limiter = RateLimiter.RateLimiter(rate=None, waits=1)
+        limiter.acquire_async = AsyncMock()
+        limiter.exhausted = MagicMock()
+
+        transport = self.klass(rate_limiter=limiter)
+
+        limited = self.answer(429)
+        limited.__aenter__.return_value.headers = {"Retry-After": "2"}
+
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(side_effect=[limited, self.answer(200)])
+
+        response = asyncio.run(transport.request("POST", "http://do/v2/droplets"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(limiter.acquire_async.await_count, 2)
+        limiter.exhausted.assert_called_once_with({"Retry-After": "2"})
+        mock_sleep.assert_not_awaited()
+
+        # Past its waits the 429 goes to the retry policy, and False doesn't limit at all
+
+        transport.session.request = MagicMock(side_effect=[self.answer(429)] * 2)
+
+        response = asyncio.run(transport.request("POST", "http://do/v2/droplets"))
+
+        self.assertEqual(response.status_code, 429)
+
+        self.assertIsInstance(self.klass().rate_limiter, RateLimiter.RateLimiter)
+
+        transport = self.klass(rate_limiter=False)
+        transport.session = MagicMock()
+        transport.session.closed = False
+        transport.session.request = MagicMock(return_value=self.answer(200))
+
+        self.assertEqual(
+            asyncio.run(transport.request("GET", "http://do/v2/regions")).status_code, 200
+        )
+
+    @patch('doboto.AsyncTransport.aiohttp', None)
+    def test_request_executor(self):
+        """
+        request falls back to a pooled Transport in the executor without aiohttp
+        """
+
+        transport = self.klass(pool_size=3, retries=2)
+        self.assertEqual(transport.transport.pool_size, 3)
+        self.assertIs(transport.transport.retries, transport.retries)
+        self.assertIs(transport.transport.rate_limiter, transport.rate_limiter)
+        self.assertEqual(transport.retries.attempts, 3)
+
+        response = MagicMock()
+        transport.transport.request = MagicMock(return_value=response)
+
+        self.assertEqual(
+            asyncio.run(transport.request("GET", "people", params={"a": 1})), response
+        )
+        transport.transport.request.assert_called_with(
+            "GET", "people", params={"a": 1}, data=None, headers=None
+        )
+
+    def test_close(self):
+        """
+        close closes the session
+        """
+
+        transport = self.klass()
+        transport.session = MagicMock()
+        transport.session.close = AsyncMock()
+
+        asyncio.run(transport.close())
+        transport.session.close.assert_awaited_once_with()
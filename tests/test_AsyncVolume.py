@@ -0,0 +1,124 @@
+"""
+This module contains tests for the AsyncVolume class
+"""
+
+import asyncio
+from unittest import TestCase
+from mock import AsyncMock, patch, call
+from doboto import AsyncVolume
+from doboto.exception import DOBOTONotFoundException, DOBOTOPollingException
+
+
+class TestAsyncVolume(TestCase):
+    """
+    This class implements unittests for the AsyncVolume class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "http://abc.example.com"
+        self.test_uri = "{}/volumes".format(self.test_url)
+        self.test_do = "do"
+        self.test_token = "abc123"
+        self.test_agent = "Unit"
+        self.instantiate_args = (self.test_do, self.test_token, self.test_url, self.test_agent)
+
+        self.klass_name = "AsyncVolume"
+        self.klass = getattr(AsyncVolume, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        AsyncVolume class is defined
+        """
+
+        self.assertTrue(hasattr(AsyncVolume, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        AsyncVolume class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(*self.instantiate_args)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_create(self, mock_sleep):
+        """
+        create waits for the volume to be found
+        """
+
+        volume = self.klass(*self.instantiate_args)
+        volume.request = AsyncMock(return_value={"id": 1})
+        volume.info = AsyncMock(side_effect=[
+            DOBOTONotFoundException(), {"id": 1, "name": "people"}
+        ])
+
+        self.assertEqual(asyncio.run(volume.create({"name": "people"})), {"id": 1})
+
+        self.assertEqual(
+            asyncio.run(volume.create({"name": "people"}, wait=True, poll=0)),
+            {"id": 1, "name": "people"}
+        )
+        mock_sleep.assert_has_awaits([call(1), call(1)])
+
+        volume.info = AsyncMock(side_effect=Exception("Not yet"))
+
+        with self.assertRaisesRegex(DOBOTOPollingException, "Not yet"):
+            asyncio.run(volume.create({"name": "people"}, wait=True, timeout=-1))
+
+        volume.info = AsyncMock(side_effect=DOBOTONotFoundException())
+
+        with self.assertRaises(DOBOTOPollingException):
+            asyncio.run(volume.create({"name": "people"}, wait=True, timeout=-1))
+
+    def test_present(self):
+        """
+        present only creates if not listed
+        """
+
+        volume = self.klass(*self.instantiate_args)
+        async def listing():
+            yield {"id": 1, "name": "people"}
+
+        volume.list = AsyncMock(side_effect=lambda stream: listing())
+        volume.create = AsyncMock(return_value={"id": 2, "name": "stuff"})
+
+        self.assertEqual(
+            asyncio.run(volume.present({"name": "people"})),
+            ({"id": 1, "name": "people"}, None)
+        )
+        self.assertEqual(
+            asyncio.run(volume.present({"name": "stuff"}, True, 2, 3)),
+            ({"id": 2, "name": "stuff"}, {"id": 2, "name": "stuff"})
+        )
+        volume.create.assert_awaited_once_with({"name": "stuff"}, True, 2, 3)
+
+    def test_info(self):
+        """
+        info works with id or name and region
+        """
+
+        volume = self.klass(*self.instantiate_args)
+        volume.request = AsyncMock(return_value={"id": 1})
+
+        self.assertEqual(asyncio.run(volume.info(1)), {"id": 1})
+        volume.request.assert_awaited_with("{}/1".format(self.test_uri), "volume")
+
+        volume.request = AsyncMock(return_value=[{"id": 2}])
+
+        self.assertEqual(asyncio.run(volume.info(name="people", region="nyc3")), {"id": 2})
+        volume.request.assert_awaited_with(
+            self.test_uri, "volumes", params={"name": "people", "region": "nyc3"}
+        )
+
+        with self.assertRaises(ValueError):
+            asyncio.run(volume.info())
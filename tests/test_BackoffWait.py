@@ -0,0 +1,52 @@
+"""
+This module contains tests for the BackoffWait class
+"""
+
+from unittest import TestCase
+from doboto import BackoffWait
+
+
+class TestBackoffWait(TestCase):
+    """
+    This class implements unittests for the BackoffWait class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "BackoffWait"
+        self.klass = getattr(BackoffWait, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        BackoffWait class is defined
+        """
+
+        self.assertTrue(hasattr(BackoffWait, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        BackoffWait class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_delay(self):
+        """
+        delay grows exponentially up to the cap
+        """
+
+        wait = self.klass(initial=2, factor=3, cap=40)
+
+        self.assertEqual([wait.delay(attempt) for attempt in range(5)], [2, 6, 18, 40, 40])
+
+        self.assertEqual(self.klass(initial=0).delay(0), 1)
@@ -0,0 +1,434 @@
+"""
+This module contains tests for the Cache class
+"""
+
+from unittest import TestCase
+import json
+from mock import MagicMock, patch
+from doboto import Cache, Transport
+
+
+class TestCache(TestCase):
+    """
+    This class implements unittests for the Cache class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_url = "https://api.digitalocean.com/v2"
+        self.test_headers = {"Authorization": "Bearer abc123"}
+
+        self.klass_name = "Cache"
+        self.klass = getattr(Cache, self.klass_name)
+
+    def response(self, status_code=200):
+        """
+        A response to keep
+        """
+
+        response = MagicMock()
+        response.status_code = status_code
+        return response
+
+    def body(self, body, status_code=200):
+        """
+        A response with a JSON body
+        """
+
+        return Transport.Response(status_code, {"Content-Type": "application/json"},
+                                  json.dumps(body))
+
+    def kept(self, cache, path, params=None, headers=None):
+        """
+        Body of what's kept for a GET, None if nothing is
+        """
+
+        response = cache.get("GET", "%s/%s" % (self.test_url, path), params,
+                             headers if headers is not None else self.test_headers)
+
+        return response.json() if response is not None else None
+
+    def test_class_exists(self):
+        """
+        Cache class is defined
+        """
+
+        self.assertTrue(hasattr(Cache, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Cache class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_ttl(self):
+        """
+        ttl matches collections and params, the most specific rule winning
+        """
+
+        cache = self.klass({"regions": 60, "images": 10, "images?type=distribution": 600})
+
+        self.assertEqual(cache.ttl("%s/regions" % self.test_url), 60)
+        self.assertEqual(cache.ttl("%s/regions" % self.test_url, {"page": 2}), 60)
+        self.assertEqual(cache.ttl("%s/images" % self.test_url, {"private": True}), 10)
+        self.assertEqual(cache.ttl("%s/images" % self.test_url, {"type": "distribution"}), 600)
+        self.assertEqual(cache.ttl("%s/images?type=distribution&page=2" % self.test_url), 600)
+        self.assertIsNone(cache.ttl("%s/images/1234" % self.test_url))
+        self.assertIsNone(cache.ttl("%s/droplets" % self.test_url))
+
+        cache = self.klass({"droplets/*": 60})
+
+        self.assertEqual(cache.ttl("%s/droplets/1234" % self.test_url), 60)
+        self.assertIsNone(cache.ttl("%s/droplets" % self.test_url))
+
+        self.assertEqual(self.klass().ttl("%s/account" % self.test_url), 300)
+        self.assertIsNone(self.klass().ttl("%s/images" % self.test_url, {"private": True}))
+
+    @patch('time.time')
+    def test_get_put(self, mock_time):
+        """
+        get answers kept GETs until they expire, per token
+        """
+
+        mock_time.return_value = 100
+
+        cache = self.klass({"regions": 60})
+        url = "%s/regions" % self.test_url
+        response = self.response()
+
+        self.assertIsNone(cache.get("GET", url, {"per_page": 200}, self.test_headers))
+
+        cache.put("GET", url, {"per_page": 200}, self.test_headers, response)
+
+        self.assertIs(cache.get("GET", url, {"per_page": 200}, self.test_headers), response)
+        self.assertIsNone(cache.get("GET", url, {"per_page": 200}, {"Authorization": "other"}))
+        self.assertIsNone(cache.get("GET", url, {"per_page": 20}, self.test_headers))
+        self.assertIsNone(cache.get("POST", url, {"per_page": 200}, self.test_headers))
+
+        mock_time.return_value = 161
+
+        self.assertIsNone(cache.get("GET", url, {"per_page": 200}, self.test_headers))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 4, "size": 0})
+
+        # Only successful GETs of cached collections are kept
+
+        cache.put("GET", url, None, self.test_headers, self.response(500))
+        cache.put("POST", url, None, self.test_headers, response)
+        cache.put("GET", "%s/droplets" % self.test_url, None, self.test_headers, response)
+
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_token(self):
+        """
+        token is a hash of the Authorization header, kept in keys instead of it
+        """
+
+        token = self.klass.token(self.test_headers)
+
+        self.assertEqual(len(token), 64)
+        self.assertNotIn("abc123", token)
+        self.assertEqual(token, self.klass.token({"Authorization": "Bearer abc123"}))
+        self.assertNotEqual(token, self.klass.token({"Authorization": "other"}))
+        self.assertIsNone(self.klass.token(None))
+        self.assertEqual(self.klass.key("%s/regions" % self.test_url, None, self.test_headers)[5],
+                         token)
+
+    def test_lru(self):
+        """
+        put evicts the least recently used
+        """
+
+        cache = self.klass({"regions": 60, "sizes": 60, "account": 60}, size=2)
+
+        regions = self.response()
+        sizes = self.response()
+
+        cache.put("GET", "%s/regions" % self.test_url, response=regions)
+        cache.put("GET", "%s/sizes" % self.test_url, response=sizes)
+
+        self.assertIs(cache.get("GET", "%s/regions" % self.test_url), regions)
+
+        cache.put("GET", "%s/account" % self.test_url, response=self.response())
+
+        self.assertIs(cache.get("GET", "%s/regions" % self.test_url), regions)
+        self.assertIsNone(cache.get("GET", "%s/sizes" % self.test_url))
+
+    def test_invalidate(self):
+        """
+        invalidate drops everything or just a collection
+        """
+
+        cache = self.klass({"regions": 60, "images": 60})
+
+        cache.put("GET", "%s/regions" % self.test_url, response=self.response())
+        cache.put("GET", "%s/images" % self.test_url, {"type": "distribution"}, None,
+                  self.response())
+        cache.put("GET", "%s/images" % self.test_url, {"type": "application"}, None,
+                  self.response())
+
+        cache.invalidate("images?type=application")
+        self.assertEqual(cache.stats()["size"], 2)
+
+        cache.invalidate("images")
+        self.assertEqual(cache.stats()["size"], 1)
+        self.assertIsNotNone(cache.get("GET", "%s/regions" % self.test_url))
+
+        cache.invalidate()
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_mutated(self):
+        """
+        put drops what a successful change could have changed
+        """
+
+        cache = self.klass({"droplets": 60, "droplets/*": 60, "images": 60})
+
+        cache.put("GET", "%s/droplets" % self.test_url, {"page": 2}, None, self.response())
+        cache.put("GET", "%s/droplets/1" % self.test_url, None, None, self.response())
+        cache.put("GET", "%s/droplets/2" % self.test_url, None, None, self.response())
+        cache.put("GET", "%s/images" % self.test_url, None, None, self.response())
+
+        cache.put("POST", "%s/droplets/1/actions" % self.test_url, None, None, self.response(422))
+        self.assertEqual(cache.stats()["size"], 4)
+
+        cache.put("POST", "%s/droplets/1/actions" % self.test_url, None, None, self.response(201))
+        self.assertEqual(cache.stats()["size"], 2)
+        self.assertIsNotNone(cache.get("GET", "%s/droplets/2" % self.test_url))
+        self.assertIsNotNone(cache.get("GET", "%s/images" % self.test_url))
+
+        cache.put("DELETE", "%s/droplets" % self.test_url, {"tag_name": "web"}, None,
+                  self.response(204))
+        self.assertEqual(cache.stats()["size"], 1)
+
+        # Actions on everything with a tag could've changed any Droplet
+
+        cache.put("GET", "%s/droplets" % self.test_url, None, None, self.response())
+        cache.put("GET", "%s/droplets/1" % self.test_url, None, None, self.response())
+        cache.put("GET", "%s/droplets/2" % self.test_url, None, None, self.response())
+
+        cache.put("POST", "%s/droplets/actions" % self.test_url, {"tag_name": "web"}, None,
+                  self.response(201))
+        self.assertEqual(cache.stats()["size"], 1)
+        self.assertIsNone(cache.get("GET", "%s/droplets/1" % self.test_url))
+        self.assertIsNotNone(cache.get("GET", "%s/images" % self.test_url))
+
+    def test_insert(self):
+        """
+        put adds what was created to the last page of the listings it belongs in
+        """
+
+        cache = self.klass({"droplets": 60, "domains": 60})
+        url = "%s/droplets" % self.test_url
+
+        cache.put("GET", url, {"page": 1, "per_page": 1}, self.test_headers, self.body({
+            "droplets": [{"id": 1}], "links": {"pages": {"next": "2"}}, "meta": {"total": 2}
+        }))
+        cache.put("GET", url, {"page": 2, "per_page": 1}, self.test_headers, self.body({
+            "droplets": [{"id": 2}], "links": {}, "meta": {"total": 2}
+        }))
+        cache.put("GET", url, {"tag_name": "web"}, self.test_headers, self.body({
+            "droplets": [], "links": {}, "meta": {"total": 0}
+        }))
+        cache.put("GET", url, {"tag_name": "db"}, self.test_headers, self.body({
+            "droplets": [], "links": {}, "meta": {"total": 0}
+        }))
+        cache.put("GET", "%s/domains" % self.test_url, {"page": 2}, self.test_headers,
+                  self.body({"domains": [], "links": {"pages": {"next": "3"}}}))
+
+        cache.put("POST", url, None, self.test_headers, self.body({
+            "droplet": {"id": 3, "tags": ["web"]}, "links": {"actions": []}
+        }, 202), data=json.dumps({"name": "a", "tags": ["web"]}))
+
+        self.assertEqual(self.kept(cache, "droplets", {"page": 1, "per_page": 1}), {
+            "droplets": [{"id": 1}], "links": {"pages": {"next": "2"}}, "meta": {"total": 3}
+        })
+        self.assertEqual(self.kept(cache, "droplets", {"page": 2, "per_page": 1}), {
+            "droplets": [{"id": 2}, {"id": 3, "tags": ["web"]}], "links": {},
+            "meta": {"total": 3}
+        })
+        self.assertEqual(self.kept(cache, "droplets", {"tag_name": "web"})["droplets"],
+                         [{"id": 3, "tags": ["web"]}])
+        self.assertEqual(self.kept(cache, "droplets", {"tag_name": "db"})["droplets"], [])
+
+        # A listing without its last page kept is dropped
+
+        cache.put("POST", "%s/domains" % self.test_url, None, self.test_headers,
+                  self.body({"domain": {"name": "example.com"}}, 201))
+
+        self.assertIsNone(self.kept(cache, "domains", {"page": 2}))
+
+    def test_replace(self):
+        """
+        put patches what was updated over what's kept of it
+        """
+
+        cache = self.klass({"domains/*/records": 60, "domains/*/records/*": 60})
+        url = "%s/domains/example.com/records" % self.test_url
+
+        cache.put("GET", url, None, self.test_headers, self.body({
+            "domain_records": [{"id": 1, "data": "a"}, {"id": 2, "data": "b"}]
+        }))
+        cache.put("GET", "%s/1" % url, None, self.test_headers, self.body({
+            "domain_record": {"id": 1, "data": "a"}
+        }))
+
+        cache.put("PUT", "%s/1" % url, None, self.test_headers, self.body({
+            "domain_record": {"id": 1, "data": "c"}
+        }), data=json.dumps({"data": "c"}))
+
+        self.assertEqual(self.kept(cache, "domains/example.com/records"), {
+            "domain_records": [{"id": 1, "data": "c"}, {"id": 2, "data": "b"}]
+        })
+        self.assertEqual(self.kept(cache, "domains/example.com/records/1"), {
+            "domain_record": {"id": 1, "data": "c"}
+        })
+
+    def test_remove(self):
+        """
+        put takes what was destroyed out of listings and drops what's under it
+        """
+
+        cache = self.klass({"droplets": 60, "droplets/*": 60, "droplets/*/snapshots": 60})
+        url = "%s/droplets" % self.test_url
+
+        cache.put("GET", url, {"page": 1}, self.test_headers, self.body({
+            "droplets": [{"id": 1}, {"id": 2}], "links": {"pages": {"next": "2"}},
+            "meta": {"total": 3}
+        }))
+        cache.put("GET", url, {"page": 2}, self.test_headers, self.body({
+            "droplets": [{"id": 3}], "links": {}, "meta": {"total": 3}
+        }))
+        cache.put("GET", "%s/1" % url, None, self.test_headers, self.body({"droplet": {"id": 1}}))
+        cache.put("GET", "%s/1/snapshots" % url, None, self.test_headers,
+                  self.body({"snapshots": []}))
+        cache.put("GET", "%s/2" % url, None, self.test_headers, self.body({"droplet": {"id": 2}}))
+
+        cache.put("DELETE", "%s/1" % url, None, self.test_headers, self.body({}, 204))
+
+        self.assertEqual(self.kept(cache, "droplets", {"page": 1}), {
+            "droplets": [{"id": 2}], "links": {"pages": {"next": "2"}}, "meta": {"total": 2}
+        })
+        self.assertEqual(self.kept(cache, "droplets", {"page": 2})["meta"], {"total": 2})
+        self.assertIsNone(self.kept(cache, "droplets/1"))
+        self.assertIsNone(self.kept(cache, "droplets/1/snapshots"))
+        self.assertIsNotNone(self.kept(cache, "droplets/2"))
+
+        # What other tokens kept is dropped rather than patched
+
+        cache.put("GET", "%s/2" % url, None, {"Authorization": "other"},
+                  self.body({"droplet": {"id": 2}}))
+
+        cache.put("DELETE", "%s/2" % url, None, self.test_headers, self.body({}, 204))
+
+        self.assertIsNone(self.kept(cache, "droplets/2", headers={"Authorization": "other"}))
+        self.assertEqual(self.kept(cache, "droplets", {"page": 2})["meta"], {"total": 1})
+
+    def test_tagged(self):
+        """
+        put patches tags onto and off of what was tagged and the listings by tag
+        """
+
+        cache = self.klass({"droplets": 60, "droplets/*": 60, "tags": 60})
+        url = "%s/droplets" % self.test_url
+
+        cache.put("GET", url, None, self.test_headers, self.body({
+            "droplets": [{"id": 1, "tags": []}, {"id": 2, "tags": ["web"]}], "links": {}
+        }))
+        cache.put("GET", url, {"tag_name": "web"}, self.test_headers, self.body({
+            "droplets": [{"id": 2, "tags": ["web"]}], "links": {}, "meta": {"total": 1}
+        }))
+        cache.put("GET", "%s/1" % url, None, self.test_headers, self.body({
+            "droplet": {"id": 1, "tags": []}
+        }))
+        cache.put("GET", "%s/tags" % self.test_url, None, self.test_headers, self.body({
+            "tags": [{"name": "web"}]
+        }))
+
+        resources = json.dumps({"resources": [{"resource_id": "1", "resource_type": "droplet"}]})
+
+        cache.put("POST", "%s/tags/web/resources" % self.test_url, None, self.test_headers,
+                  self.body({}, 204), data=resources)
+
+        self.assertEqual(self.kept(cache, "droplets")["droplets"], [
+            {"id": 1, "tags": ["web"]}, {"id": 2, "tags": ["web"]}
+        ])
+        self.assertEqual(self.kept(cache, "droplets", {"tag_name": "web"}), {
+            "droplets": [{"id": 2, "tags": ["web"]}, {"id": 1, "tags": ["web"]}],
+            "links": {}, "meta": {"total": 2}
+        })
+        self.assertEqual(self.kept(cache, "droplets/1"), {"droplet": {"id": 1, "tags": ["web"]}})
+        self.assertIsNone(self.kept(cache, "tags"))
+
+        cache.put("DELETE", "%s/tags/web/resources" % self.test_url, None, self.test_headers,
+                  self.body({}, 204), data=resources)
+
+        self.assertEqual(self.kept(cache, "droplets")["droplets"], [
+            {"id": 1, "tags": []}, {"id": 2, "tags": ["web"]}
+        ])
+        self.assertEqual(self.kept(cache, "droplets", {"tag_name": "web"}), {
+            "droplets": [{"id": 2, "tags": ["web"]}], "links": {}, "meta": {"total": 1}
+        })
+
+        # Tagging what isn't kept drops the listing by tag
+
+        cache.put("POST", "%s/tags/web/resources" % self.test_url, None, self.test_headers,
+                  self.body({}, 204), data=json.dumps({
+                      "resources": [{"resource_id": "9", "resource_type": "droplet"}]
+                  }))
+
+        self.assertIsNone(self.kept(cache, "droplets", {"tag_name": "web"}))
+        self.assertIsNotNone(self.kept(cache, "droplets"))
+
+    def test_attached(self):
+        """
+        put patches volumes attached to and detached from droplets onto both
+        """
+
+        cache = self.klass({"droplets/*": 60, "volumes": 60})
+
+        cache.put("GET", "%s/volumes" % self.test_url, None, self.test_headers, self.body({
+            "volumes": [{"id": "v", "name": "data", "region": {"slug": "nyc1"},
+                         "droplet_ids": []}]
+        }))
+        cache.put("GET", "%s/droplets/1" % self.test_url, None, self.test_headers, self.body({
+            "droplet": {"id": 1, "volume_ids": []}
+        }))
+
+        cache.put("POST", "%s/volumes/actions" % self.test_url, None, self.test_headers,
+                  self.body({"action": {"id": 5}}, 202), data=json.dumps({
+                      "type": "attach", "droplet_id": 1, "volume_name": "data",
+                      "region": "nyc1"
+                  }))
+
+        self.assertEqual(self.kept(cache, "volumes")["volumes"][0]["droplet_ids"], [1])
+        self.assertEqual(self.kept(cache, "droplets/1"),
+                         {"droplet": {"id": 1, "volume_ids": ["v"]}})
+
+        cache.put("POST", "%s/volumes/v/actions" % self.test_url, None, self.test_headers,
+                  self.body({"action": {"id": 6}}, 202), data=json.dumps({
+                      "type": "detach", "droplet_id": 1
+                  }))
+
+        self.assertEqual(self.kept(cache, "volumes")["volumes"][0]["droplet_ids"], [])
+        self.assertEqual(self.kept(cache, "droplets/1"), {"droplet": {"id": 1, "volume_ids": []}})
+
+        # Other volume actions drop what they could've changed
+
+        cache.put("POST", "%s/volumes/v/actions" % self.test_url, None, self.test_headers,
+                  self.body({"action": {"id": 7}}, 202), data=json.dumps({
+                      "type": "resize", "size_gigabytes": 100
+                  }))
+
+        self.assertIsNone(self.kept(cache, "volumes"))
+        self.assertIsNotNone(self.kept(cache, "droplets/1"))
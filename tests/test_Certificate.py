@@ -50,6 +50,18 @@ class TestCertificate(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Certificate.Certificate.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        certificate = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(certificate.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "certificates")
+
     @patch('doboto.Certificate.Certificate.pages')
     def test_list(self, mock_pages):
         """
@@ -59,7 +71,7 @@ class TestCertificate(TestCase):
         certificate = self.klass(*self.instantiate_args)
 
         certificate.list()
-        mock_pages.assert_called_with(self.test_uri, "certificates")
+        mock_pages.assert_called_with(self.test_uri, "certificates", stream=False)
 
 
     @patch('doboto.Certificate.Certificate.request')
@@ -3,7 +3,8 @@ This module contains tests for the main DO class
 """
 
 from unittest import TestCase
-from doboto import DO
+from mock import MagicMock
+from doboto import DO, Transport, Waiter, Cache, RateLimiter, FakeAPI, FakeServer
 
 
 class TestDO(TestCase):
@@ -45,3 +46,149 @@ class TestDO(TestCase):
             exc_thrown = True
 
         self.assertFalse(exc_thrown)
+
+    def test_transport(self):
+        """
+        DO shares one transport across every endpoint
+        """
+
+        do = self.klass(*self.instantiate_args)
+        self.assertIsInstance(do.transport, Transport.Transport)
+        self.assertIs(do.droplet.transport, do.transport)
+        self.assertIs(do.ssh_key.transport, do.transport)
+
+        transport = Transport.Transport(pool_size=2)
+        do = self.klass(*self.instantiate_args, transport=transport)
+        self.assertIs(do.transport, transport)
+        self.assertIs(do.tag.transport, transport)
+
+    def test_waiter(self):
+        """
+        DO has one waiter for everything waited on
+        """
+
+        do = self.klass(*self.instantiate_args)
+        self.assertIsInstance(do.waiter, Waiter.Waiter)
+        self.assertIs(do.waiter.do, do)
+
+    def test_close(self):
+        """
+        close stops the waiter and closes the transport
+        """
+
+        do = self.klass(*self.instantiate_args)
+        do.waiter.close = MagicMock()
+        do.transport.close = MagicMock()
+
+        do.close()
+
+        do.waiter.close.assert_called_once_with()
+        do.transport.close.assert_called_once_with()
+
+    def test_map(self):
+        """
+        map calls with every item at once, in order, exceptions in place
+        """
+
+        do = self.klass(*self.instantiate_args)
+        failure = Exception("nope")
+
+        def double(item):
+            if item == 2:
+                raise failure
+            return item * 2
+
+        self.assertEqual(do.map(double, iter([1, 2, 3]), workers=3), [2, failure, 6])
+
+        do.action.concurrently = MagicMock(return_value=[])
+        do.map(double, [1])
+        do.action.concurrently.assert_called_once_with(double, [1], workers=10)
+
+
+class TestDOThreads(TestCase):
+    """
+    This class hammers one DO from many threads against a local API
+    """
+
+    def setUp(self):
+        """
+        Serve a local API in the background
+        """
+
+        self.api = FakeAPI.FakeAPI(latency=0.005)
+        self.server = FakeServer.FakeServer(self.api).start()
+
+    def tearDown(self):
+        """
+        Stop the local API
+        """
+
+        self.server.stop()
+
+    def test_retrieve(self):
+        """
+        Retrievals from 64 threads all come back right, counted once each
+        """
+
+        cache = Cache.Cache({"droplets/*": 60})
+        transport = Transport.Transport(
+            pool_size=64, rate_limiter=RateLimiter.RateLimiter(rate=None), cache=cache
+        )
+        do = DO.DO("abc123", self.server.url, "Unit", transport=transport)
+
+        droplets = do.droplet.bulk_create({
+            "names": ["web%s" % index for index in range(50)], "region": "nyc3",
+            "size": "512mb", "image": "ubuntu-16-04-x64"
+        })
+        ids = [droplets[index % 50]["id"] for index in range(1000)]
+
+        self.assertEqual(
+            [droplet["id"] for droplet in do.map(do.droplet.info, ids, workers=64)], ids
+        )
+
+        stats = transport.stats()
+        cached = cache.stats()
+
+        self.assertEqual(stats["sent"], self.api.counts["GET"] + self.api.counts["POST"])
+        self.assertEqual(stats["sent"] - 5, cached["misses"] - stats["coalesced"])
+        self.assertEqual(cached["hits"] + cached["misses"], 1000)
+        self.assertEqual(cached["size"], 50)
+
+        # The workers' sessions went with them, however many times map is called
+
+        for _ in range(10):
+            do.map(do.droplet.info, ids[:8], workers=8)
+
+        self.assertEqual(list(transport.sessions), [transport.session])
+
+        do.close()
+
+        self.assertEqual(len(transport.sessions), 0)
+
+    def test_act(self):
+        """
+        Actions from 64 threads each go out once, and the rate limiter sees every response
+        """
+
+        transport = Transport.Transport(
+            pool_size=64, rate_limiter=RateLimiter.RateLimiter(rate=None)
+        )
+        do = DO.DO("abc123", self.server.url, "Unit", transport=transport)
+
+        ids = [droplet["id"] for droplet in do.droplet.bulk_create({
+            "names": ["web%s" % index for index in range(500)], "region": "nyc3",
+            "size": "512mb", "image": "ubuntu-16-04-x64"
+        })]
+
+        actions = do.map(lambda id: do.droplet.reboot(id), ids, workers=64)
+
+        self.assertEqual(
+            [(action["resource_id"], action["type"]) for action in actions],
+            [(id, "reboot") for id in ids]
+        )
+        self.assertEqual(self.api.counts["POST"], 550)
+        self.assertEqual(transport.stats(), {"sent": 550, "coalesced": 0})
+        self.assertEqual(self.api.remaining, 5000 - 550)
+        self.assertEqual(transport.rate_limiter.limit, 5000)
+
+        do.close()
@@ -0,0 +1,301 @@
+"""
+This module contains tests for the DiskCache class
+"""
+
+import os
+import shutil
+import tempfile
+import multiprocessing
+from unittest import TestCase
+from mock import patch
+from doboto import DiskCache, Transport
+
+
+def fill(path, url):
+    """
+    Keeps a response from another process
+    """
+
+    DiskCache.DiskCache(path, {"droplets": 60}).put(
+        "GET", url, {"page": 1}, {"Authorization": "Bearer abc123"},
+        Transport.Response(200, {"Content-Type": "application/json"}, '{"droplets": []}')
+    )
+
+
+def create(path, url, ids):
+    """
+    Creates droplets from another process, each patched into what's kept
+    """
+
+    cache = DiskCache.DiskCache(path, {"droplets": 60})
+
+    for id in ids:
+        cache.put(
+            "POST", url, None, {"Authorization": "Bearer abc123"},
+            Transport.Response(202, {}, '{"droplet": {"id": %s}}' % id)
+        )
+
+
+class TestDiskCache(TestCase):
+    """
+    This class implements unittests for the DiskCache class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.test_dir = tempfile.mkdtemp()
+        self.test_path = os.path.join(self.test_dir, "cache.db")
+        self.test_url = "https://api.digitalocean.com/v2"
+        self.test_headers = {"Authorization": "Bearer abc123"}
+
+        self.klass_name = "DiskCache"
+        self.klass = getattr(DiskCache, self.klass_name)
+
+    def tearDown(self):
+        """
+        Remove the cache file
+        """
+
+        shutil.rmtree(self.test_dir)
+
+    def response(self, body='{"droplets": []}'):
+        """
+        A response to keep
+        """
+
+        return Transport.Response(200, {"Content-Type": "application/json"}, body)
+
+    def test_class_exists(self):
+        """
+        DiskCache class is defined
+        """
+
+        self.assertTrue(hasattr(DiskCache, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        DiskCache class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(self.test_path)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    @patch('time.time')
+    def test_get_put(self, mock_time):
+        """
+        get answers what any instance on the file kept until it expires
+        """
+
+        mock_time.return_value = 100
+
+        url = "%s/droplets" % self.test_url
+
+        writer = self.klass(self.test_path, {"droplets": 60})
+        reader = self.klass(self.test_path, {"droplets": 60})
+
+        self.assertIsNone(reader.get("GET", url, {"page": 1}, self.test_headers))
+
+        writer.put("GET", url, {"page": 1}, self.test_headers, self.response())
+
+        response = reader.get("GET", url, {"page": 1}, self.test_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"droplets": []})
+        self.assertEqual(response.headers["content-type"], "application/json")
+
+        self.assertIsNone(reader.get("GET", url, {"page": 1}, {"Authorization": "other"}))
+
+        mock_time.return_value = 161
+
+        self.assertIsNone(reader.get("GET", url, {"page": 1}, self.test_headers))
+        self.assertEqual(reader.stats(), {"hits": 1, "misses": 3, "size": 0})
+
+    def test_private(self):
+        """
+        The file's readable only by its owner and keeps hashes of tokens, not tokens
+        """
+
+        cache = self.klass(self.test_path, {"droplets": 60})
+        cache.put(
+            "GET", "%s/droplets" % self.test_url, None, self.test_headers, self.response()
+        )
+        cache.close()
+
+        self.assertEqual(os.stat(self.test_path).st_mode & 0o777, 0o600)
+
+        for name in os.listdir(self.test_dir):
+            with open(os.path.join(self.test_dir, name), "rb") as file:
+                self.assertNotIn(b"abc123", file.read())
+
+    def test_lru(self):
+        """
+        put evicts the least recently used
+        """
+
+        cache = self.klass(self.test_path, {"regions": 60, "sizes": 60, "account": 60}, size=2)
+
+        with patch('time.time', return_value=100):
+            cache.put("GET", "%s/regions" % self.test_url, response=self.response())
+
+        with patch('time.time', return_value=101):
+            cache.put("GET", "%s/sizes" % self.test_url, response=self.response())
+
+        with patch('time.time', return_value=120):
+            self.assertIsNotNone(cache.get("GET", "%s/regions" % self.test_url))
+
+        with patch('time.time', return_value=121):
+            cache.put("GET", "%s/account" % self.test_url, response=self.response())
+
+        with patch('time.time', return_value=122):
+            self.assertIsNotNone(cache.get("GET", "%s/regions" % self.test_url))
+            self.assertIsNone(cache.get("GET", "%s/sizes" % self.test_url))
+
+    def test_touch(self):
+        """
+        Hits only write that they were used once a quarter of the TTL left has gone by
+        """
+
+        cache = self.klass(self.test_path, {"regions": 60})
+        url = "%s/regions" % self.test_url
+
+        def used():
+            return cache.connect().execute("SELECT used FROM responses").fetchone()[0]
+
+        with patch('time.time', return_value=100):
+            cache.put("GET", url, response=self.response())
+
+        with patch('time.time', return_value=115):
+            self.assertIsNotNone(cache.get("GET", url))
+
+        self.assertEqual(used(), 100)
+
+        with patch('time.time', return_value=116):
+            self.assertIsNotNone(cache.get("GET", url))
+
+        self.assertEqual(used(), 116)
+
+        with patch('time.time', return_value=126):
+            self.assertIsNotNone(cache.get("GET", url))
+
+        self.assertEqual(used(), 116)
+
+    def test_invalidate(self):
+        """
+        invalidate and changes drop what's kept for every instance on the file
+        """
+
+        ttls = {"droplets": 60, "droplets/*": 60, "images": 60}
+
+        cache = self.klass(self.test_path, ttls)
+        other = self.klass(self.test_path, ttls)
+
+        cache.put("GET", "%s/droplets" % self.test_url, None, None, self.response())
+        cache.put("GET", "%s/droplets/1" % self.test_url, None, None, self.response())
+        cache.put("GET", "%s/images" % self.test_url, {"type": "distribution"}, None,
+                  self.response())
+
+        other.put("POST", "%s/droplets/1/actions" % self.test_url, None, None, self.response())
+        self.assertEqual(cache.stats()["size"], 1)
+
+        other.invalidate("images?type=distribution")
+        self.assertEqual(cache.stats()["size"], 0)
+
+        cache.put("GET", "%s/droplets" % self.test_url, None, None, self.response())
+        other.invalidate()
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_write(self):
+        """
+        changes patch what's kept for every instance on the file
+        """
+
+        cache = self.klass(self.test_path, {"droplets": 60})
+        other = self.klass(self.test_path, {"droplets": 60})
+        url = "%s/droplets" % self.test_url
+
+        cache.put("GET", url, None, self.test_headers, self.response(
+            '{"droplets": [{"id": 1}], "links": {}, "meta": {"total": 1}}'
+        ))
+
+        other.put("POST", url, None, self.test_headers, self.response('{"droplet": {"id": 2}}'))
+
+        self.assertEqual(cache.get("GET", url, None, self.test_headers).json(), {
+            "droplets": [{"id": 1}, {"id": 2}], "links": {}, "meta": {"total": 2}
+        })
+
+        other.put("DELETE", "%s/1" % url, None, self.test_headers, self.response(''))
+
+        self.assertEqual(cache.get("GET", url, None, self.test_headers).json(), {
+            "droplets": [{"id": 2}], "links": {}, "meta": {"total": 1}
+        })
+
+    def test_processes(self):
+        """
+        A response kept by another process is answered from the file
+        """
+
+        url = "%s/droplets" % self.test_url
+
+        process = multiprocessing.get_context("spawn").Process(
+            target=fill, args=(self.test_path, url)
+        )
+        process.start()
+        process.join(30)
+
+        self.assertEqual(process.exitcode, 0)
+
+        cache = self.klass(self.test_path, {"droplets": 60})
+        response = cache.get("GET", url, {"page": 1}, self.test_headers)
+
+        self.assertEqual(response.json(), {"droplets": []})
+
+    def test_processes_write(self):
+        """
+        Processes changing things at once each patch what the others patched
+        """
+
+        url = "%s/droplets" % self.test_url
+
+        cache = self.klass(self.test_path, {"droplets": 60})
+        cache.put("GET", url, None, self.test_headers, self.response(
+            '{"droplets": [], "links": {}, "meta": {"total": 0}}'
+        ))
+
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=create, args=(self.test_path, url, range(start, start + 25)))
+            for start in range(0, 100, 25)
+        ]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join(60)
+            self.assertEqual(process.exitcode, 0)
+
+        body = cache.get("GET", url, None, self.test_headers).json()
+
+        self.assertEqual(sorted(droplet["id"] for droplet in body["droplets"]), list(range(100)))
+        self.assertEqual(body["meta"]["total"], 100)
+
+    def test_close(self):
+        """
+        close lets go of the file and reopens on next use
+        """
+
+        cache = self.klass(self.test_path, {"droplets": 60})
+        cache.put("GET", "%s/droplets" % self.test_url, None, None, self.response())
+
+        cache.close()
+        self.assertIsNone(cache.connection)
+
+        self.assertEqual(cache.stats()["size"], 1)
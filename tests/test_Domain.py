@@ -49,6 +49,22 @@ class TestDomain(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Domain.Domain.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        domain = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(domain.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "domains")
+
+        self.assertEqual(domain.record_count("example.com"), 7)
+        mock_total.assert_called_with(
+            "{}/example.com/records".format(self.test_uri), "domain_records"
+        )
     @patch('doboto.Domain.Domain.pages')
     def test_list(self, mock_pages):
         """
@@ -59,7 +75,7 @@ class TestDomain(TestCase):
         domain_obj.list()
         test_uri = "{}".format(self.test_uri)
 
-        mock_pages.assert_called_with(test_uri, "domains")
+        mock_pages.assert_called_with(test_uri, "domains", stream=False)
 
     @patch('doboto.Domain.Domain.request')
     def test_create(self, mock_request):
@@ -135,7 +151,7 @@ class TestDomain(TestCase):
         domain_obj.record_list(name)
         test_uri = "{}/{}/records".format(self.test_uri, name)
 
-        mock_pages.assert_called_with(test_uri, "domain_records")
+        mock_pages.assert_called_with(test_uri, "domain_records", stream=False)
 
     @patch('doboto.Domain.Domain.request')
     def test_record_create(self, mock_request):
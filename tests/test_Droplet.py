@@ -3,6 +3,7 @@ This module contains tests for the main DO class
 """
 
 from unittest import TestCase
+from concurrent.futures import Future
 from mock import MagicMock, patch, call
 from doboto import Droplet
 from doboto.exception import DOBOTOException, DOBOTOPollingException
@@ -51,6 +52,21 @@ class TestDroplet(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Droplet.Droplet.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(drop.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "droplets")
+
+        self.assertEqual(drop.count(tag_name="web"), 7)
+        mock_total.assert_called_with("{}?tag_name=web".format(self.test_uri), "droplets")
+
     @patch('doboto.Droplet.Droplet.pages')
     def test_list(self, mock_pages):
         """
@@ -62,11 +78,14 @@ class TestDroplet(TestCase):
         tag_name = "rando_tag"
 
         drop.list()
-        mock_pages.assert_called_with(self.test_uri, "droplets")
+        mock_pages.assert_called_with(self.test_uri, "droplets", stream=False)
 
         drop.list(tag_name=tag_name)
         drop_uri = "{}?tag_name={}".format(self.test_uri, tag_name)
-        mock_pages.assert_called_with(drop_uri, "droplets")
+        mock_pages.assert_called_with(drop_uri, "droplets", stream=False)
+
+        drop.list(stream=True)
+        mock_pages.assert_called_with(self.test_uri, "droplets", stream=True)
 
     @patch('doboto.Droplet.Droplet.pages')
     def test_neighbor_list(self, mock_pages):
@@ -79,7 +98,7 @@ class TestDroplet(TestCase):
         drop.neighbor_list(id)
         test_uri = "{}/{}/neighbors".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "droplets")
+        mock_pages.assert_called_with(test_uri, "droplets", stream=False)
 
     @patch('doboto.Droplet.Droplet.pages')
     def test_droplet_neighbor_list(self, mock_pages):
@@ -91,7 +110,7 @@ class TestDroplet(TestCase):
         drop.droplet_neighbor_list()
         test_uri = "{}/droplet_neighbors".format(self.test_reports)
 
-        mock_pages.assert_called_with(test_uri, "neighbors")
+        mock_pages.assert_called_with(test_uri, "neighbors", stream=False)
 
     def test_ready(self):
         """
@@ -140,6 +159,7 @@ class TestDroplet(TestCase):
         """
 
         drop = self.klass(*self.instantiate_args)
+        drop.count = MagicMock(return_value=1000)
 
         # Standard
 
@@ -251,6 +271,311 @@ class TestDroplet(TestCase):
         with self.assertRaises(ValueError):
             drop.create({})
 
+    @patch('time.sleep')
+    def test_create_sweep(self, mock_sleep):
+        """
+        create lists every Droplet to check on many when that's fewer calls than each by id
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.request = MagicMock(side_effect=lambda *args, **kwargs: [
+            {"id": id, "status": "new"} for id in range(10)
+        ])
+        drop.count = MagicMock(return_value=250)
+        drop.list = MagicMock(side_effect=lambda tag_name, stream: iter(
+            [{"id": id, "status": "active"} for id in range(12)]
+        ))
+        drop.info = MagicMock()
+
+        droplets = drop.create({"names": ["web%s" % id for id in range(10)]}, wait=True)
+
+        self.assertEqual([droplet["status"] for droplet in droplets], ["active"] * 10)
+        drop.count.assert_called_once_with(tag_name=None)
+        drop.list.assert_called_once_with(tag_name=None, stream=True)
+        drop.info.assert_not_called()
+
+        # Tagged lists just the tag, unless the tag has more pages than there are ids
+
+        drop.count = MagicMock(return_value=150)
+        drop.list = MagicMock(side_effect=lambda tag_name, stream: iter(
+            [{"id": id, "status": "active", "tags": ["web"]} for id in range(12)]
+        ))
+
+        drop.create({"names": ["web%s" % id for id in range(10)], "tags": ["web"]}, wait=True)
+
+        drop.count.assert_called_once_with(tag_name="web")
+        drop.list.assert_called_once_with(tag_name="web", stream=True)
+        drop.info.assert_not_called()
+
+        drop.request = MagicMock(return_value=[{"id": id, "status": "new"} for id in range(2)])
+        drop.count = MagicMock(return_value=2000)
+        drop.list.reset_mock()
+        drop.info = MagicMock(side_effect=lambda id: {
+            "id": id, "status": "active", "tags": ["web"]
+        })
+
+        drop.create({"names": ["web0", "web1"], "tags": ["web"]}, wait=True)
+
+        drop.list.assert_not_called()
+        drop.info.assert_has_calls([call(0), call(1)], any_order=True)
+
+        # Small accounts list in one call, failing to count falls back to info_list's default
+
+        drop.count = MagicMock(return_value=0)
+        self.assertEqual(drop.sweep(), 1)
+
+        drop.count = MagicMock(side_effect=DOBOTOException("down"))
+        self.assertEqual(drop.sweep(), 20)
+
+    def test_bulk_create(self):
+        """
+        bulk_create batches names, keeps their order and reports errors per name
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+
+        ids = list(range(1, 30))
+
+        def request(uri, expect, method, attribs):
+            if "bad" in attribs["names"]:
+                raise DOBOTOException("bad batch")
+            return [{"id": ids.pop(0), "name": name} for name in attribs["names"]
+                    if name != "lost"]
+
+        drop.request = MagicMock(side_effect=request)
+
+        names = ["web%02d" % index for index in range(23)]
+        droplets = drop.bulk_create({"names": names, "region": "nyc3"})
+
+        self.assertEqual([droplet["name"] for droplet in droplets], names)
+        self.assertEqual(drop.request.call_count, 3)
+        drop.request.assert_any_call(self.test_uri, "droplets", 'POST', attribs={
+            "names": names[20:], "region": "nyc3"
+        })
+
+        droplets = drop.bulk_create({"names": ["a", "lost", "b", "bad"]}, batch=2)
+
+        self.assertEqual(droplets[0]["name"], "a")
+        self.assertRegex(str(droplets[1]), "lost")
+        self.assertIsInstance(droplets[2], DOBOTOException)
+        self.assertIs(droplets[2], droplets[3])
+
+        self.assertRaises(ValueError, drop.bulk_create, {"name": "one"})
+
+        # Batches go out as many at once as the pool holds, unless told otherwise
+
+        drop.concurrently = MagicMock(return_value=[[{"name": "a"}]])
+
+        drop.bulk_create({"names": ["a"]})
+        self.assertEqual(drop.concurrently.call_args[0][2], drop.transport.pool_size)
+
+        drop.bulk_create({"names": ["a"]}, workers=3)
+        self.assertEqual(drop.concurrently.call_args[0][2], 3)
+
+    def test_bulk_create_wait(self):
+        """
+        bulk_create waits on everything created through the waiter
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+        drop.request = MagicMock(return_value=[
+            {"id": 1, "name": "a", "status": "new"}, {"id": 2, "name": "b", "status": "new"}
+        ])
+
+        def waited(droplet, attribs, poll, timeout):
+            future = Future()
+            if droplet["id"] == 1:
+                future.set_result(dict(droplet, status="active"))
+            else:
+                future.set_exception(DOBOTOPollingException(polling=droplet))
+            return future
+
+        drop.do.waiter.droplet = MagicMock(side_effect=waited)
+
+        droplets = drop.bulk_create({"names": ["a", "b"]}, wait=True, poll=2, timeout=60)
+
+        self.assertEqual(droplets[0], {"id": 1, "name": "a", "status": "active"})
+        self.assertIsInstance(droplets[1], DOBOTOPollingException)
+        drop.do.waiter.droplet.assert_any_call(
+            {"id": 1, "name": "a", "status": "new"}, {"names": ["a", "b"]}, poll=2, timeout=60
+        )
+
+    def test_bulk(self):
+        """
+        bulk sends an action for every id, keyed by id with errors in place
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+
+        def resize(id, size, disk=False):
+            if id == 2:
+                raise DOBOTOException("no room")
+            return {"id": id * 10, "status": "in-progress", "size": size, "disk": disk}
+
+        drop.resize = MagicMock(side_effect=resize)
+
+        results = drop.bulk("resize", [1, 2, 3], size="2gb", workers=4)
+
+        self.assertEqual(list(results), [1, 2, 3])
+        self.assertEqual(results[1], {"id": 10, "status": "in-progress", "size": "2gb",
+                                      "disk": False})
+        self.assertIsInstance(results[2], DOBOTOException)
+        self.assertEqual(results[3]["id"], 30)
+
+        drop.rename = MagicMock(side_effect=lambda id, name: {"id": id, "name": name})
+
+        self.assertEqual(drop.bulk("rename", {1: {"name": "a"}, 2: {"name": "b"}}), {
+            1: {"id": 1, "name": "a"}, 2: {"id": 2, "name": "b"}
+        })
+
+        # As many at once as the pool holds, unless told otherwise
+
+        drop.concurrently = MagicMock(return_value=[{"id": 1}])
+
+        drop.bulk("reboot", [1])
+        self.assertEqual(drop.concurrently.call_args[0][2], drop.transport.pool_size)
+
+    def test_bulk_wait(self):
+        """
+        bulk waits on every action through the waiter
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+        drop.reboot = MagicMock(side_effect=lambda id: {"id": id, "status": "in-progress"})
+
+        def waited(action, poll, timeout):
+            future = Future()
+            if action["id"] == 1:
+                future.set_result(dict(action, status="completed"))
+            else:
+                future.set_exception(DOBOTOPollingException(polling=action))
+            return future
+
+        drop.do.waiter.action = MagicMock(side_effect=waited)
+
+        results = drop.bulk("reboot", [1, 2], wait=True, poll=3, timeout=30)
+
+        self.assertEqual(results[1], {"id": 1, "status": "completed"})
+        self.assertIsInstance(results[2], DOBOTOPollingException)
+        drop.do.waiter.action.assert_any_call({"id": 1, "status": "in-progress"}, poll=3,
+                                              timeout=30)
+
+    @patch('time.sleep')
+    def test_rolling(self, mock_sleep):
+        """
+        rolling goes a window at a time, out of and back into the load balancer once healthy
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+        drop.list = MagicMock(return_value=[{"id": id} for id in [1, 2, 3, 4, 5]])
+
+        calls = []
+
+        drop.do.load_balancer.droplet_remove = MagicMock(
+            side_effect=lambda lb, ids: calls.append(("remove", ids))
+        )
+        drop.do.load_balancer.droplet_add = MagicMock(
+            side_effect=lambda lb, ids: calls.append(("add", ids))
+        )
+
+        def bulk(method, ids, wait, poll, timeout, workers, **kwargs):
+            calls.append((method, ids, workers, kwargs))
+            return {id: {"id": id * 10, "status": "completed"} for id in ids}
+
+        drop.bulk = MagicMock(side_effect=bulk)
+
+        checks = []
+
+        def info_list(ids):
+            checks.append(ids)
+            return [{"id": id, "status": "active" if len(checks) > 1 else "off"} for id in ids]
+
+        drop.info_list = MagicMock(side_effect=info_list)
+
+        windows = drop.rolling("resize", "web", window=2, load_balancer="lb", size="2gb")
+
+        drop.list.assert_called_once_with(tag_name="web")
+        self.assertEqual([window["ids"] for window in windows], [[1, 2], [3, 4], [5]])
+        self.assertTrue(all(window["healthy"] for window in windows))
+        self.assertEqual(windows[0]["results"][1], {"id": 10, "status": "completed"})
+        self.assertEqual(calls[:4], [
+            ("remove", [1, 2]), ("resize", [1, 2], 2, {"size": "2gb"}), ("add", [1, 2]),
+            ("remove", [3, 4])
+        ])
+        self.assertEqual(checks[:2], [[1, 2], [1, 2]])
+        mock_sleep.assert_called_once_with(5)
+
+    @patch('time.sleep')
+    def test_rolling_halt(self, mock_sleep):
+        """
+        rolling stops after a window that fails, leaving it out of the load balancer
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+        drop.list = MagicMock(return_value=[{"id": 1}, {"id": 2}])
+        drop.bulk = MagicMock(return_value={1: {"id": 10, "status": "completed"}})
+        drop.info_list = MagicMock(return_value=[{"id": 1, "status": "active", "ip": ""}])
+
+        windows = drop.rolling("reboot", "web", load_balancer="lb", healthy=lambda d: d["ip"],
+                               timeout=-1)
+
+        self.assertEqual(len(windows), 1)
+        self.assertFalse(windows[0]["healthy"])
+        drop.do.load_balancer.droplet_add.assert_not_called()
+
+        drop.bulk = MagicMock(side_effect=lambda method, ids, **kwargs: {
+            ids[0]: DOBOTOException("no")
+        })
+
+        windows = drop.rolling("reboot", "web", halt=False)
+
+        self.assertEqual(len(windows), 2)
+        self.assertIsInstance(windows[1]["results"][2], DOBOTOException)
+
+    @patch('time.sleep')
+    def test_rolling_failed(self, mock_sleep):
+        """
+        rolling puts back what it couldn't send an action for and counts errored actions failed
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.do = MagicMock()
+        drop.list = MagicMock(return_value=[{"id": id} for id in [1, 2, 3, 4]])
+        drop.bulk = MagicMock(return_value={
+            1: {"id": 10, "status": "completed"},
+            2: DOBOTOException("not sent"),
+            3: {"id": 30, "status": "errored"},
+            4: DOBOTOPollingException(polling={"id": 40, "status": "in-progress"})
+        })
+        drop.info_list = MagicMock(side_effect=lambda ids: [
+            {"id": id, "status": "active"} for id in ids
+        ])
+
+        windows = drop.rolling("reboot", "web", window=4, load_balancer="lb")
+
+        self.assertEqual(len(windows), 1)
+        self.assertTrue(windows[0]["healthy"])
+        drop.info_list.assert_called_once_with([1])
+        drop.do.load_balancer.droplet_add.assert_called_once_with("lb", [1, 2])
+
+        # Even if the rest aren't healthy, those never acted on go back
+
+        drop.info_list = MagicMock(side_effect=lambda ids: [
+            {"id": id, "status": "off"} for id in ids
+        ])
+        drop.do.load_balancer.droplet_add.reset_mock()
+
+        windows = drop.rolling("reboot", "web", window=4, load_balancer="lb", timeout=-1)
+
+        self.assertFalse(windows[0]["healthy"])
+        drop.do.load_balancer.droplet_add.assert_called_once_with("lb", [2])
+
     def test_present(self):
         """
         present works with name or names
@@ -342,6 +667,96 @@ class TestDroplet(TestCase):
         test_uri = "{}/{}".format(self.test_uri, id)
         mock_request.assert_called_with(test_uri, "droplet")
 
+    def test_info_list(self):
+        """
+        info_list gets few droplets by id and many or tagged from one list
+        """
+
+        drop = self.klass(*self.instantiate_args)
+        drop.info = MagicMock(side_effect=lambda id: {"id": id, "status": "new"})
+        drop.list = MagicMock(return_value=iter([
+            {"id": 1, "status": "active"},
+            {"id": 2, "status": "active"},
+            {"id": 3, "status": "new"},
+            {"id": 4, "status": "active"}
+        ]))
+
+        self.assertEqual(drop.info_list([2, 1]), [
+            {"id": 2, "status": "new"},
+            {"id": 1, "status": "new"}
+        ])
+        drop.list.assert_not_called()
+
+        self.assertEqual(drop.info_list([3, 2, 5], tag_name="web"), [
+            {"id": 3, "status": "new"},
+            {"id": 2, "status": "active"},
+            {"id": 5, "status": "new"}
+        ])
+        drop.list.assert_called_once_with(tag_name="web", stream=True)
+        drop.info.assert_called_with(5)
+        self.assertEqual(drop.info.call_count, 3)
+
+        drop.list = MagicMock(return_value=iter([
+            {"id": 1, "status": "active"},
+            {"id": 2, "status": "active"},
+            {"id": 3, "status": "new"}
+        ]))
+
+        self.assertEqual(drop.info_list([1, 2], sweep=2), [
+            {"id": 1, "status": "active"},
+            {"id": 2, "status": "active"}
+        ])
+        drop.list.assert_called_once_with(tag_name=None, stream=True)
+        self.assertEqual(drop.info.call_count, 3)
+
+        drop.list = MagicMock(side_effect=DOBOTOException("down"))
+        drop.info = MagicMock(side_effect=[{"id": 1}, Exception("Not yet")])
+
+        results = drop.info_list([1, 2], tag_name="web")
+        self.assertEqual(results[0], {"id": 1})
+        self.assertEqual(str(results[1]), "Not yet")
+
+        # Only a failed call falls back, anything else is raised
+
+        drop.list = MagicMock(side_effect=TypeError("bug"))
+
+        self.assertRaisesRegex(TypeError, "bug", drop.info_list, [1, 2], tag_name="web")
+
+    @patch('time.sleep')
+    @patch('doboto.Droplet.Droplet.request')
+    def test_create_tagged(self, mock_request, mock_sleep):
+        """
+        create with names and tags checks readiness with one tag list per poll
+        """
+
+        drop = self.klass(*self.instantiate_args)
+
+        mock_request.return_value = [
+            {"id": id, "status": "new", "tags": []} for id in range(1, 101)
+        ]
+
+        polls = [0]
+
+        def droplets(tag_name, stream):
+            polls[0] += 1
+            for id in range(1, 101):
+                status = "active" if id <= 50 * polls[0] else "new"
+                yield {"id": id, "status": status, "tags": ["web"]}
+
+        drop.list = MagicMock(side_effect=droplets)
+        drop.info = MagicMock()
+
+        datas = {"names": ["web%s" % id for id in range(1, 101)], "region": "nyc3",
+                 "size": "512mb", "image": "ubuntu-14-04-x64", "tags": ["web"]}
+
+        created = drop.create(datas, wait=True, poll=5)
+
+        self.assertEqual(len(created), 100)
+        self.assertTrue(all(droplet["status"] == "active" for droplet in created))
+        self.assertEqual(drop.list.call_count, 2)
+        drop.list.assert_called_with(tag_name="web", stream=True)
+        drop.info.assert_not_called()
+
     @patch('doboto.Droplet.Droplet.request')
     def test_destroy(self, mock_request):
         """
@@ -413,7 +828,7 @@ class TestDroplet(TestCase):
         drop.backup_list(id)
         test_uri = "{}/{}/backups".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "backups")
+        mock_pages.assert_called_with(test_uri, "backups", stream=False)
 
     @patch('doboto.Droplet.Droplet.action')
     def test_backup_enable(self, mock_action):
@@ -693,7 +1108,7 @@ class TestDroplet(TestCase):
         drop.kernel_list(id)
         test_uri = "{}/{}/kernels".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "kernels")
+        mock_pages.assert_called_with(test_uri, "kernels", stream=False)
 
     @patch('doboto.Droplet.Droplet.action_result')
     @patch('doboto.Droplet.Droplet.request')
@@ -777,7 +1192,7 @@ class TestDroplet(TestCase):
         drop.snapshot_list(id)
         test_uri = "{}/{}/snapshots".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "snapshots")
+        mock_pages.assert_called_with(test_uri, "snapshots", stream=False)
 
     @patch('doboto.Droplet.Droplet.action')
     def test_snapshot_create(self, mock_action):
@@ -816,7 +1231,7 @@ class TestDroplet(TestCase):
         drop.action_list(id)
         test_uri = "{}/{}/actions".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "actions")
+        mock_pages.assert_called_with(test_uri, "actions", stream=False)
 
     @patch('doboto.Droplet.Droplet.request')
     def test_action_info(self, mock_request):
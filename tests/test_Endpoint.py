@@ -2,13 +2,12 @@
 This module contains tests for the Endpoint class
 """
 
+import json
 from unittest import TestCase
 from mock import Mock, MagicMock, patch, call
-from doboto import Endpoint
+from doboto import Endpoint, Transport, Wait, BackoffWait, LearnedWait, FakeAPI, FakeTransport
 from doboto.exception import DOBOTOException, DOBOTONotFoundException, DOBOTOPollingException
 
-import requests
-
 
 class TestEndpoint(TestCase):
     """
@@ -48,6 +47,18 @@ class TestEndpoint(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    def test_transport(self):
+        """
+        Endpoint uses the transport given or makes its own
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+        self.assertIsInstance(endpoint.transport, Transport.Transport)
+
+        transport = Transport.Transport()
+        endpoint = self.klass(self.test_token, self.test_agent, transport)
+        self.assertIs(endpoint.transport, transport)
+
     def test_headers(self):
 
         endpoint = self.klass(*self.instantiate_args)
@@ -61,7 +72,7 @@ class TestEndpoint(TestCase):
             }
         )
 
-    @patch('requests.get')
+    @patch('doboto.Transport.Transport.request')
     def test_request(self, mock_get):
 
         endpoint = self.klass(*self.instantiate_args)
@@ -74,6 +85,7 @@ class TestEndpoint(TestCase):
         self.assertEqual(result, {"a": 1})
 
         mock_get.assert_called_with(
+            "GET",
             "people",
             params={"c": 2},
             data='{"b": 2}',
@@ -81,8 +93,7 @@ class TestEndpoint(TestCase):
                 'Authorization': "Bearer %s" % self.test_token,
                 'User-Agent': self.test_agent,
                 'Content-Type': 'application/json'
-            },
-            timeout=60
+            }
         )
 
         self.assertRaises(
@@ -108,7 +119,7 @@ class TestEndpoint(TestCase):
             DOBOTONotFoundException, endpoint.request, "people", "stuff"
         )
 
-    @patch('requests.get')
+    @patch('doboto.Transport.Transport.request')
     def test_pages(self, mock_get):
 
         fake_requests = []
@@ -147,7 +158,7 @@ class TestEndpoint(TestCase):
         def fake_get(*args, **kwargs):
 
             fake_requests.append({
-                "url": args[0],
+                "url": args[1],
                 "params": kwargs["params"]
             })
             return fake_responses.pop(0)
@@ -176,14 +187,14 @@ class TestEndpoint(TestCase):
         ])
 
         mock_get.assert_called_with(
+            "GET",
             "things",
             params=None,
             headers={
                 'Authorization': "Bearer %s" % self.test_token,
                 'User-Agent': self.test_agent,
                 'Content-Type': 'application/json'
-            },
-            timeout=60
+            }
         )
 
         fake_responses = [
@@ -203,6 +214,264 @@ class TestEndpoint(TestCase):
             DOBOTOException, endpoint.pages, "people", "items"
         )
 
+    @patch('doboto.Transport.Transport.request')
+    def test_iter_pages(self, mock_request):
+        """
+        iter_pages yields items a page at a time and stops when asked
+        """
+
+        fake_requests = []
+        fake_results = [
+            {"people": [1, 2], "links": {"pages": {"next": "stuff"}}},
+            {"people": [3, 4], "links": {"pages": {"next": "things"}}},
+            {"people": [5], "links": {"pages": {}}}
+        ]
+
+        def fake_request(method, url, params=None, headers=None):
+            fake_requests.append({"url": url, "params": params})
+            response = MagicMock()
+            response.json = MagicMock(return_value=fake_results.pop(0))
+            return response
+
+        mock_request.side_effect = fake_request
+
+        endpoint = self.klass(*self.instantiate_args)
+
+        items = endpoint.pages("people", "people", params={"c": 2}, stream=True)
+        self.assertEqual(fake_requests, [])
+
+        self.assertEqual(next(items), 1)
+        self.assertEqual(next(items), 2)
+        self.assertEqual(fake_requests, [{"url": "people", "params": {"c": 2, "per_page": 200}}])
+
+        self.assertEqual(next(items), 3)
+        self.assertEqual(len(fake_requests), 2)
+        self.assertEqual(fake_requests[1], {"url": "stuff", "params": None})
+
+        self.assertEqual(list(items), [4, 5])
+        self.assertEqual(len(fake_requests), 3)
+
+        fake_results = [{"items": []}]
+
+        self.assertRaises(DOBOTOException, list, endpoint.iter_pages("people", "people"))
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_pages_resume(self, mock_request, mock_sleep):
+        """
+        pages retries a failed page rather than restarting the listing
+        """
+
+        fake_requests = []
+
+        def response(status_code, result):
+            response = MagicMock()
+            response.status_code = status_code
+            response.headers = {}
+            response.json = MagicMock(return_value=result)
+            return response
+
+        fake_responses = [
+            response(200, {"people": [1, 2], "links": {"pages": {"next": "stuff"}}}),
+            response(502, {"id": "bad_gateway"}),
+            response(200, {"people": [3], "links": {"pages": {}}})
+        ]
+
+        def fake_request(method, url, **kwargs):
+            fake_requests.append(url)
+            return fake_responses.pop(0)
+
+        mock_request.side_effect = fake_request
+
+        endpoint = self.klass(
+            self.test_token, self.test_agent, Transport.Transport(rate_limiter=False)
+        )
+
+        self.assertEqual(endpoint.pages("people", "people"), [1, 2, 3])
+        self.assertEqual(fake_requests, ["people", "stuff", "stuff"])
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    def test_next_page(self):
+        """
+        next_page finds the next link
+        """
+
+        self.assertEqual(
+            self.klass.next_page({"links": {"pages": {"next": "stuff"}}}), "stuff"
+        )
+        self.assertIsNone(self.klass.next_page({"links": {"pages": {}}}))
+        self.assertIsNone(self.klass.next_page({}))
+
+    def test_remaining_pages(self):
+        """
+        remaining_pages builds every page url from the last link
+        """
+
+        self.assertEqual(
+            self.klass.remaining_pages({"links": {"pages": {
+                "next": "http://x/droplets?page=2&per_page=200&tag_name=a",
+                "last": "http://x/droplets?page=4&per_page=200&tag_name=a"
+            }}}),
+            [
+                "http://x/droplets?page=2&per_page=200&tag_name=a",
+                "http://x/droplets?page=3&per_page=200&tag_name=a",
+                "http://x/droplets?page=4&per_page=200&tag_name=a"
+            ]
+        )
+        self.assertEqual(self.klass.remaining_pages({"links": {"pages": {}}}), [])
+        self.assertEqual(
+            self.klass.remaining_pages({"links": {"pages": {"last": "http://x/droplets"}}}), []
+        )
+        self.assertEqual(self.klass.remaining_pages({}), [])
+
+    @patch('doboto.Transport.Transport.request')
+    def test_pages_parallel(self, mock_request):
+        """
+        pages fetches every page after the first concurrently, in order
+        """
+
+        fake_requests = []
+
+        def fake_request(method, url, params=None, headers=None):
+            fake_requests.append((url, params))
+            page = int(url.split("page=")[1].split("&")[0]) if "page=" in url else 1
+            response = MagicMock()
+            response.json = MagicMock(return_value={
+                "people": [page * 10, page * 10 + 1],
+                "links": {"pages": {"last": "http://x/people?page=4&per_page=200"}}
+            })
+            return response
+
+        mock_request.side_effect = fake_request
+
+        endpoint = self.klass(self.test_token, self.test_agent, Transport.Transport(workers=3))
+
+        self.assertEqual(
+            endpoint.pages("http://x/people", "people", params={"c": 2}),
+            [10, 11, 20, 21, 30, 31, 40, 41]
+        )
+        self.assertEqual(fake_requests[0], ("http://x/people", {"c": 2, "per_page": 200}))
+        self.assertEqual(sorted(fake_requests[1:]), [
+            ("http://x/people?page=2&per_page=200", None),
+            ("http://x/people?page=3&per_page=200", None),
+            ("http://x/people?page=4&per_page=200", None)
+        ])
+
+        def bad_request(method, url, params=None, headers=None):
+            response = MagicMock()
+            if "page=" in url:
+                response.json = MagicMock(return_value={"id": "server_error"})
+            else:
+                response.json = MagicMock(return_value={
+                    "people": [1],
+                    "links": {"pages": {"last": "http://x/people?page=2"}}
+                })
+            return response
+
+        mock_request.side_effect = bad_request
+
+        self.assertRaises(DOBOTOException, endpoint.pages, "http://x/people", "people")
+
+    def test_index(self):
+        """
+        index keys items, the first of a key winning
+        """
+
+        items = [
+            {"id": 1, "name": "people"},
+            {"id": 2, "name": "stuff"},
+            {"id": 3, "name": "people"}
+        ]
+
+        self.assertEqual(self.klass.index(items), {
+            "people": {"id": 1, "name": "people"},
+            "stuff": {"id": 2, "name": "stuff"}
+        })
+        self.assertEqual(sorted(self.klass.index(items, "id")), [1, 2, 3])
+
+    def test_waiting(self):
+        """
+        waiting makes a Wait of a number and keeps a Wait as is
+        """
+
+        wait = self.klass.waiting(3)
+        self.assertIsInstance(wait, Wait.Wait)
+        self.assertEqual(wait.interval, 3)
+
+        backoff = BackoffWait.BackoffWait()
+        self.assertIs(self.klass.waiting(backoff), backoff)
+
+    def test_action_seconds(self):
+        """
+        action_seconds is how long an action took by its timestamps
+        """
+
+        self.assertEqual(self.klass.action_seconds({
+            "started_at": "2014-11-14T16:29:21Z",
+            "completed_at": "2014-11-14T16:31:00Z"
+        }), 99)
+
+        self.assertIsNone(self.klass.action_seconds({
+            "started_at": "2014-11-14T16:29:21Z",
+            "completed_at": None
+        }))
+        self.assertIsNone(self.klass.action_seconds({"started_at": "yesterday"}))
+
+    @patch('time.sleep')
+    def test_action_result_learned(self, mock_sleep):
+        """
+        action_result sleeps as the Wait given says and teaches it how long actions took
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.do = MagicMock()
+
+        learned = LearnedWait.LearnedWait(fallback=BackoffWait.BackoffWait(initial=1), samples=1)
+
+        endpoint.do.action.info = MagicMock(side_effect=[
+            {"id": 1, "type": "reboot", "status": "in-progress"},
+            {
+                "id": 1, "type": "reboot", "status": "completed",
+                "started_at": "2014-11-14T16:29:21Z", "completed_at": "2014-11-14T16:29:33Z"
+            }
+        ])
+
+        endpoint.action_result(
+            {"id": 1, "type": "reboot", "status": "in-progress"}, True, learned, 30
+        )
+        mock_sleep.assert_has_calls([call(1), call(2)])
+        self.assertEqual(learned.median("reboot"), 12)
+
+        mock_sleep.reset_mock()
+        endpoint.do.action.info = MagicMock(side_effect=[
+            {"id": 2, "type": "reboot", "status": "completed"}
+        ])
+
+        endpoint.action_result(
+            {"id": 2, "type": "reboot", "status": "in-progress"}, True, learned, 30
+        )
+        mock_sleep.assert_called_once_with(12)
+
+        # Several at once sleep the least any needs
+
+        mock_sleep.reset_mock()
+        endpoint.do.action.info_list = MagicMock(side_effect=[
+            [
+                {
+                    "id": 3, "type": "snapshot", "status": "completed",
+                    "started_at": "2014-11-14T16:29:21Z", "completed_at": "2014-11-14T16:30:21Z"
+                },
+                {"id": 4, "type": "reboot", "status": "completed"}
+            ]
+        ])
+
+        endpoint.actions_result([
+            {"id": 3, "type": "snapshot", "status": "in-progress"},
+            {"id": 4, "type": "reboot", "status": "in-progress"}
+        ], True, learned, 30)
+        mock_sleep.assert_called_once_with(1)
+        self.assertEqual(learned.median("snapshot"), 60)
+
     @patch('time.sleep')
     def test_action_result(self, mock_sleep):
         """
@@ -267,10 +536,114 @@ class TestEndpoint(TestCase):
             wait=True, poll=4, timeout=-1
         )
 
+    def test_total(self):
+        """
+        total asks for one item and reads meta, counting pages only if there's no meta
+        """
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.page = MagicMock(return_value={"people": [1], "meta": {"total": 1234}})
+
+        self.assertEqual(endpoint.total("people", "people", params={"a": 1}), 1234)
+        endpoint.page.assert_called_once_with(
+            "people", "people", {"a": 1, "per_page": 1}, endpoint.headers()
+        )
+
+        endpoint.page = MagicMock(return_value={"people": [1], "links": {}})
+        self.assertEqual(endpoint.total("people", "people"), 1)
+
+        endpoint.page = MagicMock(return_value={"people": [1], "links": {"pages": {"next": "2"}}})
+        endpoint.pages = MagicMock(return_value=[1, 2, 3])
+
+        self.assertEqual(endpoint.total("people", "people", params={"a": 1}), 3)
+        endpoint.pages.assert_called_once_with("people", "people", params={"a": 1})
+
+    def test_total_meta(self):
+        """
+        total reads meta.total off of the API's response to one call for one item
+        """
+
+        api = FakeAPI.FakeAPI(limit=None)
+
+        for index in range(450):
+            api.handle("POST", "http://fake/v2/tags", data=json.dumps({"name": "t%s" % index}))
+
+        api.counts.clear()
+
+        endpoint = self.klass(
+            *self.instantiate_args,
+            transport=FakeTransport.FakeTransport(api, rate_limiter=False)
+        )
+        endpoint.transport.send = MagicMock(side_effect=endpoint.transport.send)
+
+        self.assertEqual(endpoint.total("http://fake/v2/tags", "tags"), 450)
+        self.assertEqual(api.counts, {"GET": 1})
+        self.assertEqual(endpoint.transport.send.call_args[1]["params"], {"per_page": 1})
+
+        self.assertEqual(endpoint.total("http://fake/v2/droplets", "droplets"), 0)
+
+    def test_find_first(self):
+        """
+        find_first and exists page only until there's a match
+        """
+
+        fake_requests = []
+
+        def fake_page(url, expect, params, headers):
+            fake_requests.append(url)
+            return {
+                "first": {
+                    "people": [{"name": "a"}, {"name": "b"}], "links": {"pages": {"next": "second"}}
+                },
+                "second": {"people": [{"name": "c"}], "links": {"pages": {}}}
+            }[url]
+
+        endpoint = self.klass(*self.instantiate_args)
+        endpoint.page = fake_page
+        endpoint.list = MagicMock(
+            side_effect=lambda stream, **kwargs: endpoint.pages("first", "people", stream=stream)
+        )
+
+        self.assertEqual(endpoint.find_first(lambda item: item["name"] == "b"), {"name": "b"})
+        self.assertEqual(fake_requests, ["first"])
+
+        self.assertTrue(endpoint.exists(lambda item: item["name"] == "c", region="nyc1"))
+        self.assertEqual(fake_requests, ["first", "first", "second"])
+        endpoint.list.assert_called_with(stream=True, region="nyc1")
+
+        self.assertIsNone(endpoint.find_first(lambda item: item["name"] == "d"))
+        self.assertFalse(endpoint.exists(lambda item: item["name"] == "d"))
+
+    def test_concurrently(self):
+        """
+        concurrently calls in order with exceptions in place
+        """
+
+        def method(item):
+            if item == 2:
+                raise Exception("two")
+            return item * 10
+
+        endpoint = self.klass(*self.instantiate_args)
+
+        results = endpoint.concurrently(method, [1, 2, 3])
+        self.assertEqual(results[0], 10)
+        self.assertEqual(str(results[1]), "two")
+        self.assertEqual(results[2], 30)
+
+        endpoint = self.klass(self.test_token, self.test_agent, Transport.Transport(workers=4))
+
+        results = endpoint.concurrently(method, list(range(1, 10)))
+        self.assertIsInstance(results[1], Exception)
+        self.assertEqual(
+            [result for result in results if not isinstance(result, Exception)],
+            [10, 30, 40, 50, 60, 70, 80, 90]
+        )
+
     @patch('time.sleep')
     def test_actions_result(self, mock_sleep):
         """
-        actions_result polls an action until complete
+        actions_result polls every action in progress together
         """
 
         endpoint = self.klass(*self.instantiate_args)
@@ -292,52 +665,43 @@ class TestEndpoint(TestCase):
 
         endpoint.do = MagicMock()
         endpoint.do.action = MagicMock()
-        endpoint.do.action.info = MagicMock(
+        endpoint.do.action.info_list = MagicMock(
             side_effect=[
-                Exception("Not yet"),
-                Exception("Not yet"),
-                {"id": 1, "status": "completed"},
-                {"id": 2, "status": "completed"}
+                [Exception("Not yet"), {"id": 2, "status": "completed"}],
+                [{"id": 1, "status": "completed"}]
             ]
         )
 
         self.assertEqual(
             endpoint.actions_result([
                 {"id": 1, "status": "in-progress"},
-                {"id": 2, "status": "in-progress"}
+                {"id": 2, "status": "in-progress"},
+                {"id": 3, "status": "completed"}
             ], True, 2, 3),
             [
                 {"id": 1, "status": "completed"},
-                {"id": 2, "status": "completed"}
+                {"id": 2, "status": "completed"},
+                {"id": 3, "status": "completed"}
             ]
         )
         mock_sleep.assert_has_calls([call(2), call(2)])
-        endpoint.do.action.info.assert_has_calls([call(1), call(2), call(1), call(2)])
+        endpoint.do.action.info_list.assert_has_calls([call([1, 2]), call([1])])
 
         # Wait with bad poll
 
-        endpoint.do.action.info.side_effect = [
-            Exception("Not yet"),
-            Exception("Not yet"),
-            {"id": 1, "status": "completed"},
-            {"id": 2, "status": "completed"}
+        endpoint.do.action.info_list.side_effect = [
+            [{"id": 1, "status": "completed"}]
         ]
 
         self.assertEqual(
-            endpoint.actions_result([
-                {"id": 1, "status": "in-progress"},
-                {"id": 2, "status": "in-progress"}
-            ], True, 0, 3),
-            [
-                {"id": 1, "status": "completed"},
-                {"id": 2, "status": "completed"}
-            ]
+            endpoint.actions_result([{"id": 1, "status": "in-progress"}], True, 0, 3),
+            [{"id": 1, "status": "completed"}]
         )
-        mock_sleep.assert_has_calls([call(1), call(1)])
+        mock_sleep.assert_has_calls([call(1)])
 
         # Wait with timeout and error
 
-        endpoint.do.action.info.side_effect = [Exception("Not yet")]
+        endpoint.do.action.info_list.side_effect = [[Exception("Not yet")]]
 
         self.assertRaisesRegexp(
             DOBOTOPollingException,
@@ -348,8 +712,8 @@ class TestEndpoint(TestCase):
 
         # Wait with timeout
 
-        endpoint.do.action.info.side_effect = [
-            {"id": 1, "status": "completed"}
+        endpoint.do.action.info_list.side_effect = [
+            [{"id": 1, "status": "in-progress"}]
         ]
 
         self.assertRaisesRegexp(
@@ -0,0 +1,270 @@
+"""
+This module contains tests for the FakeAPI class
+"""
+
+import json
+import time
+import ipaddress
+from unittest import TestCase
+from doboto import FakeAPI
+
+
+class TestFakeAPI(TestCase):
+    """
+    This class implements unittests for the FakeAPI class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.url = "http://fake/v2/"
+
+        self.klass_name = "FakeAPI"
+        self.klass = getattr(FakeAPI, self.klass_name)
+
+    def call(self, api, method, path, body=None, **params):
+        """
+        Status and parsed body of a call
+        """
+
+        response = api.handle(
+            method, self.url + path, params=params,
+            data=json.dumps(body) if body is not None else None
+        )
+
+        return response.status_code, response.json() if response.text else None
+
+    def test_class_exists(self):
+        """
+        FakeAPI class is defined
+        """
+
+        self.assertTrue(hasattr(FakeAPI, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        FakeAPI class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_paged(self):
+        """
+        Listings come a page at a time with links and the total
+        """
+
+        api = self.klass(page_size=2)
+
+        for name in ["a", "b", "c", "d", "e"]:
+            self.assertEqual(self.call(api, "POST", "tags", {"name": name})[0], 201)
+
+        status, result = self.call(api, "GET", "tags", per_page=200)
+
+        self.assertEqual(status, 200)
+        self.assertEqual([tag["name"] for tag in result["tags"]], ["a", "b"])
+        self.assertEqual(result["meta"], {"total": 5})
+        self.assertNotIn("prev", result["links"]["pages"])
+        self.assertIn("page=3", result["links"]["pages"]["last"])
+
+        response = api.handle("GET", result["links"]["pages"]["next"])
+        self.assertEqual([tag["name"] for tag in response.json()["tags"]], ["c", "d"])
+
+        status, result = self.call(api, "GET", "tags", page=3)
+
+        self.assertEqual([tag["name"] for tag in result["tags"]], ["e"])
+        self.assertIn("page=2", result["links"]["pages"]["prev"])
+        self.assertNotIn("next", result["links"]["pages"])
+
+    def test_errors(self):
+        """
+        Unknown things are 404s, bad ones 422s and the wrong method a 405
+        """
+
+        api = self.klass()
+
+        self.assertEqual(
+            self.call(api, "GET", "droplets/1"),
+            (404, {"id": "not_found", "message": "The droplet you requested could not be found."})
+        )
+        self.assertEqual(self.call(api, "GET", "nope")[0], 404)
+        self.assertEqual(self.call(api, "POST", "droplets", {"name": "web"})[0], 422)
+        self.assertEqual(self.call(api, "POST", "droplets", {
+            "names": ["web%s" % index for index in range(11)], "region": "nyc3",
+            "size": "512mb", "image": "ubuntu-16-04-x64"
+        })[0], 422)
+        self.assertEqual(self.call(api, "PUT", "droplets")[0], 405)
+
+    def test_droplet(self):
+        """
+        Droplets are new until their create Action completes, and change once Actions do
+        """
+
+        api = self.klass(action_seconds=0.05)
+
+        status, result = self.call(api, "POST", "droplets", {
+            "name": "web", "region": "nyc3", "size": "512mb", "image": "ubuntu-16-04-x64",
+            "tags": ["web"], "ipv6": True
+        })
+
+        self.assertEqual(status, 202)
+        self.assertEqual(result["droplet"]["status"], "new")
+        self.assertEqual(result["droplet"]["networks"], {"v4": []})
+
+        id = result["droplet"]["id"]
+
+        status, result = self.call(api, "GET", "actions")
+        self.assertEqual(result["actions"][0]["status"], "in-progress")
+        self.assertEqual(result["actions"][0]["resource_id"], id)
+
+        time.sleep(0.1)
+
+        droplet = self.call(api, "GET", "droplets/%s" % id)[1]["droplet"]
+        self.assertEqual(droplet["status"], "active")
+        self.assertEqual(droplet["networks"]["v4"][0]["type"], "public")
+        self.assertEqual(len(droplet["networks"]["v6"]), 1)
+
+        tag = self.call(api, "GET", "tags/web")[1]["tag"]
+        self.assertEqual(tag["resources"]["droplets"]["count"], 1)
+
+        status, result = self.call(
+            api, "POST", "droplets/actions", {"type": "power_off"}, tag_name="web"
+        )
+
+        self.assertEqual(status, 201)
+        self.assertEqual(result["actions"][0]["status"], "in-progress")
+
+        uri = "droplets/%s" % id
+        self.assertEqual(self.call(api, "GET", uri)[1]["droplet"]["status"], "active")
+
+        time.sleep(0.1)
+
+        self.assertEqual(self.call(api, "GET", uri)[1]["droplet"]["status"], "off")
+
+        uri = "droplets/%s/actions/%s" % (id, result["actions"][0]["id"])
+        self.assertEqual(self.call(api, "GET", uri)[1]["action"]["status"], "completed")
+
+        self.assertEqual(self.call(api, "DELETE", "droplets", tag_name="web"), (204, None))
+        self.assertEqual(self.call(api, "GET", "droplets")[1]["droplets"], [])
+
+    def test_volume(self):
+        """
+        Volumes attach by id or name, and can't be removed while attached
+        """
+
+        api = self.klass()
+
+        droplet = self.call(api, "POST", "droplets", {
+            "name": "web", "region": "nyc3", "size": "512mb", "image": "debian-8-x64"
+        })[1]["droplet"]
+        volume = self.call(api, "POST", "volumes", {
+            "name": "data", "region": "nyc3", "size_gigabytes": 10
+        })[1]["volume"]
+
+        status, result = self.call(api, "POST", "volumes/actions", {
+            "type": "attach", "volume_name": "data", "region": "nyc3", "droplet_id": droplet["id"]
+        })
+
+        self.assertEqual(status, 202)
+        self.assertEqual(result["action"]["resource_id"], volume["id"])
+
+        volumes = self.call(api, "GET", "volumes", name="data", region="nyc3")[1]["volumes"]
+        self.assertEqual(volumes[0]["droplet_ids"], [droplet["id"]])
+        self.assertEqual(
+            self.call(api, "GET", "droplets/%s" % droplet["id"])[1]["droplet"]["volume_ids"],
+            [volume["id"]]
+        )
+        self.assertEqual(self.call(api, "DELETE", "volumes/%s" % volume["id"])[0], 409)
+
+        self.call(api, "POST", "volumes/%s/actions" % volume["id"], {
+            "type": "detach", "droplet_id": droplet["id"]
+        })
+
+        self.assertEqual(
+            self.call(api, "DELETE", "volumes", name="data", region="nyc3"), (204, None)
+        )
+
+    def test_floating_ip(self):
+        """
+        Floating IP Actions note the address as a number, like the API does
+        """
+
+        api = self.klass()
+
+        droplet = self.call(api, "POST", "droplets", {
+            "name": "web", "region": "nyc3", "size": "512mb", "image": "debian-8-x64"
+        })[1]["droplet"]
+        ip = self.call(api, "POST", "floating_ips", {"region": "nyc3"})[1]["floating_ip"]["ip"]
+
+        action = self.call(api, "POST", "floating_ips/%s/actions" % ip, {
+            "type": "assign", "droplet_id": droplet["id"]
+        })[1]["action"]
+
+        self.assertEqual(action["resource_type"], "floating_ip")
+        self.assertEqual(action["resource_id"], int(ipaddress.ip_address(ip)))
+        self.assertEqual(
+            self.call(api, "GET", "floating_ips/%s" % ip)[1]["floating_ip"]["droplet"]["id"],
+            droplet["id"]
+        )
+
+    def test_fail(self):
+        """
+        Failures are injected one at a time or at a rate
+        """
+
+        api = self.klass()
+        api.fail(503, method="GET", path="regions", times=2)
+
+        self.assertEqual(self.call(api, "GET", "sizes")[0], 200)
+        self.assertEqual(self.call(api, "GET", "regions")[0], 503)
+        self.assertEqual(self.call(api, "GET", "regions")[0], 503)
+        self.assertEqual(self.call(api, "GET", "regions")[0], 200)
+
+        api = self.klass(error_rate=1, error_status=502)
+
+        self.assertEqual(self.call(api, "GET", "regions")[0], 502)
+
+        api = self.klass(error_rate=0.5, seed=7)
+        statuses = [self.call(api, "GET", "regions")[0] for _ in range(100)]
+
+        self.assertEqual(set(statuses), {200, 500})
+
+    def test_limit(self):
+        """
+        Calls past the hourly limit get 429s, every call the RateLimit headers
+        """
+
+        api = self.klass(limit=2)
+
+        first = api.handle("GET", self.url + "regions")
+
+        self.assertEqual(first.headers["RateLimit-Limit"], "2")
+        self.assertEqual(first.headers["RateLimit-Remaining"], "1")
+
+        api.handle("GET", self.url + "regions")
+        limited = api.handle("GET", self.url + "regions")
+
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(limited.headers["RateLimit-Remaining"], "0")
+        self.assertIn("Retry-After", limited.headers)
+        self.assertEqual(api.counts, {"GET": 3})
+
+    def test_token(self):
+        """
+        Calls without the token get 401s when one's required
+        """
+
+        api = self.klass(token="abc123")
+
+        self.assertEqual(api.handle("GET", self.url + "account").status_code, 401)
+        self.assertEqual(api.handle(
+            "GET", self.url + "account", headers={"Authorization": "Bearer abc123"}
+        ).status_code, 200)
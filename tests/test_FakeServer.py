@@ -0,0 +1,80 @@
+"""
+This module contains tests for the FakeServer class
+"""
+
+from unittest import TestCase
+from doboto import DO, FakeAPI, FakeServer
+from doboto.exception import DOBOTONotFoundException
+
+
+class TestFakeServer(TestCase):
+    """
+    This class implements unittests for the FakeServer class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "FakeServer"
+        self.klass = getattr(FakeServer, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        FakeServer class is defined
+        """
+
+        self.assertTrue(hasattr(FakeServer, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        FakeServer class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass().server_close()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_serve(self):
+        """
+        A DO pointed at the server makes, pages through and waits on things
+        """
+
+        api = FakeAPI.FakeAPI(page_size=2, action_seconds=0.2)
+
+        with self.klass(api) as server:
+
+            self.assertTrue(server.url.startswith("http://127.0.0.1:"))
+            self.assertTrue(server.url.endswith("/v2"))
+
+            do = DO.DO("abc123", server.url)
+
+            droplet = do.droplet.create(
+                {"name": "web", "region": "nyc3", "size": "512mb", "image": "debian-8-x64"},
+                wait=True, poll=0.1
+            )
+
+            self.assertEqual(droplet["status"], "active")
+
+            for name in ["a", "b", "c"]:
+                do.tag.create(name)
+
+            self.assertEqual([tag["name"] for tag in do.tag.list()], ["a", "b", "c"])
+            self.assertEqual(do.tag.count(), 3)
+
+            action = do.droplet.reboot(droplet["id"], wait=True, poll=0.1)
+            self.assertEqual(action["status"], "completed")
+
+            do.droplet.destroy(droplet["id"])
+            self.assertRaises(DOBOTONotFoundException, do.droplet.info, droplet["id"])
+
+            do.close()
+
+        self.assertIsNone(server.thread)
+        self.assertGreater(api.counts["GET"], 3)
@@ -0,0 +1,117 @@
+"""
+This module contains tests for the FakeTransport class
+"""
+
+from unittest import TestCase
+from doboto import FakeTransport, FakeAPI, DO, Cache
+from doboto.exception import DOBOTONotFoundException
+
+
+class TestFakeTransport(TestCase):
+    """
+    This class implements unittests for the FakeTransport class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "FakeTransport"
+        self.klass = getattr(FakeTransport, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        FakeTransport class is defined
+        """
+
+        self.assertTrue(hasattr(FakeTransport, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        FakeTransport class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_api(self):
+        """
+        FakeTransport answers from the FakeAPI given or one of its own
+        """
+
+        self.assertIsInstance(self.klass().api, FakeAPI.FakeAPI)
+
+        api = FakeAPI.FakeAPI()
+        self.assertIs(self.klass(api, pool_size=2).api, api)
+
+    def test_send(self):
+        """
+        A DO over a FakeTransport makes, lists and waits on things without sockets
+        """
+
+        api = FakeAPI.FakeAPI(page_size=2)
+        transport = self.klass(api, rate_limiter=False, workers=4, cache=Cache.Cache())
+        do = DO.DO("abc123", transport=transport)
+
+        droplets = do.droplet.create({
+            "names": ["web1", "web2", "web3"], "region": "nyc3", "size": "512mb",
+            "image": "ubuntu-16-04-x64"
+        })
+
+        self.assertEqual([droplet["name"] for droplet in do.droplet.list()], [
+            "web1", "web2", "web3"
+        ])
+
+        action = do.droplet.power_off(droplets[0]["id"], wait=True)
+        self.assertEqual(action["status"], "completed")
+        self.assertEqual(do.droplet.info(droplets[0]["id"])["status"], "off")
+
+        self.assertEqual(len(do.region.list()), 5)
+        self.assertEqual(len(do.region.list()), 5)
+        self.assertEqual(transport.cache.stats()["hits"], 3)
+
+        do.droplet.destroy(droplets[0]["id"])
+        self.assertRaises(DOBOTONotFoundException, do.droplet.info, droplets[0]["id"])
+
+        self.assertEqual(sum(api.counts.values()), transport.stats()["sent"])
+
+        do.close()
+
+    def test_wait_cached(self):
+        """
+        Waiting on Droplets and Actions reads past a cache kept for them
+        """
+
+        api = FakeAPI.FakeAPI(action_seconds=1.5)
+        cache = Cache.Cache({"droplets": 600, "droplets/*": 600, "actions/*": 600})
+        do = DO.DO("abc123", transport=self.klass(api, rate_limiter=False, cache=cache))
+
+        attribs = {"region": "nyc3", "size": "512mb", "image": "ubuntu-16-04-x64"}
+
+        droplet = do.droplet.create(dict(attribs, name="web"), wait=True, poll=1, timeout=6)
+        self.assertEqual(droplet["status"], "active")
+
+        droplets = do.droplet.create(
+            dict(attribs, names=["db1", "db2"]), wait=True, poll=1, timeout=6
+        )
+        self.assertEqual([droplet["status"] for droplet in droplets], ["active", "active"])
+
+        action = do.droplet.power_off(droplet["id"], wait=True, poll=1, timeout=6)
+        self.assertEqual(action["status"], "completed")
+
+        # Outside of waits, what's kept still answers
+
+        do.droplet.info(droplet["id"])
+        hits = cache.stats()["hits"]
+
+        self.assertEqual(do.droplet.info(droplet["id"])["status"], "off")
+        self.assertEqual(cache.stats()["hits"], hits + 1)
+
+        do.close()
@@ -48,6 +48,18 @@ class TestFloatingIP(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.FloatingIP.FloatingIP.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        floating_ip = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(floating_ip.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "floating_ips")
+
     @patch('doboto.FloatingIP.FloatingIP.pages')
     def test_list(self, mock_pages):
         """
@@ -57,7 +69,7 @@ class TestFloatingIP(TestCase):
         floating_ip = self.klass(*self.instantiate_args)
         result = floating_ip.list()
 
-        mock_pages.assert_called_with(self.test_uri, "floating_ips")
+        mock_pages.assert_called_with(self.test_uri, "floating_ips", stream=False)
 
     @patch('doboto.FloatingIP.FloatingIP.request')
     def test_create_happy(self, mock_request):
@@ -158,7 +170,7 @@ class TestFloatingIP(TestCase):
         result = floating_ip.action_list(ip)
 
         mock_pages.assert_called_with(
-            "%s/%s/actions" % (self.test_uri, ip), "actions"
+            "%s/%s/actions" % (self.test_uri, ip), "actions", stream=False
         )
 
     @patch('doboto.FloatingIP.FloatingIP.request')
@@ -48,6 +48,21 @@ class TestImage(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Image.Image.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        image = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(image.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "images", params={})
+
+        self.assertEqual(image.count(private=True), 7)
+        mock_total.assert_called_with(self.test_uri, "images", params={"private": True})
+
     @patch('doboto.Image.Image.pages')
     def test_list_happy(self, mock_pages):
         """
@@ -58,11 +73,11 @@ class TestImage(TestCase):
 
         result = image.list("fee", "fie")
         mock_pages.assert_called_with(
-            self.test_uri, "images", params={"type": "fee", "private": "fie"}
+            self.test_uri, "images", params={"type": "fee", "private": "fie"}, stream=False
         )
 
         result = image.list()
-        mock_pages.assert_called_with(self.test_uri, "images", params={})
+        mock_pages.assert_called_with(self.test_uri, "images", params={}, stream=False)
 
     @patch('doboto.Image.Image.request')
     def test_info(self, mock_request):
@@ -156,7 +171,7 @@ class TestImage(TestCase):
         result = image.action_list(id)
 
         mock_pages.assert_called_with(
-            "%s/%s/actions" % (self.test_uri, id), "actions"
+            "%s/%s/actions" % (self.test_uri, id), "actions", stream=False
         )
 
     @patch('doboto.Image.Image.request')
@@ -0,0 +1,200 @@
+"""
+This module contains tests for the Inventory class
+"""
+
+from unittest import TestCase
+from mock import MagicMock
+from doboto import Inventory
+from doboto.exception import DOBOTONotFoundException
+
+
+class TestInventory(TestCase):
+    """
+    This class implements unittests for the Inventory class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.do = MagicMock()
+
+        def concurrently(method, items):
+            results = []
+            for item in items:
+                try:
+                    results.append(method(item))
+                except Exception as exception:
+                    results.append(exception)
+            return results
+
+        self.do.action.concurrently = MagicMock(side_effect=concurrently)
+
+        self.do.droplet.list = MagicMock(return_value=[{"id": 1, "name": "web"}])
+        self.do.volume.list = MagicMock(return_value=[{"id": "v", "name": "data"}])
+        self.do.image.list = MagicMock(return_value=[{"id": 7, "name": "snap"}])
+        self.do.floating_ip.list = MagicMock(return_value=[{"ip": "45.55.96.168"}])
+
+        self.klass_name = "Inventory"
+        self.klass = getattr(Inventory, self.klass_name)
+
+    def feed(self, *actions):
+        """
+        Action list returning these, newest first
+        """
+
+        self.do.action.list = MagicMock(side_effect=lambda stream=False: iter(actions))
+
+    def test_class_exists(self):
+        """
+        Inventory class is defined
+        """
+
+        self.assertTrue(hasattr(Inventory, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Inventory class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(self.do)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_touched(self):
+        """
+        touched reads Floating IPs' ids as addresses
+        """
+
+        self.assertEqual(self.klass.touched({"resource_type": "droplet", "resource_id": 1}),
+                         ("droplet", 1))
+        self.assertEqual(
+            self.klass.touched({"resource_type": "floating_ip", "resource_id": 758603944}),
+            ("floating_ip", "45.55.96.168")
+        )
+
+    def test_sync_full(self):
+        """
+        The first sync lists everything, noting the newest Action first
+        """
+
+        self.feed({"id": 10, "status": "completed"}, {"id": 9, "status": "completed"})
+
+        inventory = self.klass(self.do)
+
+        self.assertEqual(sorted(inventory.sync(), key=str), [
+            ("droplet", 1), ("floating_ip", "45.55.96.168"), ("image", 7), ("volume", "v")
+        ])
+
+        self.do.image.list.assert_called_once_with(private=True)
+        self.assertEqual(inventory.last, 10)
+        self.assertEqual(inventory.list("droplet"), [{"id": 1, "name": "web"}])
+        self.assertEqual(inventory.info("floating_ip", "45.55.96.168"), {"ip": "45.55.96.168"})
+        self.assertIsNone(inventory.info("volume", "x"))
+        self.assertEqual(inventory.index("volume"), {"data": {"id": "v", "name": "data"}})
+
+    def test_sync_full_unfinished(self):
+        """
+        Actions in progress while everything's listed are checked on until they finish
+        """
+
+        self.feed(
+            {"id": 10, "status": "completed", "resource_type": "droplet", "resource_id": 1},
+            {"id": 9, "status": "in-progress", "resource_type": "droplet", "resource_id": 2},
+            {"id": 8, "status": "in-progress", "resource_type": "droplet", "resource_id": 3}
+        )
+
+        inventory = self.klass(self.do, kinds=["droplet"])
+        inventory.HEAD = 2
+        inventory.sync()
+
+        self.assertEqual(inventory.last, 10)
+        self.assertEqual(inventory.unfinished, {9: ("droplet", 2)})
+
+        self.feed({"id": 10, "status": "completed"})
+
+        self.do.action.info_list = MagicMock(return_value=[
+            {"id": 9, "status": "completed", "resource_type": "droplet", "resource_id": 2}
+        ])
+        self.do.droplet.info = MagicMock(return_value={"id": 2, "name": "db", "status": "active"})
+
+        self.assertEqual(inventory.sync(), [("droplet", 2)])
+
+        self.do.action.info_list.assert_called_once_with([9])
+        self.assertEqual(inventory.info("droplet", 2)["status"], "active")
+        self.assertEqual(inventory.unfinished, {})
+
+    def test_sync_feed(self):
+        """
+        Later syncs retrieve only what new Actions touched
+        """
+
+        self.feed({"id": 10, "status": "completed"})
+
+        inventory = self.klass(self.do, kinds=["droplet", "volume"])
+        inventory.sync()
+
+        self.feed(
+            {"id": 13, "status": "in-progress", "resource_type": "droplet", "resource_id": 2},
+            {"id": 12, "status": "completed", "resource_type": "droplet", "resource_id": 1},
+            {"id": 11, "status": "completed", "resource_type": "image", "resource_id": 7},
+            {"id": 10, "status": "completed", "resource_type": "droplet", "resource_id": 3}
+        )
+
+        self.do.droplet.info = MagicMock(side_effect=[
+            {"id": 2, "name": "db", "status": "new"}, DOBOTONotFoundException()
+        ])
+
+        self.assertEqual(inventory.sync(), [("droplet", 2), ("droplet", 1)])
+
+        self.assertEqual(inventory.list("droplet"), [{"id": 2, "name": "db", "status": "new"}])
+        self.assertEqual(inventory.last, 13)
+        self.assertEqual(inventory.unfinished, {13: ("droplet", 2)})
+        self.assertEqual(self.do.droplet.list.call_count, 1)
+
+        # What's unfinished is retrieved again until it's done
+
+        self.feed({"id": 13, "status": "in-progress"})
+
+        self.do.action.info_list = MagicMock(return_value=[
+            {"id": 13, "status": "completed", "resource_type": "droplet", "resource_id": 2}
+        ])
+        self.do.droplet.info = MagicMock(return_value={"id": 2, "name": "db", "status": "active"})
+
+        self.assertEqual(inventory.sync(), [("droplet", 2)])
+
+        self.do.action.info_list.assert_called_once_with([13])
+        self.assertEqual(inventory.info("droplet", 2)["status"], "active")
+        self.assertEqual(inventory.unfinished, {})
+
+        # Actions without a resource id list the kind again
+
+        self.feed(
+            {"id": 14, "status": "completed", "resource_type": "volume", "resource_id": 0}
+        )
+        self.do.volume.list = MagicMock(return_value=[{"id": "w", "name": "logs"}])
+
+        self.assertEqual(inventory.sync(), [("volume", "w")])
+        self.assertEqual(inventory.list("volume"), [{"id": "w", "name": "logs"}])
+
+    def test_sync_error(self):
+        """
+        A failed retrieval leaves where the feed was read up to alone
+        """
+
+        self.feed({"id": 10, "status": "completed"})
+
+        inventory = self.klass(self.do, kinds=["droplet"])
+        inventory.sync()
+
+        self.feed({"id": 11, "status": "completed", "resource_type": "droplet", "resource_id": 1})
+        self.do.droplet.info = MagicMock(side_effect=Exception("down"))
+
+        self.assertRaisesRegex(Exception, "down", inventory.sync)
+        self.assertEqual(inventory.last, 10)
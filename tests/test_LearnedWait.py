@@ -0,0 +1,99 @@
+"""
+This module contains tests for the LearnedWait class
+"""
+
+from unittest import TestCase
+from doboto import LearnedWait
+from doboto import Wait
+
+
+class TestLearnedWait(TestCase):
+    """
+    This class implements unittests for the LearnedWait class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "LearnedWait"
+        self.klass = getattr(LearnedWait, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        LearnedWait class is defined
+        """
+
+        self.assertTrue(hasattr(LearnedWait, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        LearnedWait class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_median(self):
+        """
+        median needs enough samples and only keeps the history
+        """
+
+        wait = self.klass(history=4, samples=3)
+
+        wait.record("reboot", 10)
+        wait.record("reboot", 30)
+        self.assertIsNone(wait.median("reboot"))
+
+        wait.record("reboot", 20)
+        self.assertEqual(wait.median("reboot"), 20)
+
+        wait.record("reboot", 40)
+        self.assertEqual(wait.median("reboot"), 25)
+
+        wait.record("reboot", 50)
+        self.assertEqual(wait.median("reboot"), 35)
+
+        self.assertIsNone(wait.median("snapshot"))
+
+    def test_record(self):
+        """
+        record ignores what can't be learned from
+        """
+
+        wait = self.klass(samples=1)
+
+        wait.record(None, 10)
+        wait.record("reboot", None)
+        wait.record("reboot", -1)
+
+        self.assertEqual(wait.durations, {})
+
+    def test_delay(self):
+        """
+        delay checks first at the median, then as the fallback does
+        """
+
+        wait = self.klass(fallback=Wait.Wait(7), samples=2)
+
+        self.assertEqual(wait.delay(0, "snapshot"), 7)
+        self.assertEqual(wait.delay(0), 7)
+
+        wait.record("snapshot", 60)
+        wait.record("snapshot", 80)
+
+        self.assertEqual(wait.delay(0, "snapshot"), 70)
+        self.assertEqual(wait.delay(1, "snapshot"), 7)
+        self.assertEqual(wait.delay(0, "reboot"), 7)
+
+        wait.record("reboot", 0)
+        wait.record("reboot", 0)
+
+        self.assertEqual(wait.delay(0, "reboot"), 1)
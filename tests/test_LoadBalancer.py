@@ -50,6 +50,18 @@ class TestLoadBalancer(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.LoadBalancer.LoadBalancer.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        load_balancer = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(load_balancer.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "load_balancers")
+
     @patch('doboto.LoadBalancer.LoadBalancer.pages')
     def test_list(self, mock_pages):
         """
@@ -60,7 +72,7 @@ class TestLoadBalancer(TestCase):
         load_balancer.list()
         test_uri = "{}".format(self.test_uri)
 
-        mock_pages.assert_called_with(test_uri, "load_balancers")
+        mock_pages.assert_called_with(test_uri, "load_balancers", stream=False)
 
     @patch('time.sleep')
     @patch('doboto.LoadBalancer.LoadBalancer.request')
@@ -0,0 +1,189 @@
+"""
+This module contains tests for the RateLimiter class
+"""
+
+import asyncio
+import threading
+from unittest import TestCase
+from mock import patch, call, AsyncMock
+from doboto import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+    """
+    This class implements unittests for the RateLimiter class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "RateLimiter"
+        self.klass = getattr(RateLimiter, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        RateLimiter class is defined
+        """
+
+        self.assertTrue(hasattr(RateLimiter, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        RateLimiter class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    @patch('time.sleep')
+    @patch('time.time')
+    def test_acquire(self, mock_time, mock_sleep):
+        """
+        acquire takes from the bucket and waits for it to refill
+        """
+
+        mock_time.return_value = 100
+        limiter = self.klass(rate=2, burst=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+
+        def sleep(seconds):
+            mock_time.return_value += seconds
+
+        mock_sleep.side_effect = sleep
+
+        limiter.acquire()
+        mock_sleep.assert_called_once_with(0.5)
+
+        mock_time.return_value += 10
+        limiter.acquire()
+        self.assertEqual(limiter.tokens, 1)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    @patch('time.time')
+    def test_acquire_async(self, mock_time, mock_sleep):
+        """
+        acquire_async waits for the bucket to refill without blocking the loop
+        """
+
+        mock_time.return_value = 100
+        limiter = self.klass(rate=2, burst=1)
+
+        asyncio.run(limiter.acquire_async())
+        mock_sleep.assert_not_awaited()
+
+        async def sleep(seconds):
+            mock_time.return_value += seconds
+
+        mock_sleep.side_effect = sleep
+
+        asyncio.run(limiter.acquire_async())
+        mock_sleep.assert_awaited_once_with(0.5)
+        self.assertEqual(limiter.tokens, 0)
+
+    @patch('time.sleep')
+    @patch('time.time')
+    def test_acquire_unpaced(self, mock_time, mock_sleep):
+        """
+        acquire doesn't pace without a rate
+        """
+
+        mock_time.return_value = 100
+        limiter = self.klass(rate=None, burst=1)
+
+        for _ in range(5):
+            limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch('time.time')
+    def test_update(self, mock_time, mock_sleep):
+        """
+        update tracks the reported budget and acquire sleeps until reset once it's spent
+        """
+
+        mock_time.return_value = 100
+        limiter = self.klass()
+
+        limiter.update({
+            "RateLimit-Limit": "5000",
+            "RateLimit-Remaining": "1",
+            "RateLimit-Reset": "160"
+        })
+        self.assertEqual((limiter.limit, limiter.remaining, limiter.reset), (5000, 1, 160))
+
+        limiter.acquire()
+        self.assertEqual(limiter.remaining, 0)
+        mock_sleep.assert_not_called()
+
+        def sleep(seconds):
+            mock_time.return_value += seconds
+
+        mock_sleep.side_effect = sleep
+
+        limiter.acquire()
+        mock_sleep.assert_called_once_with(60)
+        self.assertIsNone(limiter.remaining)
+        self.assertIsNone(limiter.reset)
+
+    @patch('time.time')
+    def test_exhausted(self, mock_time):
+        """
+        exhausted waits on Retry-After, then the reported reset, then a minute
+        """
+
+        mock_time.return_value = 100
+        limiter = self.klass()
+
+        limiter.exhausted({"Retry-After": "5", "RateLimit-Reset": "200"})
+        self.assertEqual((limiter.remaining, limiter.reset), (0, 105))
+
+        limiter.exhausted({"RateLimit-Reset": "200"})
+        self.assertEqual(limiter.reset, 200)
+
+        limiter.exhausted({"RateLimit-Reset": "50"})
+        self.assertEqual(limiter.reset, 101)
+
+        limiter.exhausted({})
+        self.assertEqual(limiter.reset, 160)
+
+        # Retry-After as an HTTP-date falls back to the reported reset, then a minute
+
+        limiter.exhausted({
+            "Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT", "RateLimit-Reset": "200"
+        })
+        self.assertEqual(limiter.reset, 200)
+
+        limiter.exhausted({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        self.assertEqual(limiter.reset, 160)
+
+    def test_threads(self):
+        """
+        acquire hands out exactly the burst across threads without waiting
+        """
+
+        limiter = self.klass(rate=None, burst=100)
+        limiter.update({"RateLimit-Remaining": "1000", "RateLimit-Reset": "9999999999"})
+
+        threads = [
+            threading.Thread(target=lambda: [limiter.acquire() for _ in range(50)])
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(limiter.remaining, 600)
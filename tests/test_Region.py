@@ -48,6 +48,18 @@ class TestRegion(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Region.Region.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        region = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(region.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "regions")
+
     @patch('doboto.Region.Region.pages')
     def test_list_happy(self, mock_pages):
         """
@@ -57,4 +69,4 @@ class TestRegion(TestCase):
         region = self.klass(*self.instantiate_args)
         result = region.list()
 
-        mock_pages.assert_called_with(self.test_uri, "regions")
+        mock_pages.assert_called_with(self.test_uri, "regions", stream=False)
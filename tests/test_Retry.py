@@ -0,0 +1,96 @@
+"""
+This module contains tests for the Retry class
+"""
+
+from unittest import TestCase
+from mock import MagicMock, patch
+from doboto import Retry
+
+
+class TestRetry(TestCase):
+    """
+    This class implements unittests for the Retry class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "Retry"
+        self.klass = getattr(Retry, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        Retry class is defined
+        """
+
+        self.assertTrue(hasattr(Retry, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Retry class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_retryable(self):
+        """
+        retryable checks attempts, methods and statuses
+        """
+
+        retry = self.klass(attempts=2)
+
+        failed = MagicMock()
+        failed.status_code = 503
+
+        ok = MagicMock()
+        ok.status_code = 200
+
+        self.assertTrue(retry.retryable("GET", 0))
+        self.assertTrue(retry.retryable("get", 0, failed))
+        self.assertFalse(retry.retryable("GET", 0, ok))
+        self.assertFalse(retry.retryable("GET", 1, failed))
+        self.assertFalse(retry.retryable("POST", 0, failed))
+        self.assertFalse(retry.retryable("POST", 0))
+
+        retry = self.klass(attempts=2, methods=None)
+
+        self.assertTrue(retry.retryable("POST", 0, failed))
+
+    @patch('random.uniform')
+    def test_delay(self, mock_uniform):
+        """
+        delay backs off exponentially up to the cap, with jitter, unless Retry-After says
+        """
+
+        retry = self.klass(backoff=1, factor=3, cap=20, jitter=False)
+
+        self.assertEqual(retry.delay(0), 1)
+        self.assertEqual(retry.delay(1), 3)
+        self.assertEqual(retry.delay(2), 9)
+        self.assertEqual(retry.delay(3), 20)
+
+        response = MagicMock()
+        response.headers = {"Retry-After": "7"}
+        self.assertEqual(retry.delay(0, response), 7)
+
+        response.headers = {"Retry-After": "700"}
+        self.assertEqual(retry.delay(0, response), 20)
+
+        response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        self.assertEqual(retry.delay(1, response), 3)
+
+        retry = self.klass(backoff=1, factor=3, retry_after=False)
+        response.headers = {"Retry-After": "7"}
+        mock_uniform.return_value = 0.5
+
+        self.assertEqual(retry.delay(1, response), 0.5)
+        mock_uniform.assert_called_once_with(0, 3)
@@ -48,6 +48,18 @@ class TestSSHKey(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.SSHKey.SSHKey.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        ssh_key = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(ssh_key.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "ssh_keys")
+
     @patch('doboto.SSHKey.SSHKey.pages')
     def test_list_happy(self, mock_pages):
         """
@@ -57,7 +69,7 @@ class TestSSHKey(TestCase):
         ssh_key = self.klass(*self.instantiate_args)
         result = ssh_key.list()
 
-        mock_pages.assert_called_with(self.test_uri, "ssh_keys")
+        mock_pages.assert_called_with(self.test_uri, "ssh_keys", stream=False)
 
     @patch('doboto.SSHKey.SSHKey.request')
     def test_create(self, mock_request):
@@ -48,6 +48,18 @@ class TestSize(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Size.Size.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        size = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(size.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "sizes")
+
     @patch('doboto.Size.Size.pages')
     def test_list_happy(self, mock_pages):
         """
@@ -57,4 +69,4 @@ class TestSize(TestCase):
         size = self.klass(*self.instantiate_args)
         result = size.list()
 
-        mock_pages.assert_called_with(self.test_uri, "sizes")
+        mock_pages.assert_called_with(self.test_uri, "sizes", stream=False)
@@ -48,6 +48,19 @@ class TestSnapshot(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Snapshot.Snapshot.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        snapshot = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(snapshot.count("volume"), 7)
+        mock_total.assert_called_with(
+            self.test_uri, "snapshots", params={"resource_type": "volume"}
+        )
     @patch('doboto.Snapshot.Snapshot.pages')
     def test_list_happy(self, mock_pages):
         """
@@ -58,11 +71,11 @@ class TestSnapshot(TestCase):
 
         result = snapshot.list("fee")
         mock_pages.assert_called_with(
-            self.test_uri, "snapshots", params={"resource_type": "fee"}
+            self.test_uri, "snapshots", params={"resource_type": "fee"}, stream=False
         )
 
         result = snapshot.list()
-        mock_pages.assert_called_with(self.test_uri, "snapshots", params={})
+        mock_pages.assert_called_with(self.test_uri, "snapshots", params={}, stream=False)
 
     @patch('doboto.Snapshot.Snapshot.request')
     def test_info(self, mock_request):
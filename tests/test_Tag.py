@@ -48,6 +48,18 @@ class TestTag(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Tag.Tag.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        tag = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(tag.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "tags")
+
     @patch('doboto.Tag.Tag.pages')
     def test_list(self, mock_pages):
         """
@@ -57,7 +69,7 @@ class TestTag(TestCase):
         tag = self.klass(*self.instantiate_args)
         result = tag.list()
 
-        mock_pages.assert_called_with(self.test_uri, "tags")
+        mock_pages.assert_called_with(self.test_uri, "tags", stream=False)
 
     @patch('doboto.Tag.Tag.pages')
     def test_name_list_happy(self, mock_pages):
@@ -0,0 +1,316 @@
+"""
+This module contains tests for the Transport class
+"""
+
+import threading
+from unittest import TestCase
+from mock import MagicMock, patch, call
+from doboto import Transport, RateLimiter, Retry, Cache
+
+import requests
+
+
+class TestTransport(TestCase):
+    """
+    This class implements unittests for the Transport class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "Transport"
+        self.klass = getattr(Transport, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        Transport class is defined
+        """
+
+        self.assertTrue(hasattr(Transport, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Transport class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_pool(self):
+        """
+        Transport mounts one pooled adapter for http and https
+        """
+
+        transport = self.klass(pool_size=3, connect_timeout=4, read_timeout=5, retries=2)
+
+        adapter = transport.session.get_adapter("https://api.digitalocean.com/v2/")
+        self.assertIs(adapter, transport.session.get_adapter("http://localhost/"))
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertEqual(transport.retries.attempts, 3)
+        self.assertEqual(transport.timeout, (4, 5))
+
+    def test_retries(self):
+        """
+        Transport takes a retry policy, a count of retries or the default
+        """
+
+        self.assertEqual(self.klass().retries.attempts, 3)
+        self.assertEqual(self.klass(retries=0).retries.attempts, 1)
+
+        retries = Retry.Retry(attempts=7)
+        self.assertIs(self.klass(retries=retries).retries, retries)
+
+    @patch('requests.Session.request')
+    def test_request(self, mock_request):
+        """
+        request goes through the session with the timeouts
+        """
+
+        transport = self.klass(connect_timeout=4, read_timeout=5)
+        response = MagicMock()
+        mock_request.return_value = response
+
+        self.assertEqual(
+            transport.request("GET", "people", params={"a": 1}, data="{}", headers={"b": 2}),
+            response
+        )
+        mock_request.assert_called_with(
+            "GET", "people", params={"a": 1}, data="{}", headers={"b": 2}, timeout=(4, 5)
+        )
+
+    @patch('requests.Session.request')
+    def test_request_rate_limited(self, mock_request):
+        """
+        request paces through the rate limiter and waits out 429s
+        """
+
+        limiter = MagicMock()
+        limiter.waits = 1
+        transport = self.klass(rate_limiter=limiter, retries=0)
+
+        limited = MagicMock()
+        limited.status_code = 429
+        limited.headers = {"RateLimit-Remaining": "0", "RateLimit-Reset": "160"}
+
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.headers = {"RateLimit-Remaining": "4999"}
+
+        mock_request.side_effect = [limited, ok]
+
+        self.assertEqual(transport.request("GET", "people"), ok)
+        self.assertEqual(limiter.acquire.call_count, 2)
+        limiter.exhausted.assert_called_once_with(limited.headers)
+        limiter.update.assert_has_calls([call(limited.headers), call(ok.headers)])
+
+        mock_request.side_effect = [limited, limited, ok]
+
+        self.assertEqual(transport.request("GET", "people"), limited)
+
+    @patch('requests.Session.request')
+    def test_request_unlimited(self, mock_request):
+        """
+        request goes straight out without a rate limiter
+        """
+
+        transport = self.klass(rate_limiter=False, retries=0)
+        self.assertIsInstance(self.klass().rate_limiter, RateLimiter.RateLimiter)
+
+        limited = MagicMock()
+        limited.status_code = 429
+        mock_request.return_value = limited
+
+        self.assertEqual(transport.request("GET", "people"), limited)
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_request_retry(self, mock_request, mock_sleep):
+        """
+        request retries connection errors and retry statuses as the policy allows
+        """
+
+        transport = self.klass(
+            rate_limiter=False, retries=Retry.Retry(attempts=3, backoff=1, jitter=False)
+        )
+
+        failed = MagicMock()
+        failed.status_code = 502
+        failed.headers = {}
+
+        ok = MagicMock()
+        ok.status_code = 200
+
+        mock_request.side_effect = [requests.ConnectionError("reset"), failed, ok]
+
+        self.assertEqual(transport.request("GET", "people"), ok)
+        mock_sleep.assert_has_calls([call(1), call(2)])
+
+        mock_request.side_effect = [failed, failed, failed]
+
+        self.assertEqual(transport.request("GET", "people"), failed)
+        self.assertEqual(mock_request.call_count, 6)
+
+        mock_request.side_effect = [failed, ok]
+
+        self.assertEqual(transport.request("POST", "people"), failed)
+
+        mock_request.side_effect = requests.ConnectionError("reset")
+
+        self.assertRaises(requests.ConnectionError, transport.request, "POST", "people")
+        self.assertRaises(requests.ConnectionError, transport.request, "GET", "people")
+
+    def test_sessions(self):
+        """
+        Each thread gets its own session, all sharing the one pooled adapter
+        """
+
+        transport = self.klass()
+        sessions = []
+
+        thread = threading.Thread(target=lambda: sessions.append(transport.session))
+        thread.start()
+        thread.join()
+
+        self.assertIs(transport.session, transport.session)
+        self.assertIsNot(sessions[0], transport.session)
+        self.assertIs(
+            sessions[0].get_adapter("https://api.digitalocean.com/v2/"), transport.adapter
+        )
+        self.assertIs(transport.session.get_adapter("http://localhost/"), transport.adapter)
+        self.assertEqual(set(transport.sessions), {transport.session, sessions[0]})
+
+        # Only the thread holds onto its session, so it goes once the thread has
+
+        del sessions[:]
+
+        self.assertEqual(list(transport.sessions), [transport.session])
+
+        for _ in range(10):
+            thread = threading.Thread(target=lambda: transport.session)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(list(transport.sessions), [transport.session])
+
+    @patch('requests.Session.close')
+    def test_close(self, mock_close):
+        """
+        close closes the sessions
+        """
+
+        transport = self.klass()
+        transport.close()
+        mock_close.assert_called_once_with()
+        self.assertEqual(len(transport.sessions), 0)
+
+        cache = MagicMock()
+        self.klass(cache=cache).close()
+        cache.close.assert_called_once_with()
+
+    @patch('doboto.Transport.Transport.send')
+    def test_request_cache(self, mock_send):
+        """
+        request answers cached GETs without sending them
+        """
+
+        cache = Cache.Cache({"regions": 60})
+        transport = self.klass(rate_limiter=False, cache=cache)
+
+        response = MagicMock()
+        response.status_code = 200
+        mock_send.return_value = response
+
+        self.assertIs(transport.request("GET", "http://do/v2/regions", headers={"a": 1}), response)
+        self.assertIs(transport.request("GET", "http://do/v2/regions", headers={"a": 1}), response)
+        self.assertEqual(mock_send.call_count, 1)
+
+        transport.request("GET", "http://do/v2/droplets", headers={"a": 1})
+        transport.request("GET", "http://do/v2/droplets", headers={"a": 1})
+        self.assertEqual(mock_send.call_count, 3)
+
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+        # Changes drop what they changed
+
+        transport.request("DELETE", "http://do/v2/regions/nyc1", headers={"a": 1})
+        self.assertEqual(cache.stats()["size"], 0)
+
+    @patch('doboto.Transport.Transport.send')
+    def test_request_coalesce(self, mock_send):
+        """
+        request shares one call between identical GETs in flight at the same time
+        """
+
+        transport = self.klass(rate_limiter=False)
+
+        response = MagicMock()
+        response.status_code = 200
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def send(method, url, params=None, data=None, headers=None):
+            started.set()
+            release.wait(5)
+            return response
+
+        mock_send.side_effect = send
+
+        results = []
+
+        def get():
+            results.append(transport.request(
+                "GET", "http://do/v2/regions", params={"a": 1}, headers={"Authorization": "x"}
+            ))
+
+        first = threading.Thread(target=get)
+        first.start()
+        started.wait(5)
+
+        others = [threading.Thread(target=get) for _ in range(4)]
+
+        for thread in others:
+            thread.start()
+
+        while transport.stats()["coalesced"] < 4:
+            release.wait(0.01)
+
+        release.set()
+
+        for thread in [first] + others:
+            thread.join(5)
+
+        self.assertEqual(results, [response] * 5)
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(transport.stats(), {"sent": 1, "coalesced": 4})
+        self.assertEqual(transport.flights, {})
+
+        # Other tokens, changes and failures aren't shared
+
+        self.assertNotEqual(
+            self.klass.flight("GET", "u", None, {"Authorization": "x"}),
+            self.klass.flight("GET", "u", None, {"Authorization": "y"})
+        )
+        self.assertIsNone(self.klass.flight("POST", "u"))
+
+        mock_send.side_effect = requests.ConnectionError("down")
+        transport.retries = Retry.Retry(attempts=1)
+
+        self.assertRaises(requests.ConnectionError, transport.request, "GET", "u")
+        self.assertEqual(transport.flights, {})
+
+        transport = self.klass(rate_limiter=False, coalesce=False)
+        mock_send.side_effect = None
+        mock_send.return_value = response
+
+        transport.request("GET", "u")
+        self.assertEqual(transport.flights, {})
@@ -0,0 +1,131 @@
+"""
+This module contains tests for the Urllib3Transport class
+"""
+
+from unittest import TestCase
+from mock import MagicMock, patch
+import requests
+from urllib3 import exceptions
+from doboto import Urllib3Transport, DO, FakeAPI, FakeServer
+
+
+class TestUrllib3Transport(TestCase):
+    """
+    This class implements unittests for the Urllib3Transport class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "Urllib3Transport"
+        self.klass = getattr(Urllib3Transport, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        Urllib3Transport class is defined
+        """
+
+        self.assertTrue(hasattr(Urllib3Transport, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Urllib3Transport class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_pool(self):
+        """
+        Urllib3Transport sizes its pool and timeouts like Transport
+        """
+
+        transport = self.klass(pool_size=3, connect_timeout=4, read_timeout=5)
+
+        self.assertEqual(transport.pool.connection_pool_kw["maxsize"], 3)
+        self.assertEqual(transport.pool.connection_pool_kw["timeout"].connect_timeout, 4)
+        self.assertEqual(transport.pool.connection_pool_kw["timeout"].read_timeout, 5)
+        self.assertFalse(transport.pool.connection_pool_kw["retries"].total)
+
+    def test_send(self):
+        """
+        send goes through the pool with params in the url and the body encoded
+        """
+
+        transport = self.klass()
+        transport.pool = MagicMock()
+        transport.pool.request.return_value.status = 200
+        transport.pool.request.return_value.headers = {"RateLimit-Remaining": "10"}
+        transport.pool.request.return_value.data = b'{"a": 1}'
+
+        response = transport.send(
+            "GET", "http://abc/people?x=1", params={"per_page": 200}, data="null",
+            headers={"b": "2"}
+        )
+
+        transport.pool.request.assert_called_once_with(
+            "GET", "http://abc/people?x=1&per_page=200", body=b"null", headers={"b": "2"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ratelimit-remaining"], "10")
+        self.assertEqual(response.json(), {"a": 1})
+
+    def test_send_errors(self):
+        """
+        send raises connection failures and timeouts as requests does, for the retry policy
+        """
+
+        transport = self.klass()
+        transport.pool = MagicMock()
+
+        transport.pool.request.side_effect = exceptions.NewConnectionError(None, "refused")
+        self.assertRaises(requests.ConnectionError, transport.send, "GET", "http://abc/people")
+
+        transport.pool.request.side_effect = exceptions.ReadTimeoutError(None, None, "slow")
+        self.assertRaises(requests.Timeout, transport.send, "GET", "http://abc/people")
+
+        transport.pool.request.side_effect = exceptions.ProtocolError("reset")
+        self.assertRaises(requests.ConnectionError, transport.send, "GET", "http://abc/people")
+
+    @patch('requests.Session.close')
+    def test_close(self, mock_close):
+        """
+        close clears the pool
+        """
+
+        transport = self.klass()
+        transport.pool = MagicMock()
+
+        transport.close()
+
+        transport.pool.clear.assert_called_once_with()
+
+    def test_serve(self):
+        """
+        A DO with a Urllib3Transport works against a local API
+        """
+
+        api = FakeAPI.FakeAPI(page_size=2)
+
+        with FakeServer.FakeServer(api) as server:
+
+            do = DO.DO("abc123", server.url, transport=self.klass(workers=4))
+
+            for name in ["a", "b", "c", "d", "e"]:
+                do.tag.create(name)
+
+            self.assertEqual([tag["name"] for tag in do.tag.list()], ["a", "b", "c", "d", "e"])
+            self.assertEqual(do.tag.count(), 5)
+
+            do.tag.destroy("a")
+            self.assertEqual(do.tag.count(), 4)
+
+            do.close()
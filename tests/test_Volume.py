@@ -50,6 +50,21 @@ class TestVolume(TestCase):
 
         self.assertFalse(exc_thrown)
 
+    @patch('doboto.Volume.Volume.total')
+    def test_count(self, mock_total):
+        """
+        count reads the total off of a single page
+        """
+
+        volume = self.klass(*self.instantiate_args)
+        mock_total.return_value = 7
+
+        self.assertEqual(volume.count(), 7)
+        mock_total.assert_called_with(self.test_uri, "volumes", params={})
+
+        self.assertEqual(volume.count(region="nyc1"), 7)
+        mock_total.assert_called_with(self.test_uri, "volumes", params={"region": "nyc1"})
+
     @patch('doboto.Volume.Volume.pages')
     def test_list(self, mock_pages):
         """
@@ -61,13 +76,20 @@ class TestVolume(TestCase):
         # Alone
 
         volume.list()
-        mock_pages.assert_called_with(self.test_uri, "volumes")
+        mock_pages.assert_called_with(self.test_uri, "volumes", stream=False)
 
         # By region
 
         region = "nyc1"
         volume.list(region)
-        mock_pages.assert_called_with(self.test_uri, "volumes", params={"region": region})
+        mock_pages.assert_called_with(self.test_uri, "volumes", params={"region": region}, stream=False)
+
+        # By name and region
+
+        volume.list(region, name="data")
+        mock_pages.assert_called_with(
+            self.test_uri, "volumes", params={"region": region, "name": "data"}, stream=False
+        )
 
     @patch('time.sleep')
     @patch('doboto.Volume.Volume.request')
@@ -153,6 +175,16 @@ class TestVolume(TestCase):
             call({"name": "stuff"}, True, 2, 3),
         ])
 
+        # With a region, only volumes of that name and region are listed
+
+        volume.list = MagicMock(return_value=[{"name": "people", "region": {"slug": "nyc1"}}])
+
+        self.assertEqual(
+            volume.present({"name": "people", "region": "nyc1"}),
+            ({"name": "people", "region": {"slug": "nyc1"}}, None)
+        )
+        volume.list.assert_called_once_with(region="nyc1", name="people", stream=True)
+
     @patch('doboto.Volume.Volume.request')
     def test_info(self, mock_request):
         """
@@ -234,7 +266,7 @@ class TestVolume(TestCase):
         volume.snapshot_list(id)
         test_uri = "{}/{}/snapshots".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "snapshots")
+        mock_pages.assert_called_with(test_uri, "snapshots", stream=False)
 
     @patch('doboto.Volume.Volume.request')
     def test_snapshot_create(self, mock_request):
@@ -391,7 +423,7 @@ class TestVolume(TestCase):
         volume.action_list(id)
         test_uri = "{}/{}/actions".format(self.test_uri, id)
 
-        mock_pages.assert_called_with(test_uri, "actions")
+        mock_pages.assert_called_with(test_uri, "actions", stream=False)
 
     @patch('doboto.Volume.Volume.request')
     def test_action_info(self, mock_request):
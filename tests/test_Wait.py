@@ -0,0 +1,56 @@
+"""
+This module contains tests for the Wait class
+"""
+
+from unittest import TestCase
+from doboto import Wait
+
+
+class TestWait(TestCase):
+    """
+    This class implements unittests for the Wait class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.klass_name = "Wait"
+        self.klass = getattr(Wait, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        Wait class is defined
+        """
+
+        self.assertTrue(hasattr(Wait, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Wait class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass()
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_delay(self):
+        """
+        delay is the interval, at least a second
+        """
+
+        wait = self.klass(3)
+
+        self.assertEqual(wait.delay(0), 3)
+        self.assertEqual(wait.delay(5, "reboot"), 3)
+
+        wait.record("reboot", 10)
+        self.assertEqual(wait.delay(0, "reboot"), 3)
+
+        self.assertEqual(self.klass(0).delay(0), 1)
@@ -0,0 +1,236 @@
+"""
+This module contains tests for the Waiter class
+"""
+
+from unittest import TestCase
+from mock import MagicMock, patch
+from doboto import Waiter, Wait, LearnedWait
+from doboto.exception import DOBOTONotFoundException, DOBOTOPollingException
+
+
+class QuickWait(Wait.Wait):
+    """
+    Checks without sleeping a whole second
+    """
+
+    def delay(self, attempt, kind=None):
+        return 0.01
+
+
+class TestWaiter(TestCase):
+    """
+    This class implements unittests for the Waiter class
+    """
+
+    def setUp(self):
+        """
+        Define resources usable by all unit tests
+        """
+
+        self.do = MagicMock()
+        self.do.droplet.ready = MagicMock(
+            side_effect=lambda droplet, attribs: droplet["status"] != "new"
+        )
+
+        for kind in ["volume", "load_balancer"]:
+            endpoint = getattr(self.do, kind)
+            endpoint.concurrently = MagicMock(
+                side_effect=lambda method, ids: [method(id) for id in ids]
+            )
+
+        self.klass_name = "Waiter"
+        self.klass = getattr(Waiter, self.klass_name)
+
+    def test_class_exists(self):
+        """
+        Waiter class is defined
+        """
+
+        self.assertTrue(hasattr(Waiter, self.klass_name))
+
+    def test_can_instantiate(self):
+        """
+        Waiter class can be instantiated
+        """
+
+        exc_thrown = False
+
+        try:
+            self.klass(self.do)
+        except Exception:
+            exc_thrown = True
+
+        self.assertFalse(exc_thrown)
+
+    def test_default_poll(self):
+        """
+        Waiter learns by default
+        """
+
+        self.assertIsInstance(self.klass(self.do).poll, LearnedWait.LearnedWait)
+
+    def test_submit_finished(self):
+        """
+        submit resolves what's already done without a thread
+        """
+
+        waiter = self.klass(self.do)
+
+        future = waiter.action({"id": 1, "status": "completed"})
+        self.assertEqual(future.result(0), {"id": 1, "status": "completed"})
+
+        future = waiter.droplet({"id": 2, "status": "active"})
+        self.assertEqual(future.result(0), {"id": 2, "status": "active"})
+
+        future = waiter.load_balancer({"id": "a", "ip": "1.2.3.4"})
+        self.assertEqual(future.result(0), {"id": "a", "ip": "1.2.3.4"})
+
+        self.assertIsNone(waiter.thread)
+
+    @patch('threading.Thread')
+    @patch('time.time')
+    def test_check(self, mock_time, mock_thread):
+        """
+        check batches by kind, resolves what's done and requeues the rest
+        """
+
+        mock_time.return_value = 100
+
+        waiter = self.klass(self.do, poll=5)
+
+        self.do.action.info_list = MagicMock(return_value=[
+            {"id": 1, "type": "reboot", "status": "completed"},
+            {"id": 2, "type": "reboot", "status": "in-progress"}
+        ])
+        self.do.droplet.info_list = MagicMock(side_effect=[[Exception("Not yet")]])
+        self.do.volume.info = MagicMock(side_effect=[DOBOTONotFoundException()])
+
+        first = waiter.action({"id": 1, "type": "reboot", "status": "in-progress"})
+        second = waiter.action({"id": 2, "type": "reboot", "status": "in-progress"})
+        droplet = waiter.droplet({"id": 3, "status": "new"}, timeout=8)
+        volume = waiter.volume({"id": "v"})
+
+        mock_thread.return_value.start.assert_called_once_with()
+        self.assertEqual(len(waiter.pending), 4)
+        self.assertEqual(waiter.due(104), [])
+
+        mock_time.return_value = 105
+        waiter.check(waiter.due(105))
+
+        self.do.action.info_list.assert_called_once_with([1, 2])
+        self.do.droplet.info_list.assert_called_once_with([3])
+        self.do.volume.info.assert_called_once_with("v")
+
+        self.assertEqual(first.result(0), {"id": 1, "type": "reboot", "status": "completed"})
+        self.assertFalse(second.done())
+        self.assertFalse(droplet.done())
+        self.assertFalse(volume.done())
+        self.assertEqual(len(waiter.pending), 3)
+        self.assertEqual([entry["due"] for entry in waiter.pending], [110, 110, 110])
+
+        # Timeout and found
+
+        self.do.action.info_list = MagicMock(return_value=[
+            {"id": 2, "type": "reboot", "status": "errored"}
+        ])
+        self.do.droplet.info_list = MagicMock(side_effect=[[{"id": 3, "status": "new"}]])
+        self.do.volume.info = MagicMock(side_effect=[{"id": "v", "name": "data"}])
+
+        mock_time.return_value = 110
+        waiter.check(waiter.due(110))
+
+        self.assertEqual(second.result(0), {"id": 2, "type": "reboot", "status": "errored"})
+        self.assertRaisesRegex(
+            DOBOTOPollingException, "DO API Timeout while polling:.*new", droplet.result, 0
+        )
+        self.assertEqual(volume.result(0), {"id": "v", "name": "data"})
+        self.assertEqual(waiter.pending, [])
+
+    @patch('threading.Thread')
+    @patch('time.time')
+    def test_check_learns(self, mock_time, mock_thread):
+        """
+        check records how long things took with the Wait
+        """
+
+        mock_time.return_value = 100
+
+        wait = Wait.Wait()
+        wait.delay = MagicMock(return_value=5)
+        wait.record = MagicMock()
+        waiter = self.klass(self.do, poll=wait)
+
+        self.do.action.info_list = MagicMock(return_value=[{
+            "id": 1, "type": "snapshot", "status": "completed",
+            "started_at": "2014-11-14T16:29:21Z", "completed_at": "2014-11-14T16:30:21Z"
+        }])
+        self.do.load_balancer.info = MagicMock(side_effect=[{"id": "a", "ip": "1.2.3.4"}])
+
+        waiter.action({"id": 1, "type": "snapshot", "status": "in-progress"})
+        waiter.load_balancer({"id": "a", "ip": ""})
+
+        wait.delay.assert_any_call(0, "snapshot")
+        wait.delay.assert_any_call(0, "create_load_balancer")
+
+        mock_time.return_value = 107
+        waiter.check(waiter.due(107))
+
+        wait.record.assert_any_call("snapshot", 60)
+        wait.record.assert_any_call("create_load_balancer", 7)
+
+    @patch('threading.Thread')
+    def test_check_cancelled(self, mock_thread):
+        """
+        due drops what's been cancelled and a failed fetch waits again
+        """
+
+        waiter = self.klass(self.do, poll=5)
+
+        self.do.action.info_list = MagicMock(side_effect=Exception("down"))
+
+        cancelled = waiter.action({"id": 1, "status": "in-progress"})
+        kept = waiter.action({"id": 2, "status": "in-progress"})
+
+        cancelled.cancel()
+
+        due = waiter.due(waiter.pending[-1]["due"])
+        self.assertEqual(len(due), 1)
+
+        waiter.check(due)
+
+        self.do.action.info_list.assert_called_once_with([2])
+        self.assertFalse(kept.done())
+        self.assertEqual(waiter.pending[0]["error"].args, ("down",))
+
+    def test_run(self):
+        """
+        run checks in the background until closed
+        """
+
+        waiter = self.klass(self.do, poll=QuickWait())
+
+        checks = {1: 0, 2: 0}
+
+        def info_list(ids):
+            for id in ids:
+                checks[id] += 1
+            return [
+                {"id": id, "status": "completed" if checks[id] >= id else "in-progress"}
+                for id in ids
+            ]
+
+        self.do.action.info_list = MagicMock(side_effect=info_list)
+
+        first = waiter.action({"id": 1, "status": "in-progress"})
+        second = waiter.action({"id": 2, "status": "in-progress"})
+
+        self.assertEqual(first.result(5), {"id": 1, "status": "completed"})
+        self.assertEqual(second.result(5), {"id": 2, "status": "completed"})
+        self.assertEqual(checks, {1: 1, 2: 2})
+
+        pending = waiter.action({"id": 3, "status": "in-progress"}, poll=60)
+
+        waiter.close()
+
+        self.assertIsNone(waiter.thread)
+        self.assertTrue(pending.cancelled())